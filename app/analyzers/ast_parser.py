@@ -2,11 +2,36 @@
 
 import ast
 import sys
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Union
+from array import array
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+class SourceBuffer:
+    """Source text of a parsed file shared by every node extracted from it."""
+
+    __slots__ = ("text", "line_offsets")
+
+    def __init__(self, source_code: str):
+        if "\r" in source_code:
+            # Match the parser's notion of line breaks so offsets line up
+            source_code = source_code.replace("\r\n", "\n").replace("\r", "\n")
+        self.text = source_code
+        # Offset of the first character of every line, plus one past the end,
+        # so any line range maps to a single slice of the source
+        self.line_offsets = array(
+            "l",
+            accumulate((len(line) + 1 for line in source_code.split("\n")), initial=0),
+        )
+
+    def segment(self, start_line: int, end_line: int) -> str:
+        """Get the full source lines from start_line to end_line (1-based)."""
+        offsets = self.line_offsets
+        return self.text[offsets[start_line - 1] : offsets[end_line] - 1]
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportInfo:
     """Information about an import statement."""
 
@@ -16,7 +41,7 @@ class ImportInfo:
     line_number: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FixtureInfo:
     """Information about a pytest fixture."""
 
@@ -26,7 +51,7 @@ class FixtureInfo:
     params: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssertionInfo:
     """Information about an assertion statement."""
 
@@ -36,34 +61,44 @@ class AssertionInfo:
     operands: List[str]  # Variable names involved
     is_trivial: bool = False  # e.g., assert True
     source_code: str = ""  # Original source code
+    end_line_number: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TestFunctionInfo:
     """Information about a single test function."""
 
     name: str
     line_number: int
-    decorators: List[str]
+    decorators: List[str]  # Dotted names, e.g. "pytest.mark.parametrize"
     parameters: List[str]  # Function parameters (fixtures)
     assertions: List[AssertionInfo]
     has_docstring: bool
     body_lines: Tuple[int, int]  # Start and end line numbers
     source_code: str = ""  # Original source code
     class_name: Optional[str] = None  # Parent class name if in test class
-
-
-@dataclass
+    end_line_number: int = 0
+    # Called names (bare function or final attribute), e.g. "get" for requests.get
+    call_names: List[str] = field(default_factory=list)
+    # String arguments of the decorators, e.g. "fake_db" for usefixtures("fake_db")
+    decorator_args: List[str] = field(default_factory=list)
+    # Names collected from ``source_code`` once and shared by the rules
+    _body_scan: Optional[Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+
+@dataclass(slots=True)
 class TestClassInfo:
     """Information about a test class."""
 
     name: str
     line_number: int
     methods: List[TestFunctionInfo]
-    decorators: List[str]
+    decorators: List[str]  # Dotted names, e.g. "pytest.mark.asyncio"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedTestFile:
     """Structured representation of a parsed test file."""
 
@@ -74,15 +109,106 @@ class ParsedTestFile:
     test_classes: List[TestClassInfo]
     has_syntax_errors: bool = False
     syntax_error_message: Optional[str] = None
-
-
-class TestFileVisitor(ast.NodeVisitor):
-    """AST visitor for extracting test-related information."""
+    source: Optional[SourceBuffer] = field(default=None, repr=False, compare=False)
+    # File-level values derived by the rule engine, shared across its rules
+    _rule_cache: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def assertion_table(self) -> Dict[str, array]:
+        """
+        Get every assertion in the file as parallel typed columns.
+
+        Compact numeric columns let callers compute statistics (counts per
+        type, line spans) without touching one Python object per assertion.
+        The table is built on demand, so parsing itself pays nothing for it.
+
+        Returns:
+            Dictionary of equally long ``array.array`` columns: ``line``,
+            ``column``, ``type_id`` (index into ``ASSERTION_TYPES``),
+            ``is_trivial`` (0/1) and ``function_index`` (position among the
+            module-level test functions followed by test class methods)
+        """
+        table = {
+            "line": array("l"),
+            "column": array("l"),
+            "type_id": array("B"),
+            "is_trivial": array("B"),
+            "function_index": array("l"),
+        }
+        functions = self.test_functions + [
+            method for test_class in self.test_classes for method in test_class.methods
+        ]
+        for function_index, test_func in enumerate(functions):
+            for assertion in test_func.assertions:
+                table["line"].append(assertion.line_number)
+                table["column"].append(assertion.column)
+                table["type_id"].append(
+                    _ASSERTION_TYPE_IDS.get(assertion.assertion_type, _OTHER_TYPE_ID)
+                )
+                table["is_trivial"].append(assertion.is_trivial)
+                table["function_index"].append(function_index)
+        return table
+
+
+# Assertion type for single-operator comparisons, keyed by the operator's type
+_COMPARE_OP_TYPES: Dict[type, str] = {
+    ast.Eq: "equality",
+    ast.NotEq: "inequality",
+    ast.In: "membership",
+    ast.NotIn: "non-membership",
+    ast.Is: "identity",
+    ast.IsNot: "non-identity",
+    ast.Lt: "less-than",
+    ast.LtE: "less-than-equal",
+    ast.Gt: "greater-than",
+    ast.GtE: "greater-than-equal",
+}
+
+# Every assertion_type the parser produces; positions are the type ids used
+# by ParsedTestFile.assertion_table
+ASSERTION_TYPES: Tuple[str, ...] = (
+    *_COMPARE_OP_TYPES.values(),
+    "type-check",
+    "trivial-true",
+    "other",
+)
+_ASSERTION_TYPE_IDS = {name: index for index, name in enumerate(ASSERTION_TYPES)}
+_OTHER_TYPE_ID = _ASSERTION_TYPE_IDS["other"]
+
+# Name prefixes pytest uses to collect tests; compared by slicing, which is
+# cheaper than a str.startswith method call on every function and class
+_TEST_FUNCTION_PREFIX = "test_"
+_TEST_FUNCTION_PREFIX_LEN = len(_TEST_FUNCTION_PREFIX)
+_TEST_CLASS_PREFIX = "Test"
+_TEST_CLASS_PREFIX_LEN = len(_TEST_CLASS_PREFIX)
+
+# Every test function, fixture or pytest.mark-ed function needs one of these in
+# the source, so files without any of them can skip parsing entirely
+_TEST_SOURCE_MARKERS = (_TEST_FUNCTION_PREFIX, "pytest")
+
+# Decorator kinds recognized by TestFileVisitor._classify_decorator
+_DECORATOR_OTHER = 0
+_DECORATOR_FIXTURE = 1
+_DECORATOR_MARK = 2
+
+# Visitor scope: enclosing test class and the test function owning assertions
+_Scope = Tuple[Optional[TestClassInfo], Optional[TestFunctionInfo]]
+
+
+class TestFileVisitor:
+    """AST visitor for extracting test-related information.
+
+    The tree is walked with an explicit stack instead of ``ast.NodeVisitor``
+    so that dispatch is a single dict lookup per node. Expression subtrees,
+    which can never contain statements we care about, are only scanned for
+    call names inside test functions, and the bodies of helper functions
+    outside of test functions are skipped entirely.
+    """
 
     def __init__(self, source_code: str, file_path: str):
-        self.source_code = source_code
+        self.source = SourceBuffer(source_code)
         self.file_path = file_path
-        self.lines = source_code.splitlines()
 
         # Results
         self.imports: List[ImportInfo] = []
@@ -90,11 +216,62 @@ class TestFileVisitor(ast.NodeVisitor):
         self.test_functions: List[TestFunctionInfo] = []
         self.test_classes: List[TestClassInfo] = []
 
-        # Current context
-        self.current_class: Optional[TestClassInfo] = None
-
-    def visit_Import(self, node: ast.Import) -> None:
-        """Visit import statements."""
+        self._decorator_kinds: Dict[int, int] = {}
+        self._dispatch: Dict[type, Callable[[Any, _Scope], Optional[_Scope]]] = {
+            ast.Import: self._handle_import,
+            ast.ImportFrom: self._handle_import_from,
+            ast.FunctionDef: self._handle_function,
+            ast.AsyncFunctionDef: self._handle_function,
+            ast.ClassDef: self._handle_class,
+            ast.Assert: self._handle_assert,
+        }
+
+    def visit(self, tree: ast.AST) -> None:
+        """Walk the tree iteratively and collect test-related information."""
+        dispatch = self._dispatch
+        iter_child_nodes = ast.iter_child_nodes
+        expr_type = ast.expr
+        # Each frame carries its enclosing scope so the class context is
+        # unwound by the stack itself rather than by name matching.
+        stack: List[Tuple[ast.AST, _Scope]] = [(tree, (None, None))]
+
+        while stack:
+            node, scope = stack.pop()
+            handler = dispatch.get(type(node))
+            if handler is not None:
+                child_scope = handler(node, scope)
+                if child_scope is None:
+                    continue
+                if child_scope[1] is not None and child_scope[1] is not scope[1]:
+                    # A new test function: only its body is scanned, not its
+                    # decorators, argument defaults or annotations
+                    children = [(child, child_scope) for child in node.body]
+                    children.reverse()
+                    stack.extend(children)
+                    continue
+                scope = child_scope
+
+            owner = scope[1]
+            if owner is None:
+                children = [
+                    (child, scope)
+                    for child in iter_child_nodes(node)
+                    if not isinstance(child, expr_type)
+                ]
+            else:
+                children = []
+                for child in iter_child_nodes(node):
+                    if isinstance(child, expr_type):
+                        self._collect_call_names(child, owner.call_names)
+                    else:
+                        children.append((child, scope))
+
+            # Push in reverse so children are processed in source order
+            children.reverse()
+            stack.extend(children)
+
+    def _handle_import(self, node: ast.Import, scope: _Scope) -> Optional[_Scope]:
+        """Record import statements."""
         for alias in node.names:
             self.imports.append(
                 ImportInfo(
@@ -104,10 +281,12 @@ class TestFileVisitor(ast.NodeVisitor):
                     line_number=node.lineno,
                 )
             )
-        self.generic_visit(node)
+        return None
 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        """Visit from-import statements."""
+    def _handle_import_from(
+        self, node: ast.ImportFrom, scope: _Scope
+    ) -> Optional[_Scope]:
+        """Record from-import statements."""
         module = node.module or ""
         for alias in node.names:
             self.imports.append(
@@ -118,68 +297,83 @@ class TestFileVisitor(ast.NodeVisitor):
                     line_number=node.lineno,
                 )
             )
-        self.generic_visit(node)
-
-    def visit_FunctionDef(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
-    ) -> None:
-        """Visit function definitions."""
-        # Check if it's a test function
-        is_test_function = self._is_test_function(node)
-        is_fixture = self._is_fixture(node)
-
-        if is_fixture:
+        return None
+
+    def _handle_function(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], scope: _Scope
+    ) -> Optional[_Scope]:
+        """Classify a function definition as fixture, test, or neither."""
+        current_class, owner = scope
+        if self._is_fixture(node):
             self._process_fixture(node)
-        elif is_test_function:
-            self._process_test_function(node)
-
-        self.generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Visit async function definitions."""
-        self.visit_FunctionDef(node)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit class definitions."""
-        # Check if it's a test class
+            return current_class, None
+        elif self._is_test_function(node):
+            return current_class, self._process_test_function(node, current_class)
+        elif owner is None:
+            # Helper bodies cannot hold tests or assertions we report on
+            return None
+        return scope
+
+    def _handle_class(self, node: ast.ClassDef, scope: _Scope) -> Optional[_Scope]:
+        """Open a new test class context for the class body if applicable."""
         if self._is_test_class(node):
-            self._process_test_class(node)
-
-        self.generic_visit(node)
-
-        # Reset current class context
-        if self.current_class and self.current_class.name == node.name:
-            self.current_class = None
-
-    def visit_Assert(self, node: ast.Assert) -> None:
-        """Visit assertion statements."""
-        # This is called during generic_visit, so we need to check context
-        if self.current_class and self.current_class.methods:
-            # We're in a test class method
-            current_method = self.current_class.methods[-1]
-            assertion_info = self._extract_assertion_info(node)
-            if assertion_info:
-                current_method.assertions.append(assertion_info)
-        elif self.test_functions and not self.current_class:
-            # We're in a module-level test function
-            current_function = self.test_functions[-1]
-            assertion_info = self._extract_assertion_info(node)
-            if assertion_info:
-                current_function.assertions.append(assertion_info)
-
-        self.generic_visit(node)
+            return self._process_test_class(node), scope[1]
+        return scope
+
+    def _handle_assert(self, node: ast.Assert, scope: _Scope) -> Optional[_Scope]:
+        """Attach an assertion to the test function that owns it, if any."""
+        owner = scope[1]
+        if owner is not None:
+            owner.assertions.append(self._extract_assertion_info(node))
+            self._collect_call_names(node.test, owner.call_names)
+            if node.msg is not None:
+                self._collect_call_names(node.msg, owner.call_names)
+        return None
+
+    def _collect_call_names(self, expr: ast.expr, call_names: List[str]) -> None:
+        """Append the names of all functions called within an expression.
+
+        Calls are reported in source order. Fields are read directly instead
+        of via ``ast.walk``, and name/constant leaves are not expanded, since
+        this runs over every expression in every test body.
+        """
+        ast_type = ast.AST
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is ast.Name or node_type is ast.Constant:
+                continue
+            if node_type is ast.Call:
+                func_type = type(node.func)
+                if func_type is ast.Name:
+                    call_names.append(node.func.id)
+                elif func_type is ast.Attribute:
+                    call_names.append(node.func.attr)
+
+            children = []
+            for field_name in node._fields:
+                value = getattr(node, field_name, None)
+                if isinstance(value, ast_type):
+                    children.append(value)
+                elif type(value) is list:
+                    for item in value:
+                        if isinstance(item, ast_type):
+                            children.append(item)
+            children.reverse()
+            stack.extend(children)
 
     def _is_test_function(
         self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
     ) -> bool:
         """Check if function is a test function."""
-        # Check function name
-        if node.name.startswith("test_"):
+        # Check function name first; decorators only matter for the rest
+        if node.name[:_TEST_FUNCTION_PREFIX_LEN] == _TEST_FUNCTION_PREFIX:
             return True
 
         # Check for pytest.mark decorators
         for decorator in node.decorator_list:
-            if self._is_pytest_mark_decorator(decorator):
+            if self._classify_decorator(decorator) == _DECORATOR_MARK:
                 return True
 
         return False
@@ -187,54 +381,45 @@ class TestFileVisitor(ast.NodeVisitor):
     def _is_fixture(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool:
         """Check if function is a pytest fixture."""
         for decorator in node.decorator_list:
-            if self._is_pytest_fixture_decorator(decorator):
+            if self._classify_decorator(decorator) == _DECORATOR_FIXTURE:
                 return True
         return False
 
-    def _is_pytest_fixture_decorator(self, decorator: ast.expr) -> bool:
-        """Check if decorator is a pytest.fixture decorator."""
-        if isinstance(decorator, ast.Call):
-            if (
-                isinstance(decorator.func, ast.Attribute)
-                and decorator.func.attr == "fixture"
-                and isinstance(decorator.func.value, ast.Name)
-                and decorator.func.value.id == "pytest"
-            ):
-                return True
-        elif isinstance(decorator, ast.Attribute):
-            if (
-                decorator.attr == "fixture"
-                and isinstance(decorator.value, ast.Name)
-                and decorator.value.id == "pytest"
-            ):
-                return True
-        return False
+    def _classify_decorator(self, decorator: ast.expr) -> int:
+        """Classify a decorator as pytest fixture, pytest mark, or other.
 
-    def _is_pytest_mark_decorator(self, decorator: ast.expr) -> bool:
-        """Check if decorator is a pytest.mark decorator."""
-        if isinstance(decorator, ast.Call):
+        Each decorator is looked at several times while a function is
+        classified and processed, so the result is cached by node identity.
+        """
+        kind = self._decorator_kinds.get(id(decorator))
+        if kind is not None:
+            return kind
+
+        kind = _DECORATOR_OTHER
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if isinstance(target, ast.Attribute):
+            base = target.value
             if (
-                isinstance(decorator.func, ast.Attribute)
-                and isinstance(decorator.func.value, ast.Attribute)
-                and decorator.func.value.attr == "mark"
-                and isinstance(decorator.func.value.value, ast.Name)
-                and decorator.func.value.value.id == "pytest"
+                target.attr == "fixture"
+                and isinstance(base, ast.Name)
+                and base.id == "pytest"
             ):
-                return True
-        elif isinstance(decorator, ast.Attribute):
-            if (
-                isinstance(decorator.value, ast.Attribute)
-                and decorator.value.attr == "mark"
-                and isinstance(decorator.value.value, ast.Name)
-                and decorator.value.value.id == "pytest"
+                kind = _DECORATOR_FIXTURE
+            elif (
+                isinstance(base, ast.Attribute)
+                and base.attr == "mark"
+                and isinstance(base.value, ast.Name)
+                and base.value.id == "pytest"
             ):
-                return True
-        return False
+                kind = _DECORATOR_MARK
+
+        self._decorator_kinds[id(decorator)] = kind
+        return kind
 
     def _is_test_class(self, node: ast.ClassDef) -> bool:
         """Check if class is a test class."""
         # Check class name
-        if node.name.startswith("Test"):
+        if node.name[:_TEST_CLASS_PREFIX_LEN] == _TEST_CLASS_PREFIX:
             return True
 
         # Check for pytest markers or inheritance
@@ -252,14 +437,12 @@ class TestFileVisitor(ast.NodeVisitor):
         scope = None
         for decorator in node.decorator_list:
             if isinstance(decorator, ast.Call):
-                if self._is_pytest_fixture_decorator(decorator):
+                if self._classify_decorator(decorator) == _DECORATOR_FIXTURE:
                     # Check for scope parameter
                     for keyword in decorator.keywords:
                         if keyword.arg == "scope":
                             if isinstance(keyword.value, ast.Constant):
                                 scope = keyword.value.value
-                            elif isinstance(keyword.value, ast.Str):  # Python < 3.8
-                                scope = keyword.value.s
                             break
                     break
 
@@ -270,13 +453,16 @@ class TestFileVisitor(ast.NodeVisitor):
         )
 
     def _process_test_function(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
-    ) -> None:
+        self,
+        node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        current_class: Optional[TestClassInfo],
+    ) -> TestFunctionInfo:
         """Process a test function."""
         # Extract decorators
-        decorators = []
-        for decorator in node.decorator_list:
-            decorators.append(ast.dump(decorator))
+        decorators = [self._summarize_decorator(d) for d in node.decorator_list]
+        decorator_args = [
+            arg for d in node.decorator_list for arg in self._decorator_strings(d)
+        ]
 
         # Extract parameters
         params = [arg.arg for arg in node.args.args if arg.arg != "self"]
@@ -293,33 +479,30 @@ class TestFileVisitor(ast.NodeVisitor):
         body_start = node.body[0].lineno if node.body else node.lineno
         body_end = node.body[-1].end_lineno if node.body else node.lineno
 
-        # Get source code
-        source_lines = self.lines[node.lineno - 1 : node.end_lineno]
-        source_code = "\n".join(source_lines)
-
         test_function = TestFunctionInfo(
             name=node.name,
             line_number=node.lineno,
             decorators=decorators,
             parameters=params,
-            assertions=[],  # Will be populated by visit_Assert
+            assertions=[],  # Populated by _handle_assert while walking the body
             has_docstring=has_docstring,
             body_lines=(body_start, body_end),
-            source_code=source_code,
-            class_name=self.current_class.name if self.current_class else None,
+            class_name=current_class.name if current_class else None,
+            end_line_number=node.end_lineno,
+            decorator_args=decorator_args,
+            source_code=self.source.segment(node.lineno, node.end_lineno),
         )
 
-        if self.current_class:
-            self.current_class.methods.append(test_function)
+        if current_class:
+            current_class.methods.append(test_function)
         else:
             self.test_functions.append(test_function)
+        return test_function
 
-    def _process_test_class(self, node: ast.ClassDef) -> None:
+    def _process_test_class(self, node: ast.ClassDef) -> TestClassInfo:
         """Process a test class."""
         # Extract decorators
-        decorators = []
-        for decorator in node.decorator_list:
-            decorators.append(ast.dump(decorator))
+        decorators = [self._summarize_decorator(d) for d in node.decorator_list]
 
         test_class = TestClassInfo(
             name=node.name,
@@ -328,23 +511,49 @@ class TestFileVisitor(ast.NodeVisitor):
             decorators=decorators,
         )
 
-        self.current_class = test_class
         self.test_classes.append(test_class)
+        return test_class
 
-    def _extract_assertion_info(self, node: ast.Assert) -> Optional[AssertionInfo]:
+    def _summarize_decorator(self, decorator: ast.expr) -> str:
+        """Get the dotted name of a decorator without walking its arguments."""
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+        if isinstance(decorator, ast.Name):
+            return decorator.id
+        if isinstance(decorator, ast.Attribute):
+            return self._get_attribute_name(decorator)
+        return type(decorator).__name__
+
+    def _decorator_strings(self, decorator: ast.expr) -> List[str]:
+        """Get the string constants passed as arguments to a decorator."""
+        if not isinstance(decorator, ast.Call):
+            return []
+        arguments = [*decorator.args, *(kw.value for kw in decorator.keywords)]
+        return [
+            node.value
+            for argument in arguments
+            for node in ast.walk(argument)
+            if type(node) is ast.Constant and type(node.value) is str
+        ]
+
+    def _extract_assertion_info(self, node: ast.Assert) -> AssertionInfo:
         """Extract information from an assertion statement."""
-        # Get source code for the assertion
-        assertion_lines = self.lines[node.lineno - 1 : node.end_lineno]
-        source_code = "\n".join(assertion_lines)
-
-        # Determine assertion type
-        assertion_type = self._get_assertion_type(node.test)
+        test_node = node.test
+        if type(test_node) is ast.Constant:
+            # Fast path for `assert True` and friends: no operands to walk and
+            # triviality is decided by the constant alone
+            is_trivial = test_node.value is True
+            assertion_type = "trivial-true" if is_trivial else "other"
+            operands: List[str] = []
+        else:
+            # Determine assertion type
+            assertion_type = self._get_assertion_type(test_node)
 
-        # Extract operands
-        operands = self._extract_operands(node.test)
+            # Extract operands
+            operands = self._extract_operands(test_node)
 
-        # Check if assertion is trivial
-        is_trivial = self._is_trivial_assertion(node.test)
+            # Check if assertion is trivial
+            is_trivial = self._is_trivial_assertion(test_node)
 
         return AssertionInfo(
             line_number=node.lineno,
@@ -352,41 +561,20 @@ class TestFileVisitor(ast.NodeVisitor):
             assertion_type=assertion_type,
             operands=operands,
             is_trivial=is_trivial,
-            source_code=source_code,
+            end_line_number=node.end_lineno,
+            source_code=self.source.segment(node.lineno, node.end_lineno),
         )
 
     def _get_assertion_type(self, test_node: ast.expr) -> str:
         """Determine the type of assertion."""
-        if isinstance(test_node, ast.Compare):
+        node_type = type(test_node)
+        if node_type is ast.Compare:
             if len(test_node.ops) == 1:
-                op = test_node.ops[0]
-                if isinstance(op, ast.Eq):
-                    return "equality"
-                elif isinstance(op, ast.NotEq):
-                    return "inequality"
-                elif isinstance(op, ast.In):
-                    return "membership"
-                elif isinstance(op, ast.NotIn):
-                    return "non-membership"
-                elif isinstance(op, ast.Is):
-                    return "identity"
-                elif isinstance(op, ast.IsNot):
-                    return "non-identity"
-                elif isinstance(op, ast.Lt):
-                    return "less-than"
-                elif isinstance(op, ast.LtE):
-                    return "less-than-equal"
-                elif isinstance(op, ast.Gt):
-                    return "greater-than"
-                elif isinstance(op, ast.GtE):
-                    return "greater-than-equal"
-        elif isinstance(test_node, ast.Call):
-            if (
-                isinstance(test_node.func, ast.Name)
-                and test_node.func.id == "isinstance"
-            ):
+                return _COMPARE_OP_TYPES.get(type(test_node.ops[0]), "other")
+        elif node_type is ast.Call:
+            if type(test_node.func) is ast.Name and test_node.func.id == "isinstance":
                 return "type-check"
-        elif isinstance(test_node, ast.Constant) and test_node.value is True:
+        elif node_type is ast.Constant and test_node.value is True:
             return "trivial-true"
 
         return "other"
@@ -418,11 +606,17 @@ class TestFileVisitor(ast.NodeVisitor):
 
     def _get_attribute_name(self, node: ast.Attribute) -> str:
         """Get full attribute name (e.g., 'obj.attr')."""
-        if isinstance(node.value, ast.Name):
-            return f"{node.value.id}.{node.attr}"
-        elif isinstance(node.value, ast.Attribute):
-            return f"{self._get_attribute_name(node.value)}.{node.attr}"
-        return node.attr
+        parts = [node.attr]
+        current = node.value
+        while isinstance(current, ast.Attribute):
+            parts.append(current.attr)
+            current = current.value
+        if isinstance(current, ast.Name):
+            parts.append(current.id)
+        # Identifiers from the parser are already interned, but joined names
+        # are fresh strings; the same few (e.g. "result.status_code") repeat
+        # across most assertions and decorators of a file
+        return sys.intern(".".join(reversed(parts)))
 
     def _is_trivial_assertion(self, test_node: ast.expr) -> bool:
         """Check if assertion is trivial (always true)."""
@@ -460,9 +654,23 @@ def parse_test_file(file_path: str, source_code: str) -> ParsedTestFile:
     Raises:
         SyntaxError: If the source code has syntax errors
     """
+    if not any(marker in source_code for marker in _TEST_SOURCE_MARKERS):
+        # Nothing the visitor could report on (conftest helpers, utilities),
+        # so skip the parser; a plain substring scan is far cheaper
+        return ParsedTestFile(
+            file_path=file_path,
+            imports=[],
+            fixtures=[],
+            test_functions=[],
+            test_classes=[],
+        )
+
     try:
-        # Parse the AST
-        tree = ast.parse(source_code, filename=file_path)
+        # Parse the AST; calling compile directly skips ast.parse's wrapper
+        # and keeps future-import flags of this module from leaking in
+        tree = compile(
+            source_code, file_path, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True
+        )
 
         # Create visitor and extract information
         visitor = TestFileVisitor(source_code, file_path)
@@ -475,6 +683,7 @@ def parse_test_file(file_path: str, source_code: str) -> ParsedTestFile:
             test_functions=visitor.test_functions,
             test_classes=visitor.test_classes,
             has_syntax_errors=False,
+            source=visitor.source,
         )
 
     except SyntaxError as e:
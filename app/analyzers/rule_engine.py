@@ -1,8 +1,16 @@
 """Rule engine for detecting test quality issues."""
 
 import ast
-from abc import ABC, abstractmethod
-from typing import List, Set
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from abc import ABC
+from functools import partial
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
 
 from app.analyzers.ast_parser import AssertionInfo, ParsedTestFile, TestFunctionInfo
 from app.api.v1.schemas import Issue, IssueSuggestion
@@ -22,19 +30,195 @@ from app.core.constants import (
     Severity,
 )
 
+logger = logging.getLogger(__name__)
+
+# Case-insensitive alternations of the indicator lists, so each target is
+# scanned once instead of once per pattern
+_MOCK_INDICATOR_RE = re.compile(
+    "|".join(map(re.escape, MOCK_INDICATOR_PATTERNS)), re.IGNORECASE
+)
+_EXTERNAL_DEPENDENCY_RE = re.compile(
+    "|".join(map(re.escape, EXTERNAL_DEPENDENCY_PATTERNS)), re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class _FuncBodyVisitor(ast.NodeVisitor):
+    """Collect assignments and name loads in a single traversal."""
+
+    def __init__(self):
+        self.is_function = False
+        self.assigned: Dict[str, int] = {}  # Name -> line of first assignment
+        self.referenced: Set[str] = set()
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self.is_function = bool(node.body) and isinstance(
+            node.body[0], (ast.FunctionDef, ast.AsyncFunctionDef)
+        )
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id != "_":
+                self.assigned.setdefault(target.id, node.lineno)
+            elif isinstance(target, ast.Tuple):
+                for elt in target.elts:
+                    if isinstance(elt, ast.Name) and elt.id != "_":
+                        self.assigned.setdefault(elt.id, node.lineno)
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Load):
+            self.referenced.add(node.id)
+
+
+def _scan_function_body(test_func: TestFunctionInfo) -> _FuncBodyVisitor:
+    """Parse and scan a test function's source once and reuse it across rules.
+
+    Source that fails to parse (e.g. indented class methods) yields an empty
+    scan, so callers see no names instead of a ``SyntaxError``.
+    """
+    scan = test_func._body_scan
+    if scan is None:
+        scan = _FuncBodyVisitor()
+        try:
+            scan.visit(
+                compile(
+                    test_func.source_code,
+                    "<test>",
+                    "exec",
+                    flags=_FUNCTION_COMPILE_FLAGS,
+                    dont_inherit=True,
+                )
+            )
+        except SyntaxError:
+            pass
+        test_func._body_scan = scan
+    return scan
+
+
+# AST-only compile of a function's source; top-level await is accepted so
+# snippets from async tests do not fail as syntax errors
+_FUNCTION_COMPILE_FLAGS = ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT
+
+# Bump when _FuncBodyVisitor collects different data, so stale entries miss
+_FEATURE_CACHE_VERSION = 3
+
+
+class _FeatureCache:
+    """On-disk store of function body scans keyed by a hash of the source.
+
+    Only the extracted names are stored, as JSON (one small file per distinct
+    body), not the AST, so entries survive interpreter upgrades and loading
+    one never executes code. Files are written via rename, so concurrent
+    workers never read a partial entry.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = Path(directory)
+
+    def _path(self, source_code: str) -> Path:
+        digest = hashlib.blake2b(
+            f"{_FEATURE_CACHE_VERSION}\0{source_code}".encode(), digest_size=20
+        ).hexdigest()
+        return self._directory / digest[:2] / f"{digest}.json"
+
+    def load(self, test_func: TestFunctionInfo) -> bool:
+        """Fill ``test_func``'s body scan from disk; return whether it was found.
+
+        Unreadable or malformed entries are treated as misses.
+        """
+        try:
+            with open(self._path(test_func.source_code), "rb") as f:
+                entry = json.load(f)
+            is_function = entry["is_function"]
+            assigned = entry["assigned"]
+            referenced = set(entry["referenced"])
+            if not (
+                type(is_function) is bool
+                and type(assigned) is dict
+                and all(type(line) is int for line in assigned.values())
+                and all(type(name) is str for name in referenced)
+            ):
+                return False
+        except Exception:
+            return False
+
+        scan = _FuncBodyVisitor()
+        scan.is_function = is_function
+        scan.assigned = assigned
+        scan.referenced = referenced
+        test_func._body_scan = scan
+        return True
+
+    def store(self, test_func: TestFunctionInfo) -> None:
+        """Persist ``test_func``'s body scan, if one was computed."""
+        scan = test_func._body_scan
+        if scan is None:
+            return
+
+        path = self._path(test_func.source_code)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {
+            "is_function": scan.is_function,
+            "assigned": scan.assigned,
+            "referenced": sorted(scan.referenced),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Failed to write rule feature cache entry %s: %s", path, e)
+
+
+def _iter_test_functions(parsed_file: ParsedTestFile) -> Iterator[TestFunctionInfo]:
+    """Yield module-level test functions followed by test class methods."""
+    yield from parsed_file.test_functions
+    for test_class in parsed_file.test_classes:
+        yield from test_class.methods
+
 
 class Rule(ABC):
-    """Base class for detection rules."""
+    """Base class for detection rules.
+
+    Rules implement ``check_function`` for per-test checks and/or
+    ``check_file`` for checks that need the whole file. ``RuleEngine`` calls
+    the per-test hooks of every rule in a single pass over the functions.
+    """
+
+    __slots__ = ("rule_id", "severity", "message_template", "_make_issue")
 
     def __init__(self, rule_id: str, severity: str, message_template: str):
-        self.rule_id = rule_id
-        self.severity = severity
+        # Interned so every issue of a rule shares the same string objects
+        self.rule_id = sys.intern(rule_id)
+        self.severity = sys.intern(severity)
         self.message_template = message_template
+        # Issue constructor with the fields shared by all of this rule's issues
+        self._make_issue = partial(
+            Issue,
+            severity=self.severity,
+            type=self.rule_id,
+            detected_by=DETECTED_BY_RULE_ENGINE,
+        )
 
-    @abstractmethod
     def check(self, parsed_file: ParsedTestFile) -> List[Issue]:
         """Run the rule and return detected issues."""
-        pass
+        issues = list(self.check_file(parsed_file))
+        for test_func in _iter_test_functions(parsed_file):
+            issues.extend(self.check_function(test_func, parsed_file))
+        return issues
+
+    def check_file(self, parsed_file: ParsedTestFile) -> Iterator[Issue]:
+        """Run file-level checks and yield detected issues."""
+        return iter(())
+
+    def check_function(
+        self, test_func: TestFunctionInfo, parsed_file: ParsedTestFile
+    ) -> Iterator[Issue]:
+        """Run checks for a single test function and yield detected issues."""
+        return iter(())
 
     def create_issue(
         self,
@@ -45,14 +229,11 @@ class Rule(ABC):
         suggestion: IssueSuggestion = None,
     ) -> Issue:
         """Create an issue with the rule's default properties."""
-        return Issue(
+        return self._make_issue(
             file=file_path,
             line=line,
             column=column,
-            severity=self.severity,
-            type=self.rule_id,
             message=message or self.message_template,
-            detected_by=DETECTED_BY_RULE_ENGINE,
             suggestion=suggestion
             or IssueSuggestion(
                 action=ACTION_REMOVE, explanation="No specific suggestion provided"
@@ -63,6 +244,8 @@ class Rule(ABC):
 class RedundantAssertionRule(Rule):
     """Detect duplicate assertions within the same test function."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             rule_id=ISSUE_TYPE_REDUNDANT_ASSERTION,
@@ -70,72 +253,59 @@ class RedundantAssertionRule(Rule):
             message_template="Duplicate assertion found",
         )
 
-    def check(self, parsed_file: ParsedTestFile) -> List[Issue]:
-        """Check for redundant assertions in test functions."""
-        issues = []
-
-        # Check module-level test functions
-        for test_func in parsed_file.test_functions:
-            issues.extend(self._check_function(test_func, parsed_file.file_path))
-
-        # Check test class methods
-        for test_class in parsed_file.test_classes:
-            for test_method in test_class.methods:
-                issues.extend(self._check_function(test_method, parsed_file.file_path))
-
-        return issues
-
-    def _check_function(
-        self, test_func: TestFunctionInfo, file_path: str
-    ) -> List[Issue]:
+    def check_function(
+        self, test_func: TestFunctionInfo, parsed_file: ParsedTestFile
+    ) -> Iterator[Issue]:
         """Check a single test function for redundant assertions."""
-        issues = []
-        seen_assertions = {}
+        # Canonical assertion key -> line of its first occurrence
+        seen_assertions: Dict[str, int] = {}
 
         for assertion in test_func.assertions:
             # Create a canonical representation of the assertion
             assertion_key = self._get_assertion_key(assertion)
 
-            if assertion_key in seen_assertions:
-                # Found a duplicate
-                original = seen_assertions[assertion_key]
-                suggestion = IssueSuggestion(
-                    action=ACTION_REMOVE,
-                    old_code=assertion.source_code,
-                    new_code=None,
-                    explanation=(
-                        f"This assertion is identical to the one at line "
-                        f"{original.line_number}. Remove to reduce redundancy."
-                    ),
-                )
+            # One dict operation on the common, unique-assertion path; a
+            # growing map means the key was new
+            seen_count = len(seen_assertions)
+            original_line = seen_assertions.setdefault(
+                assertion_key, assertion.line_number
+            )
+            if len(seen_assertions) > seen_count:
+                continue
 
-                issues.append(
-                    self.create_issue(
-                        file_path=file_path,
-                        line=assertion.line_number,
-                        column=assertion.column,
-                        message=f"Redundant assertion: same as line {original.line_number}",
-                        suggestion=suggestion,
-                    )
-                )
-            else:
-                seen_assertions[assertion_key] = assertion
+            # Found a duplicate
+            suggestion = IssueSuggestion(
+                action=ACTION_REMOVE,
+                old_code=assertion.source_code,
+                new_code=None,
+                explanation=(
+                    f"This assertion is identical to the one at line "
+                    f"{original_line}. Remove to reduce redundancy."
+                ),
+            )
 
-        return issues
+            yield self.create_issue(
+                file_path=parsed_file.file_path,
+                line=assertion.line_number,
+                column=assertion.column,
+                message=f"Redundant assertion: same as line {original_line}",
+                suggestion=suggestion,
+            )
 
     def _get_assertion_key(self, assertion: AssertionInfo) -> str:
         """Get a canonical key for comparing assertions."""
         # Remove comments and normalize whitespace for comparison
-        # Split on '#' to remove inline comments
-        code_without_comment = assertion.source_code.split("#")[0].strip()
-        # Normalize whitespace
-        normalized = " ".join(code_without_comment.split())
-        return normalized
+        # Partition on '#' to remove inline comments
+        code_without_comment = assertion.source_code.partition("#")[0]
+        # Collapse whitespace runs in one C-level pass
+        return _WHITESPACE_RE.sub(" ", code_without_comment).strip()
 
 
 class MissingAssertionRule(Rule):
     """Detect test functions with no assertions."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             rule_id=ISSUE_TYPE_MISSING_ASSERTION,
@@ -143,30 +313,12 @@ class MissingAssertionRule(Rule):
             message_template="Test function has no assertions",
         )
 
-    def check(self, parsed_file: ParsedTestFile) -> List[Issue]:
-        """Check for test functions without assertions."""
-        issues = []
-
-        # Check module-level test functions
-        for test_func in parsed_file.test_functions:
-            if self._has_no_assertions(test_func):
-                issues.append(
-                    self._create_missing_assertion_issue(
-                        test_func, parsed_file.file_path
-                    )
-                )
-
-        # Check test class methods
-        for test_class in parsed_file.test_classes:
-            for test_method in test_class.methods:
-                if self._has_no_assertions(test_method):
-                    issues.append(
-                        self._create_missing_assertion_issue(
-                            test_method, parsed_file.file_path
-                        )
-                    )
-
-        return issues
+    def check_function(
+        self, test_func: TestFunctionInfo, parsed_file: ParsedTestFile
+    ) -> Iterator[Issue]:
+        """Check a test function for missing assertions."""
+        if self._has_no_assertions(test_func):
+            yield self._create_missing_assertion_issue(test_func, parsed_file.file_path)
 
     def _has_no_assertions(self, test_func: TestFunctionInfo) -> bool:
         """Check if test function has no assertions."""
@@ -203,6 +355,8 @@ class MissingAssertionRule(Rule):
 class TrivialAssertionRule(Rule):
     """Detect trivial assertions that always pass."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             rule_id=ISSUE_TYPE_TRIVIAL_ASSERTION,
@@ -210,27 +364,10 @@ class TrivialAssertionRule(Rule):
             message_template="Trivial assertion that always passes",
         )
 
-    def check(self, parsed_file: ParsedTestFile) -> List[Issue]:
-        """Check for trivial assertions."""
-        issues = []
-
-        # Check module-level test functions
-        for test_func in parsed_file.test_functions:
-            issues.extend(self._check_function(test_func, parsed_file.file_path))
-
-        # Check test class methods
-        for test_class in parsed_file.test_classes:
-            for test_method in test_class.methods:
-                issues.extend(self._check_function(test_method, parsed_file.file_path))
-
-        return issues
-
-    def _check_function(
-        self, test_func: TestFunctionInfo, file_path: str
-    ) -> List[Issue]:
+    def check_function(
+        self, test_func: TestFunctionInfo, parsed_file: ParsedTestFile
+    ) -> Iterator[Issue]:
         """Check a single test function for trivial assertions."""
-        issues = []
-
         for assertion in test_func.assertions:
             if assertion.is_trivial:
                 suggestion = IssueSuggestion(
@@ -240,22 +377,20 @@ class TrivialAssertionRule(Rule):
                     explanation="Replace with a meaningful assertion that tests actual behavior.",
                 )
 
-                issues.append(
-                    self.create_issue(
-                        file_path=file_path,
-                        line=assertion.line_number,
-                        column=assertion.column,
-                        message=f"Trivial assertion: {assertion.source_code.strip()}",
-                        suggestion=suggestion,
-                    )
+                yield self.create_issue(
+                    file_path=parsed_file.file_path,
+                    line=assertion.line_number,
+                    column=assertion.column,
+                    message=f"Trivial assertion: {assertion.source_code.strip()}",
+                    suggestion=suggestion,
                 )
 
-        return issues
-
 
 class UnusedFixtureRule(Rule):
     """Detect fixtures that are defined but never used."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             rule_id=ISSUE_TYPE_UNUSED_FIXTURE,
@@ -263,10 +398,8 @@ class UnusedFixtureRule(Rule):
             message_template="Fixture is defined but never used",
         )
 
-    def check(self, parsed_file: ParsedTestFile) -> List[Issue]:
+    def check_file(self, parsed_file: ParsedTestFile) -> Iterator[Issue]:
         """Check for unused fixtures."""
-        issues = []
-
         # Build set of used fixtures
         used_fixtures = self._get_used_fixtures(parsed_file)
 
@@ -283,36 +416,35 @@ class UnusedFixtureRule(Rule):
                     explanation="Remove unused fixture to reduce code complexity.",
                 )
 
-                issues.append(
-                    self.create_issue(
-                        file_path=parsed_file.file_path,
-                        line=fixture.line_number,
-                        message=f"Fixture '{fixture.name}' is defined but never used",
-                        suggestion=suggestion,
-                    )
+                yield self.create_issue(
+                    file_path=parsed_file.file_path,
+                    line=fixture.line_number,
+                    message=f"Fixture '{fixture.name}' is defined but never used",
+                    suggestion=suggestion,
                 )
 
-        return issues
-
-    def _get_used_fixtures(self, parsed_file: ParsedTestFile) -> Set[str]:
-        """Get set of fixture names that are used in test functions."""
-        used_fixtures = set()
-
-        # Check module-level test functions
-        for test_func in parsed_file.test_functions:
-            used_fixtures.update(test_func.parameters)
-
-        # Check test class methods
-        for test_class in parsed_file.test_classes:
-            for test_method in test_class.methods:
-                used_fixtures.update(test_method.parameters)
+    def _get_used_fixtures(self, parsed_file: ParsedTestFile) -> FrozenSet[str]:
+        """Get set of fixture names that are used in test functions.
 
+        The set is built once per parsed file and cached on it, so repeated
+        analysis of the same file does not rebuild it.
+        """
+        used_fixtures = parsed_file._rule_cache.get("used_fixtures")
+        if used_fixtures is None:
+            used_fixtures = frozenset(
+                param
+                for test_func in _iter_test_functions(parsed_file)
+                for param in test_func.parameters
+            )
+            parsed_file._rule_cache["used_fixtures"] = used_fixtures
         return used_fixtures
 
 
 class UnusedVariableRule(Rule):
     """Detect variables that are defined but never used."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             rule_id=ISSUE_TYPE_UNUSED_VARIABLE,
@@ -320,102 +452,34 @@ class UnusedVariableRule(Rule):
             message_template="Variable is defined but never used",
         )
 
-    def check(self, parsed_file: ParsedTestFile) -> List[Issue]:
-        """Check for unused variables in test functions."""
-        issues = []
-
-        # Check module-level test functions
-        for test_func in parsed_file.test_functions:
-            issues.extend(
-                self._check_function_variables(test_func, parsed_file.file_path)
-            )
-
-        # Check test class methods
-        for test_class in parsed_file.test_classes:
-            for test_method in test_class.methods:
-                issues.extend(
-                    self._check_function_variables(test_method, parsed_file.file_path)
-                )
-
-        return issues
-
-    def _check_function_variables(
-        self, test_func: TestFunctionInfo, file_path: str
-    ) -> List[Issue]:
+    def check_function(
+        self, test_func: TestFunctionInfo, parsed_file: ParsedTestFile
+    ) -> Iterator[Issue]:
         """Check for unused variables in a test function."""
-        issues = []
-
-        try:
-            # Parse the function body
-            func_ast = ast.parse(test_func.source_code)
-            if not func_ast.body or not isinstance(
-                func_ast.body[0], (ast.FunctionDef, ast.AsyncFunctionDef)
-            ):
-                return issues
-
-            func_node = func_ast.body[0]
-
-            # Find all variable assignments and references
-            assigned_vars = set()
-            referenced_vars = set()
-
-            for node in ast.walk(func_node):
-                # Variable assignments
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name) and target.id != "_":
-                            assigned_vars.add(target.id)
-                        elif isinstance(target, ast.Tuple):
-                            for elt in target.elts:
-                                if isinstance(elt, ast.Name) and elt.id != "_":
-                                    assigned_vars.add(elt.id)
+        scan = _scan_function_body(test_func)
+        if not scan.is_function:
+            return
 
-                # Variable references
-                elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                    referenced_vars.add(node.id)
+        # Find unused variables (exclude function parameters)
+        unused_vars = scan.assigned.keys() - scan.referenced - set(test_func.parameters)
 
-            # Find unused variables (exclude function parameters)
-            unused_vars = assigned_vars - referenced_vars - set(test_func.parameters)
-
-            # Create issues for unused variables
-            for var_name in unused_vars:
-                # Find the line where the variable is assigned
-                line_number = self._find_assignment_line(func_node, var_name)
-
-                suggestion = IssueSuggestion(
-                    action=ACTION_REMOVE,
-                    old_code=f"    {var_name} = ",  # Simplified - could be more specific
-                    new_code=None,
-                    explanation=f"Remove unused variable '{var_name}' to reduce code complexity.",
-                )
-
-                issues.append(
-                    self.create_issue(
-                        file_path=file_path,
-                        line=test_func.line_number + line_number - 1,
-                        message=f"Unused variable '{var_name}' is assigned but never used",
-                        suggestion=suggestion,
-                    )
-                )
-
-        except SyntaxError:
-            # Skip functions with syntax errors
-            pass
+        # Create issues for unused variables
+        for var_name in unused_vars:
+            line_number = scan.assigned[var_name]
 
-        return issues
+            suggestion = IssueSuggestion(
+                action=ACTION_REMOVE,
+                old_code=f"    {var_name} = ",  # Simplified - could be more specific
+                new_code=None,
+                explanation=f"Remove unused variable '{var_name}' to reduce code complexity.",
+            )
 
-    def _find_assignment_line(self, func_node: ast.FunctionDef, var_name: str) -> int:
-        """Find the line number where a variable is assigned."""
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name) and target.id == var_name:
-                        return node.lineno
-                    elif isinstance(target, ast.Tuple):
-                        for elt in target.elts:
-                            if isinstance(elt, ast.Name) and elt.id == var_name:
-                                return node.lineno
-        return 1  # Default to first line if not found
+            yield self.create_issue(
+                file_path=parsed_file.file_path,
+                line=test_func.line_number + line_number - 1,
+                message=f"Unused variable '{var_name}' is assigned but never used",
+                suggestion=suggestion,
+            )
 
 
 class MissingMockRule(Rule):
@@ -425,6 +489,8 @@ class MissingMockRule(Rule):
     external services (database, API, file I/O) without proper mock setup.
     """
 
+    __slots__ = ("_dependency_data",)
+
     def __init__(self):
         super().__init__(
             rule_id=ISSUE_TYPE_MISSING_MOCK,
@@ -443,37 +509,18 @@ class MissingMockRule(Rule):
         """
         self._dependency_data = data
 
-    def check(self, parsed_file: ParsedTestFile) -> List[Issue]:
-        """Check for missing mocks in test functions."""
-        issues = []
-
-        # Check module-level test functions
-        for test_func in parsed_file.test_functions:
-            issues.extend(self._check_function(test_func, parsed_file))
-
-        # Check test class methods
-        for test_class in parsed_file.test_classes:
-            for test_method in test_class.methods:
-                issues.extend(self._check_function(test_method, parsed_file))
-
-        return issues
-
-    def _check_function(
+    def check_function(
         self, test_func: TestFunctionInfo, parsed_file: ParsedTestFile
-    ) -> List[Issue]:
+    ) -> Iterator[Issue]:
         """Check a single test function for missing mocks."""
-        issues = []
-
-        # Check if test has mock indicators
-        has_mocking = self._has_mock_indicators(test_func, parsed_file)
-
-        # Get dependencies - prefer graph data, fallback to AST analysis
+        # Get dependencies - prefer graph data, fallback to parsed call names
         dependencies = self._get_dependencies(test_func)
 
         # Find external dependencies that may need mocking
         external_deps = self._find_external_dependencies(dependencies)
 
-        if external_deps and not has_mocking:
+        # Only scan for mock setup when there is something to mock
+        if external_deps and not self._has_mock_indicators(test_func, parsed_file):
             suggestion = IssueSuggestion(
                 action=ACTION_ADD,
                 old_code=None,
@@ -484,20 +531,16 @@ class MissingMockRule(Rule):
                 ),
             )
 
-            issues.append(
-                self.create_issue(
-                    file_path=parsed_file.file_path,
-                    line=test_func.line_number,
-                    message=(
-                        f"Test '{test_func.name}' calls external dependencies "
-                        f"({', '.join(external_deps)}) without proper mocking"
-                    ),
-                    suggestion=suggestion,
-                )
+            yield self.create_issue(
+                file_path=parsed_file.file_path,
+                line=test_func.line_number,
+                message=(
+                    f"Test '{test_func.name}' calls external dependencies "
+                    f"({', '.join(external_deps)}) without proper mocking"
+                ),
+                suggestion=suggestion,
             )
 
-        return issues
-
     def _has_mock_indicators(
         self, test_func: TestFunctionInfo, parsed_file: ParsedTestFile
     ) -> bool:
@@ -509,86 +552,56 @@ class MissingMockRule(Rule):
         - Mock imports in the file
         - Mock usage in source code
         """
-        # Check decorators
-        for decorator in test_func.decorators:
-            for pattern in MOCK_INDICATOR_PATTERNS:
-                if pattern.lower() in decorator.lower():
-                    return True
-
-        # Check parameters (fixture injection)
-        for param in test_func.parameters:
-            for pattern in MOCK_INDICATOR_PATTERNS:
-                if pattern.lower() in param.lower():
-                    return True
-
-        # Check source code for mock usage
-        source_lower = test_func.source_code.lower()
-        for pattern in MOCK_INDICATOR_PATTERNS:
-            if pattern.lower() in source_lower:
-                return True
-
-        # Check file imports (ImportInfo objects have module and name fields)
-        for imp in parsed_file.imports:
-            for pattern in MOCK_INDICATOR_PATTERNS:
-                # Check both module and name fields for mock indicators
-                # Example: from unittest.mock import Mock -> module="unittest.mock", name="Mock"
-                if (
-                    pattern.lower() in imp.module.lower()
-                    or pattern.lower() in imp.name.lower()
-                ):
-                    return True
-
-        return False
-
-    def _get_dependencies(self, test_func: TestFunctionInfo) -> List[str]:
+        if self._has_mock_import(parsed_file):
+            return True
+
+        # Targets are newline-separated so no pattern can match across two of
+        # them; the short decorator/parameter names are scanned first.
+        # Decorator string arguments cover e.g. usefixtures("fake_db").
+        names = "\n".join(
+            [*test_func.decorators, *test_func.decorator_args, *test_func.parameters]
+        )
+        search = _MOCK_INDICATOR_RE.search
+        return search(names) is not None or search(test_func.source_code) is not None
+
+    def _has_mock_import(self, parsed_file: ParsedTestFile) -> bool:
+        """Check if any import in the file looks mock-related.
+
+        The answer is the same for every test function in the file, so it is
+        computed once and cached on the parsed file.
+        """
+        has_mock_import = parsed_file._rule_cache.get("has_mock_import")
+        if has_mock_import is None:
+            search = _MOCK_INDICATOR_RE.search
+            has_mock_import = any(
+                search(imp.module) or search(imp.name) for imp in parsed_file.imports
+            )
+            parsed_file._rule_cache["has_mock_import"] = has_mock_import
+        return has_mock_import
+
+    def _get_dependencies(self, test_func: TestFunctionInfo) -> Iterable[str]:
         """Get dependencies for a test function.
 
-        Uses graph data if available, otherwise falls back to AST analysis.
+        Uses graph data if available, otherwise falls back to the call names
+        collected by the parser.
         """
         # Try graph data first
         if test_func.name in self._dependency_data:
             return self._dependency_data[test_func.name]
 
-        # Fallback: Extract function calls from AST
-        return self._extract_function_calls_from_ast(test_func)
-
-    def _extract_function_calls_from_ast(
-        self, test_func: TestFunctionInfo
-    ) -> List[str]:
-        """Extract function calls from test function source code using AST."""
-        calls = []
-
-        try:
-            func_ast = ast.parse(test_func.source_code)
-
-            for node in ast.walk(func_ast):
-                if isinstance(node, ast.Call):
-                    # Get the function name
-                    if isinstance(node.func, ast.Name):
-                        calls.append(node.func.id)
-                    elif isinstance(node.func, ast.Attribute):
-                        calls.append(node.func.attr)
-
-        except SyntaxError:
-            pass
-
-        return list(set(calls))
-
-    def _find_external_dependencies(self, dependencies: List[str]) -> List[str]:
-        """Filter dependencies to find external ones that likely need mocking."""
-        external = []
+        # Fallback: Function calls found while parsing the test
+        return test_func.call_names
 
-        for dep in dependencies:
-            dep_lower = dep.lower()
-            for pattern in EXTERNAL_DEPENDENCY_PATTERNS:
-                if (
-                    dep_lower.startswith(pattern.lower())
-                    or pattern.lower() in dep_lower
-                ):
-                    external.append(dep)
-                    break
+    def _find_external_dependencies(self, dependencies: Iterable[str]) -> List[str]:
+        """Filter dependencies to find external ones that likely need mocking.
 
-        return external
+        Names are deduplicated before scanning, since both graph data and
+        parsed call names repeat a callee once per call site. The insertion-
+        ordered dict acts as the set, so the suggestion text lists names in
+        first-seen order rather than hash order.
+        """
+        search = _EXTERNAL_DEPENDENCY_RE.search
+        return [dep for dep in dict.fromkeys(dependencies) if search(dep)]
 
     def _generate_mock_suggestion(self, external_deps: List[str]) -> str:
         """Generate mock setup suggestion code."""
@@ -612,7 +625,18 @@ class MissingMockRule(Rule):
 class RuleEngine:
     """Orchestrates all detection rules."""
 
-    def __init__(self):
+    def __init__(self, feature_cache_dir: Optional[str] = None):
+        """
+        Initialize the rule engine.
+
+        Args:
+            feature_cache_dir: Optional directory where names extracted from
+                test function bodies are cached across runs, so unchanged
+                functions are not parsed again
+        """
+        self._feature_cache = (
+            _FeatureCache(feature_cache_dir) if feature_cache_dir else None
+        )
         self._missing_mock_rule = MissingMockRule()
         self.rules = [
             RedundantAssertionRule(),
@@ -633,8 +657,21 @@ class RuleEngine:
         self._missing_mock_rule.set_dependency_data(data)
 
     def analyze(self, parsed_file: ParsedTestFile) -> List[Issue]:
-        """Run all rules and aggregate issues."""
-        issues = []
-        for rule in self.rules:
-            issues.extend(rule.check(parsed_file))
-        return issues
+        """Run all rules and aggregate issues.
+
+        Test functions are visited once, with every rule's per-function check
+        applied in turn. Issues are still grouped by rule, in rule order.
+        """
+        feature_cache = self._feature_cache
+        rule_issues = [list(rule.check_file(parsed_file)) for rule in self.rules]
+        for test_func in _iter_test_functions(parsed_file):
+            cache_miss = (
+                feature_cache is not None
+                and test_func._body_scan is None
+                and not feature_cache.load(test_func)
+            )
+            for rule, issues in zip(self.rules, rule_issues):
+                issues.extend(rule.check_function(test_func, parsed_file))
+            if cache_miss:
+                feature_cache.store(test_func)
+        return [issue for issues in rule_issues for issue in issues]
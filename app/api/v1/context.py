@@ -2,31 +2,48 @@
 Production API endpoints for Context Management (Phase 1).
 
 This module provides RESTful endpoints for managing code dependency graphs:
-- Initialize project graph (batch upload)
+- Initialize project graph (batch upload, streamed or in the background)
 - Incremental updates with optimistic locking
 - Project status queries
 """
 
+import asyncio
 import logging
 import time
-from contextlib import asynccontextmanager
 from datetime import UTC, datetime
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError as PydanticValidationError
 
+from app.api.v1.deps import get_graph_service
+from app.api.v1.routes import launch_background_task
 from app.core.error_handlers import (
     EmptyFilesError,
+    LLTException,
     NoSymbolsError,
     ProjectAlreadyExistsError,
     ProjectNotFoundError,
+    ValidationError,
     VersionConflictError,
 )
-from app.core.graph.graph_service import GraphService
+from app.core.graph.graph_service import CALL_COLUMNS, SYMBOL_COLUMNS, GraphService
+from app.core.tasks.tasks import (
+    TaskStatus,
+    create_task,
+    get_task,
+    get_task_payload,
+    update_task_status,
+)
 from app.models.context import (
+    MAX_INITIALIZE_FILES,
     FileSymbols,
     IncrementalUpdateRequest,
     IncrementalUpdateResponse,
+    InitializationJobResponse,
+    InitializationStatusResponse,
+    InitializeProjectHeader,
     InitializeProjectRequest,
     InitializeProjectResponse,
     ProjectDataResponse,
@@ -37,104 +54,342 @@ from app.models.context import (
 router = APIRouter(prefix="/context", tags=["Context Management"])
 logger = logging.getLogger(__name__)
 
+# Number of files whose symbols are prepared and written per batch
+INITIALIZE_FILE_CHUNK_SIZE = 64
+
+# Projects with more files than this are initialized in a background task
+BACKGROUND_INITIALIZE_FILE_THRESHOLD = 1000
+
+
+def new_symbol_columns() -> Dict[str, List[Any]]:
+    """
+    Create empty per-field symbol lists for batch_create_symbol_columns.
+
+    Returns:
+        Dictionary mapping every SYMBOL_COLUMNS name to an empty list
+    """
+    return {name: [] for name in SYMBOL_COLUMNS}
 
-@asynccontextmanager
-async def get_graph_service_context():
+
+def new_call_columns() -> Dict[str, List[Any]]:
     """
-    Async context manager for GraphService with proper resource cleanup.
+    Create empty per-caller lists for create_call_relationship_columns.
+
+    Returns:
+        Dictionary mapping every CALL_COLUMNS name to an empty list
+    """
+    return {name: [] for name in CALL_COLUMNS}
+
+
+def prepare_file(
+    file_path: str,
+    symbols: List[SymbolInfo],
+    columns: Dict[str, List[Any]],
+    calls: Dict[str, List[Any]],
+) -> None:
+    """
+    Append a file's symbols to the symbol columns and their calls.
+
+    Each qualified name is built once and shared by the symbol columns and
+    the call columns. A symbol's calls list is passed through as-is; Neo4j
+    unwinds it into individual relationships.
+
+    Args:
+        file_path: File path for the symbols
+        symbols: List of SymbolInfo objects
+        columns: Symbol columns from new_symbol_columns, extended in place
+        calls: Call columns from new_call_columns, extended in place
+    """
+    prefix = file_path + "::"
+    names = columns["names"]
+    kinds = columns["kinds"]
+    signatures = columns["signatures"]
+    file_paths = columns["file_paths"]
+    line_starts = columns["line_starts"]
+    line_ends = columns["line_ends"]
+    qualified_names = columns["qualified_names"]
+    callers = calls["callers"]
+    callees = calls["callees"]
+    call_lines = calls["lines"]
+
+    for s in symbols:
+        qualified_name = prefix + s.name
+        names.append(s.name)
+        kinds.append(s.kind)
+        signatures.append(s.signature or "")
+        file_paths.append(file_path)
+        line_starts.append(s.line_start)
+        line_ends.append(s.line_end)
+        qualified_names.append(qualified_name)
+        if s.calls:
+            # Note: We don't know the exact file of the callee, so callee names
+            # are matched against qualified names by the Neo4j query
+            callers.append(qualified_name)
+            callees.append(s.calls)
+            call_lines.append(s.line_start)
+
+
+async def iter_file_chunks(
+    files: List[FileSymbols],
+) -> AsyncIterator[List[FileSymbols]]:
+    """
+    Yield an in-memory file list in INITIALIZE_FILE_CHUNK_SIZE slices.
+
+    Args:
+        files: Files from an initialize request
 
     Yields:
-        GraphService instance
+        Consecutive chunks of files
+    """
+    for start in range(0, len(files), INITIALIZE_FILE_CHUNK_SIZE):
+        yield files[start : start + INITIALIZE_FILE_CHUNK_SIZE]
 
-    Raises:
-        HTTPException: If service initialization fails or raised from endpoint
+
+async def write_symbol_chunks(
+    graph_service: GraphService,
+    project_id: str,
+    file_chunks: AsyncIterator[List[FileSymbols]],
+) -> Tuple[int, int, Dict[str, List[Any]]]:
     """
-    service = GraphService()
+    Prepare and insert symbols one chunk of files at a time.
 
+    The symbol columns for the whole project are never held at once. Each
+    chunk's write runs as a task while the next chunk is prepared. Calls are
+    collected for the whole project, because relationships can only be
+    created once every callee has been written.
+
+    Args:
+        graph_service: Shared graph service
+        project_id: Project identifier
+        file_chunks: Chunks of files to write, in order
+
+    Returns:
+        Tuple of (files written, symbols created, call columns)
+    """
+    files_written = 0
+    symbols_created = 0
+    calls = new_call_columns()
+    pending_write = None
     try:
-        await service.connect()
-        await service.create_indexes()  # Ensure indexes exist
-        yield service
-    except HTTPException:
-        # Re-raise HTTPExceptions from endpoints as-is
-        raise
-    except (
-        ProjectNotFoundError,
-        ProjectAlreadyExistsError,
-        VersionConflictError,
-    ):
-        # Re-raise our custom exceptions so they reach the exception handlers
-        raise
-    except Exception as e:
-        logger.error("Failed to initialize graph service: %s", e)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Graph database service unavailable: {str(e)}",
-        ) from e
+        async for chunk in file_chunks:
+            columns = new_symbol_columns()
+            for file in chunk:
+                prepare_file(file.path, file.symbols, columns, calls)
+            files_written += len(chunk)
+
+            if pending_write is not None:
+                symbols_created += await pending_write
+            pending_write = asyncio.create_task(
+                graph_service.batch_create_symbol_columns(project_id, columns)
+            )
+            # Let the write reach the driver before preparing the next chunk
+            await asyncio.sleep(0)
+
+        if pending_write is not None:
+            symbols_created += await pending_write
+            pending_write = None
     finally:
+        if pending_write is not None:
+            pending_write.cancel()
+
+    return files_written, symbols_created, calls
+
+
+async def iter_ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    """
+    Yield the non-blank lines of an NDJSON request body as it arrives.
+
+    Args:
+        request: Incoming request with an NDJSON body
+
+    Yields:
+        One raw JSON document per line
+    """
+    buffer = bytearray()
+    async for data in request.stream():
+        # Only the newly received bytes can contain a new line break
+        search_from = len(buffer)
+        buffer += data
+        line_start = 0
+        newline = buffer.find(b"\n", search_from)
+        while newline != -1:
+            line = bytes(buffer[line_start:newline])
+            if line.strip():
+                yield line
+            line_start = newline + 1
+            newline = buffer.find(b"\n", line_start)
+        del buffer[:line_start]
+    if buffer.strip():
+        yield bytes(buffer)
+
+
+async def parse_ndjson_file_chunks(
+    lines: AsyncIterator[bytes],
+) -> AsyncIterator[List[FileSymbols]]:
+    """
+    Validate NDJSON file lines and group them into chunks.
+
+    Args:
+        lines: Remaining body lines after the header, one FileSymbols each
+
+    Yields:
+        Chunks of up to INITIALIZE_FILE_CHUNK_SIZE validated files
+
+    Raises:
+        ValidationError: If a line is not a valid FileSymbols document, or
+            the body has more than MAX_INITIALIZE_FILES files
+    """
+    chunk: List[FileSymbols] = []
+    line_number = 1  # The header is line 1
+    async for line in lines:
+        line_number += 1
+        if line_number > MAX_INITIALIZE_FILES + 1:
+            raise ValidationError(
+                field=f"line {line_number}",
+                reason=f"Projects are limited to {MAX_INITIALIZE_FILES} files",
+            )
         try:
-            await service.close()
-        except Exception as e:
-            logger.warning("Error closing graph service: %s", e)
+            chunk.append(FileSymbols.model_validate_json(line))
+        except PydanticValidationError as e:
+            raise ValidationError(
+                field=f"line {line_number}",
+                reason=e.errors(include_url=False)[0]["msg"],
+            ) from e
+        if len(chunk) == INITIALIZE_FILE_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
-def prepare_symbols_for_db(
-    file_path: str, symbols: List[SymbolInfo]
-) -> List[Dict[str, Any]]:
+async def write_project(
+    graph_service: GraphService,
+    request: InitializeProjectRequest,
+    start_time: float,
+) -> InitializeProjectResponse:
     """
-    Convert SymbolInfo models to database-ready dictionaries.
+    Write a validated project's symbols, relationships and initial version.
 
     Args:
-        file_path: File path for the symbols
-        symbols: List of SymbolInfo objects
+        graph_service: Shared graph service
+        request: Project initialization request with files and symbols
+        start_time: time.time() when the request was received
 
     Returns:
-        List of dictionaries with qualified_name added
-    """
-    return [
-        {
-            "name": s.name,
-            "kind": s.kind,
-            "signature": s.signature or "",
-            "file_path": file_path,
-            "line_start": s.line_start,
-            "line_end": s.line_end,
-            "qualified_name": f"{file_path}::{s.name}",
-            "calls": s.calls,
-        }
-        for s in symbols
-    ]
+        InitializeProjectResponse with statistics
+    """
+    _, symbols_created, calls = await write_symbol_chunks(
+        graph_service, request.project_id, iter_file_chunks(request.files)
+    )
+    # Note: Relationship creation may have partial failures if callees don't exist
+    # This is acceptable as external library calls won't have targets
+    relationships_created = await graph_service.create_call_relationship_columns(
+        request.project_id, calls
+    )
 
+    # Initialize project version
+    await graph_service.increment_project_version(request.project_id)
 
-def prepare_relationships(
-    file_path: str, symbols: List[SymbolInfo]
-) -> List[Dict[str, Any]]:
+    # Calculate processing time
+    processing_time_ms = int((time.time() - start_time) * 1000)
+
+    logger.info(
+        "Project initialized successfully: project_id=%s, files=%d, symbols=%d, relationships=%d, time_ms=%d",
+        request.project_id,
+        len(request.files),
+        symbols_created,
+        relationships_created,
+        processing_time_ms,
+    )
+
+    return InitializeProjectResponse(
+        project_id=request.project_id,
+        status="initialized",
+        indexed_files=len(request.files),
+        indexed_symbols=symbols_created,
+        processing_time_ms=processing_time_ms,
+    )
+
+
+async def run_initialize_job(
+    job_id: str,
+    graph_service: GraphService,
+    request: InitializeProjectRequest,
+    start_time: float,
+) -> None:
     """
-    Extract call relationships from symbols.
+    Run a project initialization in the background and record its outcome.
+
+    If the write fails, the symbols already written are deleted so the
+    project can be uploaded again. Failures to record the job status are
+    logged rather than raised, since nothing awaits the job.
 
     Args:
-        file_path: File path
-        symbols: List of SymbolInfo objects
+        job_id: Task identifier returned to the client
+        graph_service: Shared graph service
+        request: Project initialization request with files and symbols
+        start_time: time.time() when the request was received
+    """
+    try:
+        await update_task_status(job_id, TaskStatus.PROCESSING)
+        response = await write_project(graph_service, request, start_time)
+    except Exception as e:
+        logger.error(
+            "Background initialization failed: project_id=%s, job_id=%s, error=%s",
+            request.project_id,
+            job_id,
+            e,
+            exc_info=True,
+        )
+        await discard_partial_project(graph_service, request.project_id)
+        await record_job_status(job_id, TaskStatus.FAILED, error=str(e))
+        return
 
-    Returns:
-        List of relationship dictionaries
+    await record_job_status(
+        job_id, TaskStatus.COMPLETED, result=response.model_dump(mode="json")
+    )
+
+
+async def discard_partial_project(graph_service: GraphService, project_id: str) -> None:
     """
-    relationships = []
+    Delete the symbols of a project whose initialization failed.
+
+    Args:
+        graph_service: Shared graph service
+        project_id: Project identifier
+    """
+    try:
+        await graph_service.delete_project(project_id)
+    except Exception as e:
+        logger.error(
+            "Failed to clean up partial project: project_id=%s, error=%s",
+            project_id,
+            e,
+            exc_info=True,
+        )
 
-    for symbol in symbols:
-        caller_qname = f"{file_path}::{symbol.name}"
-        for callee in symbol.calls:
-            # Note: We don't know the exact file of the callee, so we use a heuristic
-            # The actual matching will be done by Neo4j query
-            relationships.append(
-                {
-                    "caller_qualified_name": caller_qname,
-                    "callee_qualified_name": callee,  # Will match by name in query
-                    "line": symbol.line_start,
-                }
-            )
 
-    return relationships
+async def record_job_status(
+    job_id: str, task_status: TaskStatus, **kwargs: Any
+) -> None:
+    """
+    Record a background initialization's status, logging any failure.
+
+    Args:
+        job_id: Task identifier returned to the client
+        task_status: New status of the job
+        **kwargs: Result or error passed through to update_task_status
+    """
+    try:
+        await update_task_status(job_id, task_status, **kwargs)
+    except Exception as e:
+        logger.error(
+            "Failed to record initialization status: job_id=%s, status=%s, error=%s",
+            job_id,
+            task_status.value,
+            e,
+            exc_info=True,
+        )
 
 
 @router.post(
@@ -143,6 +398,10 @@ def prepare_relationships(
     status_code=status.HTTP_201_CREATED,
     responses={
         201: {"description": "Project initialized successfully"},
+        202: {
+            "description": "Large project accepted for background initialization",
+            "model": InitializationJobResponse,
+        },
         409: {"description": "Project already exists"},
         422: {"description": "Validation error"},
         503: {"description": "Database unavailable"},
@@ -150,15 +409,19 @@ def prepare_relationships(
 )
 async def initialize_project(
     request: InitializeProjectRequest,
+    http_request: Request,
 ) -> InitializeProjectResponse:
     """
     Initialize a project's code graph.
 
     Creates Symbol nodes and CALLS relationships for all files.
-    Returns 409 if project already exists.
+    Returns 409 if project already exists. The request is validated before
+    the graph service is needed, so a malformed body gets 422 even while
+    Neo4j is unavailable.
 
     Args:
         request: Project initialization request with files and symbols
+        http_request: Incoming request, used to reach the application state
 
     Returns:
         InitializeProjectResponse with statistics
@@ -187,69 +450,222 @@ async def initialize_project(
         )
         raise NoSymbolsError(total_files=len(request.files))
 
-    async with get_graph_service_context() as graph_service:
-        # Check if project already exists
-        if await graph_service.check_project_exists(request.project_id):
-            raise ProjectAlreadyExistsError(request.project_id)
+    graph_service = await get_graph_service(http_request)
 
-        try:
-            # Prepare symbols for database
-            all_symbols = []
-            all_relationships = []
+    # Check if project already exists
+    if await graph_service.check_project_exists(request.project_id):
+        raise ProjectAlreadyExistsError(request.project_id)
 
-            for file in request.files:
-                symbols_data = prepare_symbols_for_db(file.path, file.symbols)
-                all_symbols.extend(symbols_data)
+    try:
+        # Index DDL is only needed on the write path, after the 409 check
+        await graph_service.ensure_indexes()
 
-                relationships = prepare_relationships(file.path, file.symbols)
-                all_relationships.extend(relationships)
+        if len(request.files) > BACKGROUND_INITIALIZE_FILE_THRESHOLD:
+            job_id = await create_task(
+                {
+                    "type": "initialize_project",
+                    "project_id": request.project_id,
+                    "files": len(request.files),
+                }
+            )
+            launch_background_task(
+                http_request.app,
+                job_id,
+                run_initialize_job(job_id, graph_service, request, start_time),
+            )
 
-            # Insert into Neo4j using batch operations
-            symbols_created = await graph_service.batch_create_symbols_chunked(
+            logger.info(
+                "Project initialization accepted: project_id=%s, job_id=%s",
                 request.project_id,
-                all_symbols,
+                job_id,
+            )
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content=InitializationJobResponse(
+                    project_id=request.project_id,
+                    job_id=job_id,
+                    status=TaskStatus.PENDING.value,
+                ).model_dump(),
             )
 
-            # Note: Relationship creation may have partial failures if callees don't exist
-            # This is acceptable as external library calls won't have targets
-            relationships_created = 0
-            if all_relationships:
-                relationships_created = await graph_service.create_call_relationships(
-                    request.project_id,
-                    all_relationships,
-                )
+        return await write_project(graph_service, request, start_time)
 
-            # Initialize project version
-            await graph_service.increment_project_version(request.project_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Project initialization failed: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation failed. Please try again.",
+        ) from e
 
-            # Calculate processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
 
-            logger.info(
-                "Project initialized successfully: project_id=%s, files=%d, symbols=%d, relationships=%d, time_ms=%d",
-                request.project_id,
-                len(request.files),
-                symbols_created,
-                relationships_created,
-                processing_time_ms,
-            )
+@router.post(
+    "/projects/initialize/stream",
+    response_model=InitializeProjectResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"description": "Project initialized successfully"},
+        409: {"description": "Project already exists"},
+        422: {"description": "Validation error"},
+        503: {"description": "Database unavailable"},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def initialize_project_stream(
+    request: Request,
+) -> InitializeProjectResponse:
+    """
+    Initialize a project's code graph from an NDJSON body.
 
-            return InitializeProjectResponse(
-                project_id=request.project_id,
-                status="initialized",
-                indexed_files=len(request.files),
-                indexed_symbols=symbols_created,
-                processing_time_ms=processing_time_ms,
-            )
+    The first line is an InitializeProjectHeader and every following line is
+    one FileSymbols document. Files are validated and written chunk by chunk
+    as the body arrives, so peak memory no longer grows with the number of
+    symbols. If the upload fails for any reason, the symbols already written
+    are deleted so the project can be uploaded again. The header is validated
+    before the graph service is needed.
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Project initialization failed: %s", e, exc_info=True)
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database operation failed. Please try again.",
-            ) from e
+    Args:
+        request: Incoming request with the NDJSON body
+
+    Returns:
+        InitializeProjectResponse with statistics
+
+    Raises:
+        HTTPException: 409 if project exists, 503 if database error
+    """
+    start_time = time.time()
+
+    lines = iter_ndjson_lines(request)
+    header_line = await anext(lines, None)
+    if header_line is None:
+        raise EmptyFilesError()
+    try:
+        header = InitializeProjectHeader.model_validate_json(header_line)
+    except PydanticValidationError as e:
+        raise ValidationError(
+            field="line 1", reason=e.errors(include_url=False)[0]["msg"]
+        ) from e
+
+    logger.info("Initializing project from stream: project_id=%s", header.project_id)
+
+    graph_service = await get_graph_service(request)
+
+    # Check if project already exists
+    if await graph_service.check_project_exists(header.project_id):
+        raise ProjectAlreadyExistsError(header.project_id)
+
+    try:
+        await graph_service.ensure_indexes()
+    except Exception as e:
+        logger.error("Project initialization failed: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation failed. Please try again.",
+        ) from e
+
+    try:
+        files_written, symbols_created, calls = await write_symbol_chunks(
+            graph_service,
+            header.project_id,
+            parse_ndjson_file_chunks(lines),
+        )
+
+        if files_written == 0:
+            raise EmptyFilesError()
+        if symbols_created == 0:
+            raise NoSymbolsError(total_files=files_written)
+
+        relationships_created = await graph_service.create_call_relationship_columns(
+            header.project_id, calls
+        )
+
+        # Initialize project version
+        await graph_service.increment_project_version(header.project_id)
+
+    except (HTTPException, LLTException):
+        # Remove whatever was written so the project can be uploaded again
+        await discard_partial_project(graph_service, header.project_id)
+        raise
+    except Exception as e:
+        await discard_partial_project(graph_service, header.project_id)
+        logger.error("Project initialization failed: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation failed. Please try again.",
+        ) from e
+
+    processing_time_ms = int((time.time() - start_time) * 1000)
+
+    logger.info(
+        "Project initialized from stream: project_id=%s, files=%d, symbols=%d, relationships=%d, time_ms=%d",
+        header.project_id,
+        files_written,
+        symbols_created,
+        relationships_created,
+        processing_time_ms,
+    )
+
+    return InitializeProjectResponse(
+        project_id=header.project_id,
+        status="initialized",
+        indexed_files=files_written,
+        indexed_symbols=symbols_created,
+        processing_time_ms=processing_time_ms,
+    )
+
+
+@router.get(
+    "/projects/{project_id}/initialization-status/{job_id}",
+    response_model=InitializationStatusResponse,
+    responses={
+        200: {"description": "Initialization status retrieved"},
+        404: {"description": "Initialization job not found"},
+    },
+)
+async def get_initialization_status(
+    project_id: str, job_id: str
+) -> InitializationStatusResponse:
+    """
+    Get the status of a background project initialization.
+
+    Args:
+        project_id: Project identifier
+        job_id: Job identifier returned by the 202 initialize response
+
+    Returns:
+        InitializationStatusResponse with the result once completed
+
+    Raises:
+        HTTPException: 404 if no initialization job exists for the project
+    """
+    task = await get_task(job_id)
+    payload = await get_task_payload(task) if task else {}
+    if (
+        payload.get("type") != "initialize_project"
+        or payload.get("project_id") != project_id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Initialization job '{job_id}' not found",
+        )
+
+    # The job record was written by run_initialize_job, so it is trusted and
+    # hydrated without re-validation
+    error = task.get("error")
+    result = task.get("result")
+    return InitializationStatusResponse.model_construct(
+        project_id=project_id,
+        job_id=job_id,
+        status=task["status"],
+        result=InitializeProjectResponse.model_construct(**result) if result else None,
+        error=error["message"] if error else None,
+    )
 
 
 @router.patch(
@@ -265,6 +681,7 @@ async def initialize_project(
 async def update_incremental(
     project_id: str,
     request: IncrementalUpdateRequest,
+    graph_service: GraphService = Depends(get_graph_service),
 ) -> IncrementalUpdateResponse:
     """
     Apply incremental changes to project graph.
@@ -274,6 +691,7 @@ async def update_incremental(
     Args:
         project_id: Project identifier
         request: Incremental update request with version and changes
+        graph_service: Shared graph service
 
     Returns:
         IncrementalUpdateResponse with new version
@@ -290,69 +708,54 @@ async def update_incremental(
         len(request.changes),
     )
 
-    async with get_graph_service_context() as graph_service:
-        # Check project exists
-        if not await graph_service.check_project_exists(project_id):
-            raise ProjectNotFoundError(project_id)
-
-        # Check version (optimistic locking)
-        current_version = await graph_service.get_project_version(project_id)
-        if request.version != current_version:
-            raise VersionConflictError(
-                expected=current_version,
-                received=request.version,
-                project_id=project_id,
-            )
+    # Check project exists and its version in a single round-trip
+    exists, current_version, _ = await graph_service.get_project_revision(project_id)
+    if not exists:
+        raise ProjectNotFoundError(project_id)
 
-        try:
-            total_changes = 0
-
-            for file_change in request.changes:
-                if file_change.action == "deleted":
-                    # Delete all symbols from this file
-                    deleted = await graph_service.delete_file_symbols(
-                        project_id, file_change.file_path
-                    )
-                    total_changes += deleted
-
-                elif file_change.action == "modified" and file_change.symbols_changed:
-                    # Apply symbol changes
-                    stats = await graph_service.update_file_symbols(
-                        project_id,
-                        file_change.file_path,
-                        file_change.symbols_changed,
-                    )
-                    total_changes += sum(stats.values())
-
-            # Increment version
-            new_version = await graph_service.increment_project_version(project_id)
-
-            processing_time_ms = int((time.time() - start_time) * 1000)
+    # Check version (optimistic locking)
+    if request.version != current_version:
+        raise VersionConflictError(
+            expected=current_version,
+            received=request.version,
+            project_id=project_id,
+        )
 
-            logger.info(
-                "Incremental update completed: project_id=%s, changes=%d, new_version=%d, time_ms=%d",
-                project_id,
-                total_changes,
-                new_version,
-                processing_time_ms,
+    try:
+        # Apply changes and bump the version atomically; a concurrent update
+        # that won the race surfaces here as a VersionConflictError
+        total_changes, new_version, updated_at = (
+            await graph_service.apply_incremental_update(
+                project_id, request.version, request.changes
             )
+        )
 
-            return IncrementalUpdateResponse(
-                project_id=project_id,
-                version=new_version,
-                updated_at=datetime.now(UTC),
-                changes_applied=total_changes,
-                processing_time_ms=processing_time_ms,
-            )
+        processing_time_ms = int((time.time() - start_time) * 1000)
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error("Incremental update failed: %s", e, exc_info=True)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Update operation failed",
-            ) from e
+        logger.info(
+            "Incremental update completed: project_id=%s, changes=%d, new_version=%d, time_ms=%d",
+            project_id,
+            total_changes,
+            new_version,
+            processing_time_ms,
+        )
+
+        return IncrementalUpdateResponse(
+            project_id=project_id,
+            version=new_version,
+            updated_at=updated_at,
+            changes_applied=total_changes,
+            processing_time_ms=processing_time_ms,
+        )
+
+    except (HTTPException, VersionConflictError):
+        raise
+    except Exception as e:
+        logger.error("Incremental update failed: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Update operation failed",
+        ) from e
 
 
 @router.get(
@@ -366,6 +769,7 @@ async def update_incremental(
 )
 async def get_project_data(
     project_id: str,
+    graph_service: GraphService = Depends(get_graph_service),
 ) -> ProjectDataResponse:
     """
     Get complete project data including all files and symbols.
@@ -376,6 +780,7 @@ async def get_project_data(
 
     Args:
         project_id: Project identifier
+        graph_service: Shared graph service
 
     Returns:
         ProjectDataResponse with all files and symbols
@@ -385,32 +790,69 @@ async def get_project_data(
     """
     logger.info("Retrieving full project data: project_id=%s", project_id)
 
-    async with get_graph_service_context() as graph_service:
-        try:
-            project_data = await graph_service.get_project_data(project_id)
+    try:
+        project_data = await graph_service.get_project_data(project_id)
 
-            logger.info(
-                "Project data retrieved: project_id=%s, version=%d, files=%d",
-                project_id,
-                project_data["version"],
-                len(project_data["files"]),
-            )
+        logger.info(
+            "Project data retrieved: project_id=%s, version=%d, files=%d",
+            project_id,
+            project_data["version"],
+            len(project_data["files"]),
+        )
 
-            return ProjectDataResponse(**project_data)
+        return ProjectDataResponse(**project_data)
 
-        except ProjectNotFoundError:
-            raise
-        except Exception as e:
-            logger.error(
-                "Failed to retrieve project data: project_id=%s, error=%s",
-                project_id,
-                str(e),
-                exc_info=True,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Failed to retrieve project data",
-            ) from e
+    except ProjectNotFoundError:
+        raise
+    except Exception as e:
+        logger.error(
+            "Failed to retrieve project data: project_id=%s, error=%s",
+            project_id,
+            str(e),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to retrieve project data",
+        ) from e
+
+
+def project_status_etag(
+    project_id: str, version: int, created_at: Optional[datetime]
+) -> str:
+    """
+    Build the weak ETag of a project's status for a given version.
+
+    The project's creation time is part of the tag because a deleted and
+    re-initialized project restarts at version 1.
+
+    Args:
+        project_id: Project identifier
+        version: Project version
+        created_at: Creation time of the current project incarnation
+
+    Returns:
+        Weak entity tag, quoted as sent in the ETag header
+    """
+    incarnation = int(created_at.timestamp() * 1_000_000) if created_at else 0
+    return f'W/"{project_id}:{incarnation}:{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if sent
+        etag: Current entity tag
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
 
 
 @router.get(
@@ -418,17 +860,28 @@ async def get_project_data(
     response_model=ProjectStatusResponse,
     responses={
         200: {"description": "Status retrieved"},
+        304: {"description": "Status unchanged since the version in If-None-Match"},
         404: {"description": "Project not found"},
     },
 )
 async def get_project_status(
     project_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    graph_service: GraphService = Depends(get_graph_service),
 ) -> ProjectStatusResponse:
     """
     Get current status and statistics of a project.
 
+    The response carries a weak ETag derived from the project version and
+    creation time. A poll whose If-None-Match still matches is answered with
+    304 after reading only those, skipping the statistics query.
+
     Args:
         project_id: Project identifier
+        response: Response whose caching headers are set
+        if_none_match: ETag from a previous status response
+        graph_service: Shared graph service
 
     Returns:
         ProjectStatusResponse with statistics and version
@@ -438,29 +891,43 @@ async def get_project_status(
     """
     logger.info("Retrieving project status: project_id=%s", project_id)
 
-    async with get_graph_service_context() as graph_service:
-        if not await graph_service.check_project_exists(project_id):
-            raise ProjectNotFoundError(project_id)
+    if if_none_match:
+        _, version, created_at = await graph_service.get_project_revision(project_id)
+        etag = project_status_etag(project_id, version, created_at)
+        if version and etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "no-cache"},
+            )
 
-        stats = await graph_service.get_project_statistics(project_id)
-        version = await graph_service.get_project_version(project_id)
+    exists, version, stats = await graph_service.get_project_version_and_stats(
+        project_id
+    )
+    if not exists:
+        raise ProjectNotFoundError(project_id)
 
-        logger.info(
-            "Project status retrieved: project_id=%s, files=%d, symbols=%d, version=%d",
-            project_id,
-            stats["total_files"],
-            stats["total_symbols"],
-            version,
-        )
+    logger.info(
+        "Project status retrieved: project_id=%s, files=%d, symbols=%d, version=%d",
+        project_id,
+        stats["total_files"],
+        stats["total_symbols"],
+        version,
+    )
 
-        return ProjectStatusResponse(
-            project_id=project_id,
-            status="active",
-            indexed_files=stats["total_files"],
-            indexed_symbols=stats["total_symbols"],
-            last_updated_at=datetime.now(UTC),
-            backend_version=version,
+    if version:
+        response.headers["ETag"] = project_status_etag(
+            project_id, version, stats["created_at"]
         )
+        response.headers["Cache-Control"] = "no-cache"
+
+    return ProjectStatusResponse(
+        project_id=project_id,
+        status="active",
+        indexed_files=stats["total_files"],
+        indexed_symbols=stats["total_symbols"],
+        last_updated_at=stats["last_updated_at"] or datetime.now(UTC),
+        backend_version=version,
+    )
 
 
 @router.delete(
@@ -473,7 +940,10 @@ async def get_project_status(
         503: {"description": "Database operation failed"},
     },
 )
-async def delete_project(project_id: str) -> None:
+async def delete_project(
+    project_id: str,
+    graph_service: GraphService = Depends(get_graph_service),
+) -> None:
     """
     Delete project and all associated data (symbols, relationships, metadata).
 
@@ -482,39 +952,39 @@ async def delete_project(project_id: str) -> None:
 
     Args:
         project_id: Unique project identifier
+        graph_service: Shared graph service
 
     Raises:
         HTTPException: 503 if database operation fails
     """
     logger.info("Deleting project: project_id=%s", project_id)
 
-    async with get_graph_service_context() as graph_service:
-        try:
-            deleted_count = await graph_service.delete_project(project_id)
-
-            if deleted_count > 0:
-                logger.info(
-                    "Project deleted successfully: project_id=%s, symbols_deleted=%d",
-                    project_id,
-                    deleted_count,
-                )
-            else:
-                logger.info(
-                    "Project already deleted or never existed: project_id=%s",
-                    project_id,
-                )
-
-            # Return 204 No Content (no response body)
-            return
-
-        except Exception as e:
-            logger.error(
-                "Failed to delete project: project_id=%s, error=%s",
+    try:
+        deleted_count = await graph_service.delete_project(project_id)
+
+        if deleted_count > 0:
+            logger.info(
+                "Project deleted successfully: project_id=%s, symbols_deleted=%d",
                 project_id,
-                str(e),
-                exc_info=True,
+                deleted_count,
             )
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Database operation failed during project deletion",
+        else:
+            logger.info(
+                "Project already deleted or never existed: project_id=%s",
+                project_id,
             )
+
+        # Return 204 No Content (no response body)
+        return
+
+    except Exception as e:
+        logger.error(
+            "Failed to delete project: project_id=%s, error=%s",
+            project_id,
+            str(e),
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database operation failed during project deletion",
+        )
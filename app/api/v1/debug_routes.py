@@ -6,10 +6,10 @@ Neo4j integration and performance.
 """
 
 import logging
-from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from app.api.v1.deps import get_graph_service
 from app.api.v1.schemas import (
     IngestSymbolsRequest,
     IngestSymbolsResponse,
@@ -23,35 +23,6 @@ router = APIRouter(prefix="/debug", tags=["debug"])
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def get_graph_service_context():
-    """
-    Async context manager for GraphService with proper resource cleanup.
-
-    Yields:
-        GraphService instance
-
-    Raises:
-        HTTPException: If service initialization fails
-    """
-    service = GraphService()
-
-    try:
-        await service.connect()
-        yield service
-    except Exception as e:
-        logger.error("Failed to initialize graph service: %s", e)
-        raise HTTPException(
-            status_code=503,
-            detail=f"Failed to initialize graph service: {str(e)}",
-        ) from e
-    finally:
-        try:
-            await service.close()
-        except Exception as e:
-            logger.warning("Error closing graph service: %s", e)
-
-
 @router.post(
     "/ingest-symbols",
     response_model=IngestSymbolsResponse,
@@ -59,6 +30,7 @@ async def get_graph_service_context():
 )
 async def ingest_symbols(
     request: IngestSymbolsRequest,
+    graph_service: GraphService = Depends(get_graph_service),
 ) -> IngestSymbolsResponse:
     """
     Ingest symbol information into Neo4j graph database.
@@ -69,6 +41,7 @@ async def ingest_symbols(
 
     Args:
         request: Symbol ingestion request with nodes and relationships
+        graph_service: Shared graph service
 
     Returns:
         Ingestion statistics including processing time
@@ -85,22 +58,18 @@ async def ingest_symbols(
             len(request.imports),
         )
 
-        async with get_graph_service_context() as graph_service:
-            # Ensure indexes exist
-            await graph_service.create_indexes()
-
-            # Convert Pydantic models to dictionaries
-            symbols = [symbol.model_dump() for symbol in request.symbols]
-            calls = [call.model_dump() for call in request.calls]
-            imports = [imp.model_dump() for imp in request.imports]
-
-            # Ingest symbols and relationships
-            stats = await graph_service.ingest_symbols(
-                symbols=symbols,
-                calls=calls,
-                imports=imports,
-                project_id=request.project_id,
-            )
+        await graph_service.ensure_indexes()
+
+        # Convert Pydantic models to dictionaries in a single serializer call
+        payload = request.model_dump(include={"symbols", "calls", "imports"})
+
+        # Ingest symbols and relationships
+        stats = await graph_service.ingest_symbols(
+            symbols=payload["symbols"],
+            calls=payload["calls"],
+            imports=payload["imports"],
+            project_id=request.project_id,
+        )
 
         logger.info(
             "Symbol ingestion completed: nodes=%d, relationships=%d, time_ms=%d",
@@ -134,6 +103,7 @@ async def query_function_dependencies(
     function_name: str,
     project_id: str = Query(default="test-project", description="Project identifier"),
     depth: int = Query(default=1, ge=1, le=3, description="Dependency depth (1-3)"),
+    graph_service: GraphService = Depends(get_graph_service),
 ) -> QueryFunctionResponse:
     """
     Query function and its dependencies from Neo4j graph.
@@ -147,6 +117,7 @@ async def query_function_dependencies(
         function_name: Name of the function to query
         project_id: Project identifier (defaults to 'test-project')
         depth: Traversal depth for dependencies (1-3)
+        graph_service: Shared graph service
 
     Returns:
         Function information with dependencies and query metrics
@@ -162,12 +133,11 @@ async def query_function_dependencies(
             depth,
         )
 
-        async with get_graph_service_context() as graph_service:
-            result = await graph_service.query_function_dependencies(
-                function_name=function_name,
-                project_id=project_id,
-                depth=depth,
-            )
+        result = await graph_service.query_function_dependencies(
+            function_name=function_name,
+            project_id=project_id,
+            depth=depth,
+        )
 
         # Check if function was found
         if result["function"] is None:
@@ -216,6 +186,7 @@ async def query_function_dependencies(
 async def query_function_callers(
     function_name: str,
     project_id: str = Query(default="test-project", description="Project identifier"),
+    graph_service: GraphService = Depends(get_graph_service),
 ) -> QueryCallersResponse:
     """
     Query functions that call the specified function (reverse dependencies).
@@ -228,6 +199,7 @@ async def query_function_callers(
     Args:
         function_name: Name of the function to query callers for
         project_id: Project identifier (defaults to 'test-project')
+        graph_service: Shared graph service
 
     Returns:
         Function information with list of callers and query metrics
@@ -242,11 +214,10 @@ async def query_function_callers(
             project_id,
         )
 
-        async with get_graph_service_context() as graph_service:
-            result = await graph_service.query_reverse_dependencies(
-                function_name=function_name,
-                project_id=project_id,
-            )
+        result = await graph_service.query_reverse_dependencies(
+            function_name=function_name,
+            project_id=project_id,
+        )
 
         # Check if function was found
         if result["function"] is None:
@@ -289,17 +260,21 @@ async def query_function_callers(
 
 
 @router.get("/health/neo4j")
-async def neo4j_health_check() -> dict:
+async def neo4j_health_check(
+    graph_service: GraphService = Depends(get_graph_service),
+) -> dict:
     """
     Health check endpoint for Neo4j connection.
 
+    Args:
+        graph_service: Shared graph service
+
     Returns:
         Status dictionary indicating Neo4j connectivity
     """
     try:
-        async with get_graph_service_context() as graph_service:
-            # Simple query to verify connectivity
-            await graph_service.client.execute_query("RETURN 1")
+        # Simple query to verify connectivity
+        await graph_service.client.execute_query("RETURN 1")
 
         return {
             "status": "healthy",
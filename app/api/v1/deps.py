@@ -0,0 +1,130 @@
+"""Shared FastAPI dependencies for API v1 routers."""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Type, TypeVar
+
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+from app.core.graph.graph_service import GraphService
+
+logger = logging.getLogger(__name__)
+
+BodyModel = TypeVar("BodyModel", bound=BaseModel)
+
+# Seconds to wait after a failed Neo4j connect before trying again
+GRAPH_RECONNECT_INTERVAL_S = 5.0
+
+
+async def get_graph_service(request: Request) -> GraphService:
+    """
+    Return the application-wide GraphService.
+
+    The service is created once at startup and its driver connection pool is
+    shared by all requests, so the driver handshake and index creation happen
+    once per process. If Neo4j was unreachable, connecting is retried at most
+    once per GRAPH_RECONNECT_INTERVAL_S; requests in between fail fast.
+
+    Args:
+        request: Incoming request, used to reach the application state
+
+    Returns:
+        Shared GraphService instance
+
+    Raises:
+        HTTPException: 503 if the graph database is unavailable
+    """
+    state = request.app.state
+    graph_service = getattr(state, "graph_service", None)
+    if graph_service is None:
+        graph_service = GraphService()
+        state.graph_service = graph_service
+
+    if graph_service.connected:
+        return graph_service
+
+    if time.monotonic() < getattr(state, "graph_reconnect_at", 0.0):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Graph database service unavailable",
+        )
+
+    try:
+        await graph_service.connect()
+    except Exception as e:
+        state.graph_reconnect_at = time.monotonic() + GRAPH_RECONNECT_INTERVAL_S
+        logger.error("Failed to initialize graph service: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Graph database service unavailable: {e}",
+        ) from e
+
+    return graph_service
+
+
+def json_body(model: Type[BodyModel]) -> Callable[[Request], Awaitable[BodyModel]]:
+    """
+    Build a dependency that validates the raw JSON body against a model.
+
+    FastAPI's default body handling decodes the JSON into Python objects and
+    then validates those. For endpoints that carry whole source files, the
+    dependency instead hands the raw bytes to model_validate_json so parsing
+    and validation happen in a single pass. Validation failures are raised as
+    RequestValidationError with "body" locations, so clients get the same 422
+    response as with a declared body parameter.
+
+    Args:
+        model: Request model to validate the body against
+
+    Returns:
+        Async dependency that returns the validated model instance
+    """
+
+    async def parse_body(request: Request) -> BodyModel:
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+            raise RequestValidationError(errors, body=body) from e
+
+    return parse_body
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Describe a json_body request body for the route's openapi_extra.
+
+    The model is not a declared parameter, so FastAPI does not add it to the
+    schema on its own. Nested models are inlined because they are not
+    registered as components.
+
+    Args:
+        model: Request model validated by json_body
+
+    Returns:
+        openapi_extra mapping with the requestBody entry
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None:
+                return inline(defs[ref.rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    }
@@ -7,14 +7,22 @@ dependency injection and resource management.
 import asyncio
 import logging
 import time
-from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import Any, Coroutine, Dict, Optional, Set, Tuple
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 from starlette.responses import Response as StarletteResponse
 
 from app.analyzers.rule_engine import RuleEngine
 from app.api.v1.debug_routes import router as debug_router
+from app.api.v1.deps import json_body, json_body_openapi
 from app.api.v1.schemas import (
     AsyncJobResponse,
     CoverageOptimizationRequest,
@@ -26,11 +34,11 @@ from app.api.v1.schemas import (
     TaskError,
     TaskStatusResponse,
 )
+from app.config import get_settings
 from app.core.analysis.llm_analyzer import LLMAnalyzer
 from app.core.analyzer import ImpactAnalyzer, TestAnalyzer
-from app.core.constants import MAX_FILES_PER_REQUEST
 from app.core.graph.graph_service import GraphService
-from app.core.llm.llm_client import create_llm_client
+from app.core.llm.llm_client import LLMClient, create_llm_client
 from app.core.services.quality_service import QualityAnalysisService
 from app.core.tasks.tasks import (
     TaskStatus,
@@ -38,147 +46,323 @@ from app.core.tasks.tasks import (
     execute_coverage_optimization_task,
     execute_generate_tests_task,
     get_task,
-    update_task_status,
 )
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Strong references to running background tasks, so they are not collected
+_background_tasks: Set[asyncio.Task] = set()
+
 
-@asynccontextmanager
-async def get_analyzer_context():
+def get_background_semaphore(app: FastAPI) -> asyncio.Semaphore:
     """
-    Async context manager for TestAnalyzer with proper resource cleanup.
+    Return the semaphore bounding how many background tasks run at once.
 
-    This ensures LLM clients are properly closed after use, preventing
-    resource leaks.
+    The lifespan creates it on app.state; apps started without the lifespan
+    (e.g. in tests) get one on first use.
 
-    Yields:
-        TestAnalyzer instance
+    Args:
+        app: Application whose state holds the semaphore
 
-    Raises:
-        HTTPException: If analyzer initialization fails
+    Returns:
+        Semaphore with ``max_background_tasks`` slots
     """
+    semaphore = getattr(app.state, "background_semaphore", None)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().max_background_tasks)
+        app.state.background_semaphore = semaphore
+    return semaphore
+
+
+async def _run_background_task(
+    task_id: str, coro: Coroutine[Any, Any, None], semaphore: asyncio.Semaphore
+) -> None:
+    """Run a task coroutine once a slot is free, logging anything it raises."""
     try:
-        rule_engine = RuleEngine()
-        llm_client = create_llm_client()
-        llm_analyzer = LLMAnalyzer(llm_client)
-        analyzer = TestAnalyzer(rule_engine, llm_analyzer)
+        async with semaphore:
+            await coro
+    except Exception:
+        logger.exception("Background task crashed: task_id=%s", task_id)
+    finally:
+        # Avoid a "never awaited" warning if cancelled while waiting for a slot
+        coro.close()
 
-        try:
-            yield analyzer
-        finally:
-            await analyzer.close()
 
-    except Exception as e:
-        logger.error(f"Failed to initialize analyzer: {e}")
-        raise HTTPException(
-            status_code=503, detail=f"Failed to initialize analyzer: {str(e)}"
-        )
+def launch_background_task(
+    app: FastAPI, task_id: str, coro: Coroutine[Any, Any, None]
+) -> None:
+    """
+    Schedule a task coroutine on the bounded background pool.
 
+    At most ``max_background_tasks`` coroutines run at once; the rest
+    wait for a slot. A reference is kept until the task finishes.
 
-@asynccontextmanager
-async def get_quality_service_context():
+    Args:
+        app: Application whose background semaphore bounds the task
+        task_id: Task identifier, used for logging
+        coro: Coroutine executing the task
     """
-    Async context manager for QualityAnalysisService with proper resource cleanup.
+    task = asyncio.create_task(
+        _run_background_task(task_id, coro, get_background_semaphore(app))
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
-    This ensures LLM clients are properly closed after use.
 
-    Yields:
-        QualityAnalysisService instance
+def get_shared_analysis_resources(
+    http_request: Request,
+) -> Tuple[Optional[RuleEngine], Optional[LLMClient]]:
+    """
+    Return the process-wide RuleEngine and LLM client created at startup.
 
-    Raises:
-        HTTPException: If service initialization fails
+    Args:
+        http_request: Incoming request, used to reach the application state
+
+    Returns:
+        Tuple of (rule engine, LLM client); either is None when the app was
+        started without the lifespan (e.g. in tests)
     """
-    try:
-        service = QualityAnalysisService()
+    state = http_request.app.state
+    return getattr(state, "rule_engine", None), getattr(state, "llm_client", None)
 
-        try:
-            yield service
-        finally:
-            await service.close()
 
-    except Exception as e:
-        logger.error(f"Failed to initialize quality service: {e}")
-        raise HTTPException(
-            status_code=503, detail=f"Failed to initialize quality service: {str(e)}"
-        )
+class _AnalyzerContext:
+    """Async context manager yielding a TestAnalyzer; see get_analyzer_context."""
 
+    __slots__ = ("_rule_engine", "_llm_client", "_analyzer")
 
-@asynccontextmanager
-async def get_impact_analyzer_context(
-    project_id: str = "default",
-    use_graph: bool = True,
-):
-    """
-    Async context manager for ImpactAnalyzer with GraphService integration.
+    def __init__(
+        self,
+        rule_engine: Optional[RuleEngine],
+        llm_client: Optional[LLMClient],
+    ):
+        self._rule_engine = rule_engine
+        self._llm_client = llm_client
+        self._analyzer: Optional[TestAnalyzer] = None
 
-    This context manager initializes the ImpactAnalyzer with a GraphService
-    for graph-based dependency analysis. If Neo4j is unavailable, the analyzer
-    will raise an appropriate error.
+    async def __aenter__(self) -> TestAnalyzer:
+        try:
+            rule_engine = self._rule_engine or RuleEngine(
+                feature_cache_dir=get_settings().rule_feature_cache_dir
+            )
+            llm_analyzer = LLMAnalyzer(self._llm_client or create_llm_client())
+            self._analyzer = TestAnalyzer(rule_engine, llm_analyzer)
+        except Exception as e:
+            logger.error("Failed to initialize analyzer: %s", e)
+            raise HTTPException(
+                status_code=503, detail=f"Failed to initialize analyzer: {str(e)}"
+            )
+        return self._analyzer
 
-    Args:
-        project_id: Project identifier for graph queries
-        use_graph: Whether to use graph-based analysis (default True)
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._llm_client is None:
+            await self._analyzer.close()
 
-    Yields:
-        ImpactAnalyzer instance with GraphService
 
-    Raises:
-        HTTPException: If analyzer or graph service initialization fails
-    """
-    graph_service = None
+class _QualityServiceContext:
+    """Async context manager yielding a QualityAnalysisService."""
 
-    try:
-        rule_engine = RuleEngine()
-        llm_client = create_llm_client()
-        llm_analyzer = LLMAnalyzer(llm_client)
+    __slots__ = ("_rule_engine", "_llm_client", "_service")
 
-        if use_graph:
-            graph_service = GraphService()
-            try:
-                await graph_service.connect()
-                logger.debug("GraphService connected for impact analysis")
-            except Exception as e:
-                logger.error("Failed to connect to Neo4j: %s", e)
-                raise HTTPException(
-                    status_code=503,
-                    detail="Graph database unavailable for impact analysis",
+    def __init__(
+        self,
+        rule_engine: Optional[RuleEngine],
+        llm_client: Optional[LLMClient],
+    ):
+        self._rule_engine = rule_engine
+        self._llm_client = llm_client
+        self._service: Optional[QualityAnalysisService] = None
+
+    async def __aenter__(self) -> QualityAnalysisService:
+        try:
+            if self._rule_engine is None and self._llm_client is None:
+                self._service = QualityAnalysisService()
+            else:
+                self._service = QualityAnalysisService(
+                    test_analyzer=TestAnalyzer(
+                        self._rule_engine
+                        or RuleEngine(
+                            feature_cache_dir=get_settings().rule_feature_cache_dir
+                        ),
+                        LLMAnalyzer(self._llm_client or create_llm_client()),
+                    )
                 )
+        except Exception as e:
+            logger.error("Failed to initialize quality service: %s", e)
+            raise HTTPException(
+                status_code=503,
+                detail=f"Failed to initialize quality service: {str(e)}",
+            )
+        return self._service
 
-        analyzer = ImpactAnalyzer(
-            rule_engine,
-            llm_analyzer,
-            graph_service=graph_service,
-            project_id=project_id,
-        )
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._llm_client is None:
+            await self._service.close()
+
+
+class _ImpactAnalyzerContext:
+    """Async context manager yielding an ImpactAnalyzer with GraphService."""
+
+    __slots__ = (
+        "_project_id",
+        "_use_graph",
+        "_rule_engine",
+        "_llm_client",
+        "_graph_service",
+        "_owns_graph_service",
+        "_analyzer",
+    )
 
+    def __init__(
+        self,
+        project_id: str,
+        use_graph: bool,
+        rule_engine: Optional[RuleEngine],
+        llm_client: Optional[LLMClient],
+        graph_service: Optional[GraphService],
+    ):
+        self._project_id = project_id
+        self._use_graph = use_graph
+        self._rule_engine = rule_engine
+        self._llm_client = llm_client
+        self._graph_service = graph_service if use_graph else None
+        self._owns_graph_service = graph_service is None
+        self._analyzer: Optional[ImpactAnalyzer] = None
+
+    async def __aenter__(self) -> ImpactAnalyzer:
         try:
-            yield analyzer
-        finally:
-            # Close LLM analyzer
-            if hasattr(analyzer, "llm_analyzer") and hasattr(
-                analyzer.llm_analyzer, "close"
+            rule_engine = self._rule_engine or RuleEngine(
+                feature_cache_dir=get_settings().rule_feature_cache_dir
+            )
+            llm_analyzer = LLMAnalyzer(self._llm_client or create_llm_client())
+
+            if self._use_graph:
+                if self._owns_graph_service:
+                    self._graph_service = GraphService()
+                try:
+                    await self._graph_service.connect()
+                    logger.debug("GraphService connected for impact analysis")
+                except Exception as e:
+                    logger.error("Failed to connect to Neo4j: %s", e)
+                    raise HTTPException(
+                        status_code=503,
+                        detail="Graph database unavailable for impact analysis",
+                    )
+
+            self._analyzer = ImpactAnalyzer(
+                rule_engine,
+                llm_analyzer,
+                graph_service=self._graph_service,
+                project_id=self._project_id,
+            )
+        except HTTPException:
+            await self._close_graph_service()
+            raise
+        except Exception as e:
+            await self._close_graph_service()
+            logger.error("Failed to initialize impact analyzer: %s", e)
+            raise HTTPException(
+                status_code=503,
+                detail=f"Failed to initialize impact analyzer: {str(e)}",
+            )
+        return self._analyzer
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        try:
+            # Close LLM analyzer unless its client is shared
+            if (
+                self._llm_client is None
+                and hasattr(self._analyzer, "llm_analyzer")
+                and hasattr(self._analyzer.llm_analyzer, "close")
             ):
-                await analyzer.llm_analyzer.close()
+                await self._analyzer.llm_analyzer.close()
+        finally:
+            await self._close_graph_service()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to initialize impact analyzer: %s", e)
-        raise HTTPException(
-            status_code=503, detail=f"Failed to initialize impact analyzer: {str(e)}"
-        )
-    finally:
-        # Always close graph service if it was created
-        if graph_service is not None:
+    async def _close_graph_service(self) -> None:
+        """Close the graph service if it was created by this context."""
+        if self._owns_graph_service and self._graph_service is not None:
             try:
-                await graph_service.close()
+                await self._graph_service.close()
                 logger.debug("GraphService closed")
             except Exception as e:
                 logger.warning("Error closing graph service: %s", e)
 
 
+def get_analyzer_context(
+    rule_engine: Optional[RuleEngine] = None,
+    llm_client: Optional[LLMClient] = None,
+) -> _AnalyzerContext:
+    """
+    Async context manager for TestAnalyzer with proper resource cleanup.
+
+    Shared resources are reused as-is. An LLM client created here is closed
+    on exit, preventing resource leaks; a shared one is left open.
+
+    Args:
+        rule_engine: Optional shared RuleEngine
+        llm_client: Optional shared LLM client
+
+    Returns:
+        Context manager yielding a TestAnalyzer; entering it raises
+        HTTPException (503) if analyzer initialization fails
+    """
+    return _AnalyzerContext(rule_engine, llm_client)
+
+
+def get_quality_service_context(
+    rule_engine: Optional[RuleEngine] = None,
+    llm_client: Optional[LLMClient] = None,
+) -> _QualityServiceContext:
+    """
+    Async context manager for QualityAnalysisService with proper resource cleanup.
+
+    Shared resources are reused as-is. An LLM client created here is closed
+    on exit; a shared one is left open.
+
+    Args:
+        rule_engine: Optional shared RuleEngine
+        llm_client: Optional shared LLM client
+
+    Returns:
+        Context manager yielding a QualityAnalysisService; entering it raises
+        HTTPException (503) if service initialization fails
+    """
+    return _QualityServiceContext(rule_engine, llm_client)
+
+
+def get_impact_analyzer_context(
+    project_id: str = "default",
+    use_graph: bool = True,
+    rule_engine: Optional[RuleEngine] = None,
+    llm_client: Optional[LLMClient] = None,
+    graph_service: Optional[GraphService] = None,
+) -> _ImpactAnalyzerContext:
+    """
+    Async context manager for ImpactAnalyzer with GraphService integration.
+
+    This context manager initializes the ImpactAnalyzer with a GraphService
+    for graph-based dependency analysis. If Neo4j is unavailable, the analyzer
+    will raise an appropriate error.
+
+    Args:
+        project_id: Project identifier for graph queries
+        use_graph: Whether to use graph-based analysis (default True)
+        rule_engine: Optional shared RuleEngine
+        llm_client: Optional shared LLM client, left open on exit
+        graph_service: Optional shared GraphService; connected if needed and
+            left open on exit. Without it a service is created and closed.
+
+    Returns:
+        Context manager yielding an ImpactAnalyzer; entering it raises
+        HTTPException (503) if analyzer or graph service initialization fails
+    """
+    return _ImpactAnalyzerContext(
+        project_id, use_graph, rule_engine, llm_client, graph_service
+    )
+
+
 # Backward compatibility functions for dependency injection (used by tests)
 def get_quality_service() -> QualityAnalysisService:
     """
@@ -196,7 +380,7 @@ def get_impact_analyzer() -> ImpactAnalyzer:
     Kept for backward compatibility with existing tests.
     Note: Returns analyzer without GraphService (heuristic-only mode).
     """
-    rule_engine = RuleEngine()
+    rule_engine = RuleEngine(feature_cache_dir=get_settings().rule_feature_cache_dir)
     llm_client = create_llm_client()
     llm_analyzer = LLMAnalyzer(llm_client)
     return ImpactAnalyzer(rule_engine, llm_analyzer, graph_service=None)
@@ -206,18 +390,21 @@ def get_impact_analyzer() -> ImpactAnalyzer:
     "/workflows/generate-tests",
     response_model=AsyncJobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=json_body_openapi(GenerateTestsRequest),
 )
 async def submit_generate_tests(
-    request: GenerateTestsRequest,
+    http_request: Request,
+    request: GenerateTestsRequest = Depends(json_body(GenerateTestsRequest)),
 ) -> AsyncJobResponse:
     """
     Submit a test generation request and return an async task identifier.
-    Uses asyncio.create_task to run the generation in the background.
+    Runs the generation on the bounded background task pool.
     Supports debug_options for simulating failures (development/testing only).
     """
     try:
-        # Convert request to dict for task payload
-        task_payload = request.model_dump()
+        # Convert request to dict once; the task store and executor share it.
+        # debug_options only steers this handler, so it is not persisted.
+        task_payload = request.model_dump(exclude={"debug_options"})
 
         logger.info(
             "Received test generation request: source_code_length=%d, has_description=%s, has_existing_tests=%s",
@@ -225,7 +412,12 @@ async def submit_generate_tests(
             request.user_description is not None,
             request.existing_test_code is not None,
         )
-        logger.debug("Request payload: %s", task_payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request payload size: source_code=%d, existing_test_code=%d",
+                len(request.source_code),
+                len(request.existing_test_code or ""),
+            )
 
         # Check for debug options to simulate task failure
         if request.debug_options and request.debug_options.simulate_error:
@@ -234,12 +426,11 @@ async def submit_generate_tests(
                 request.debug_options.error_message,
             )
 
-            # Create task in PENDING state
-            task_id = await create_task(task_payload)
-
-            # Immediately mark as FAILED with custom error
-            await update_task_status(
-                task_id, TaskStatus.FAILED, error=request.debug_options.error_message
+            # Store the task directly as FAILED with the custom error
+            task_id = await create_task(
+                task_payload,
+                status=TaskStatus.FAILED,
+                error=request.debug_options.error_message,
             )
 
             # Return task_id immediately (task is already failed)
@@ -253,8 +444,13 @@ async def submit_generate_tests(
         task_id = await create_task(task_payload)
         logger.debug("Created task with ID: %s", task_id)
 
-        # Launch background task using asyncio instead of Celery
-        asyncio.create_task(execute_generate_tests_task(task_id, task_payload))
+        # Launch background task on the bounded pool instead of Celery
+        _, llm_client = get_shared_analysis_resources(http_request)
+        launch_background_task(
+            http_request.app,
+            task_id,
+            execute_generate_tests_task(task_id, task_payload, llm_client=llm_client),
+        )
         logger.info("Launched background task for test generation: task_id=%s", task_id)
 
         # Return AsyncJobResponse per OpenAPI spec
@@ -277,18 +473,23 @@ async def submit_generate_tests(
     "/optimization/coverage",
     response_model=AsyncJobResponse,
     status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=json_body_openapi(CoverageOptimizationRequest),
 )
 async def submit_coverage_optimization(
-    request: CoverageOptimizationRequest,
+    http_request: Request,
+    request: CoverageOptimizationRequest = Depends(
+        json_body(CoverageOptimizationRequest)
+    ),
 ) -> AsyncJobResponse:
     """
     Submit a coverage optimization request and return an async task identifier.
-    Uses asyncio.create_task to run the optimization in the background.
+    Runs the optimization on the bounded background task pool.
     Supports debug_options for simulating failures (development/testing only).
     """
     try:
-        # Convert request to dict for task payload
-        task_payload = request.model_dump()
+        # Convert request to dict once; the task store and executor share it.
+        # debug_options only steers this handler, so it is not persisted.
+        task_payload = request.model_dump(exclude={"debug_options"})
 
         logger.info(
             "Received coverage optimization request: source_code_length=%d, uncovered_ranges=%d, framework=%s",
@@ -296,7 +497,12 @@ async def submit_coverage_optimization(
             len(request.uncovered_ranges),
             request.framework,
         )
-        logger.debug("Request payload: %s", task_payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request payload size: source_code=%d, existing_test_code=%d",
+                len(request.source_code),
+                len(request.existing_test_code or ""),
+            )
 
         # Check for debug options to simulate task failure
         if request.debug_options and request.debug_options.simulate_error:
@@ -305,10 +511,11 @@ async def submit_coverage_optimization(
                 request.debug_options.error_message,
             )
 
-            # Create and immediately fail the task
-            task_id = await create_task(task_payload)
-            await update_task_status(
-                task_id, TaskStatus.FAILED, error=request.debug_options.error_message
+            # Store the task directly as FAILED with the custom error
+            task_id = await create_task(
+                task_payload,
+                status=TaskStatus.FAILED,
+                error=request.debug_options.error_message,
             )
 
             return AsyncJobResponse(
@@ -321,8 +528,15 @@ async def submit_coverage_optimization(
         task_id = await create_task(task_payload)
         logger.debug("Created task with ID: %s", task_id)
 
-        # Launch background task using asyncio
-        asyncio.create_task(execute_coverage_optimization_task(task_id, task_payload))
+        # Launch background task on the bounded pool
+        _, llm_client = get_shared_analysis_resources(http_request)
+        launch_background_task(
+            http_request.app,
+            task_id,
+            execute_coverage_optimization_task(
+                task_id, task_payload, llm_client=llm_client
+            ),
+        )
         logger.info(
             "Launched background task for coverage optimization: task_id=%s", task_id
         )
@@ -373,21 +587,24 @@ async def get_task_status(task_id: str) -> TaskStatusResponse | StarletteRespons
         logger.debug("Task not found: task_id=%s", task_id)
         return StarletteResponse(status_code=404)
 
-    # Convert task data to TaskStatusResponse
+    # Convert task data to TaskStatusResponse. The task store only holds data
+    # written by this service, so validation is skipped on this polling path.
     error = None
     if task_data.get("error"):
         error_data = task_data["error"]
         # Handle both dict (new format) and string (legacy format)
         if isinstance(error_data, dict):
             # Extract fields explicitly to avoid issues with polluted data
-            error = TaskError(
+            error = TaskError.model_construct(
                 message=error_data.get("message", "Unknown error"),
                 code=error_data.get("code"),
                 details=error_data.get("details"),
             )
         else:
             # Legacy string format fallback
-            error = TaskError(message=str(error_data), code=None, details=None)
+            error = TaskError.model_construct(
+                message=str(error_data), code=None, details=None
+            )
 
     logger.info(
         "Returning task status: task_id=%s, status=%s, has_result=%s, has_error=%s",
@@ -397,7 +614,7 @@ async def get_task_status(task_id: str) -> TaskStatusResponse | StarletteRespons
         error is not None,
     )
 
-    return TaskStatusResponse(
+    return TaskStatusResponse.model_construct(
         task_id=task_data["id"],
         status=task_data["status"],
         result=task_data.get("result"),
@@ -406,9 +623,14 @@ async def get_task_status(task_id: str) -> TaskStatusResponse | StarletteRespons
     )
 
 
-@router.post("/quality/analyze", response_model=QualityAnalysisResponse)
+@router.post(
+    "/quality/analyze",
+    response_model=QualityAnalysisResponse,
+    openapi_extra=json_body_openapi(QualityAnalysisRequest),
+)
 async def analyze_quality(
-    request: QualityAnalysisRequest,
+    http_request: Request,
+    request: QualityAnalysisRequest = Depends(json_body(QualityAnalysisRequest)),
 ) -> QualityAnalysisResponse:
     """
     Analyze multiple test files for quality issues with fix suggestions.
@@ -418,6 +640,7 @@ async def analyze_quality(
 
     Args:
         request: Quality analysis request containing files and mode
+        http_request: Incoming request, used to reach shared resources
 
     Returns:
         Quality analysis response with issues and summary statistics
@@ -425,46 +648,39 @@ async def analyze_quality(
     Raises:
         HTTPException: If analysis fails or request is invalid
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
-        # Validate request
-        if not request.files:
-            raise HTTPException(
-                status_code=400, detail="No files provided for analysis"
-            )
-
-        if len(request.files) > MAX_FILES_PER_REQUEST:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Too many files (max {MAX_FILES_PER_REQUEST})",
-            )
-
         logger.info(
             "Starting quality analysis: %d files, mode=%s",
             len(request.files),
             request.mode,
         )
-        logger.debug(
-            "Quality analysis request received for files: %s",
-            [f.path for f in request.files],
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Quality analysis request received for files: %s",
+                [f.path for f in request.files],
+            )
 
         # Use context manager for proper resource management
-        async with get_quality_service_context() as quality_service:
+        rule_engine, llm_client = get_shared_analysis_resources(http_request)
+        async with get_quality_service_context(
+            rule_engine=rule_engine, llm_client=llm_client
+        ) as quality_service:
             result = await quality_service.analyze_batch(
                 files=request.files, mode=request.mode
             )
 
         # Calculate endpoint duration
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         # Log endpoint-level response summary with metrics
+        summary = result.summary
         logger.info(
             "Quality analysis completed: issues=%d, critical=%d, files=%d, mode=%s, duration_ms=%d",
-            len(result.issues) if result.issues else 0,
-            result.summary.critical_issues,
-            result.summary.total_files,
+            summary.total_issues,
+            summary.critical_issues,
+            summary.total_files,
             request.mode,
             duration_ms,
         )
@@ -475,10 +691,10 @@ async def analyze_quality(
         # Re-raise HTTP exceptions as-is
         raise
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Quality analysis failed: {e}", exc_info=True)
+        logger.error("Quality analysis failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail="Quality analysis failed due to internal error"
         )
@@ -487,6 +703,7 @@ async def analyze_quality(
 @router.post("/analysis/impact", response_model=ImpactAnalysisResponse)
 async def analyze_impact(
     request: ImpactAnalysisRequest,
+    http_request: Request,
 ) -> ImpactAnalysisResponse:
     """
     Analyze the impact of file changes on test files using graph-based analysis.
@@ -498,6 +715,7 @@ async def analyze_impact(
 
     Args:
         request: Impact analysis request containing project context
+        http_request: Incoming request, used to reach shared resources
 
     Returns:
         Impact analysis response with impacted tests and suggested actions
@@ -518,22 +736,24 @@ async def analyze_impact(
             len(request.project_context.related_tests),
             request.project_id,
         )
-        logger.debug(
-            "Changed files: %s",
-            [entry.path for entry in request.project_context.files_changed],
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Changed files: %s",
+                [entry.path for entry in request.project_context.files_changed],
+            )
 
-        # Extract data from request
-        files_changed = [
-            {"path": entry.path, "change_type": entry.change_type}
-            for entry in request.project_context.files_changed
-        ]
+        # The analyzer reads the FileChangeEntry models directly
+        files_changed = request.project_context.files_changed
         related_tests = request.project_context.related_tests
 
         # Use context manager for proper resource management with GraphService
+        rule_engine, llm_client = get_shared_analysis_resources(http_request)
         async with get_impact_analyzer_context(
             project_id=request.project_id,
             use_graph=True,
+            rule_engine=rule_engine,
+            llm_client=llm_client,
+            graph_service=getattr(http_request.app.state, "graph_service", None),
         ) as impact_analyzer:
             result = await impact_analyzer.analyze_impact_async(
                 files_changed,
@@ -543,7 +763,7 @@ async def analyze_impact(
 
         logger.info(
             "Impact analysis completed: %d impacted tests found",
-            len(result.impacted_tests) if result.impacted_tests else 0,
+            len(result.impacted_tests or ()),
         )
 
         return result
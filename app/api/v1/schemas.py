@@ -1,14 +1,36 @@
 """Pydantic models for API v1."""
 
-from typing import Any, Dict, List, Literal, Optional, Union
+import sys
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, model_serializer
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    model_serializer,
+)
+
+from app.core.constants import MAX_FILES_PER_REQUEST
+
+# Literal value sets shared by several models
+IssueSeverity = Literal["error", "warning", "info"]
+ImpactSeverity = Literal["high", "medium", "low", "informational", "none"]
+
+# File paths repeat across many issues of one response; interning lets the
+# copies share one string object
+InternedPath = Annotated[str, AfterValidator(sys.intern)]
+
+# Constrained scalar types shared by several fields
+LineNumber = Annotated[int, Field(ge=1)]
 
 
 class FileInput(BaseModel):
     """Individual test file to analyze."""
 
-    path: str = Field(description="File path relative to project root")
+    path: InternedPath = Field(description="File path relative to project root")
     content: str = Field(
         min_length=1, description="Full file content (cannot be empty)"
     )
@@ -35,12 +57,10 @@ class IssueSuggestion(BaseModel):
 class Issue(BaseModel):
     """Detected test quality issue."""
 
-    file: str = Field(description="File path where issue was detected")
+    file: InternedPath = Field(description="File path where issue was detected")
     line: int = Field(description="Line number of the issue")
     column: int = Field(description="Column number of the issue")
-    severity: Literal["error", "warning", "info"] = Field(
-        description="Issue severity level"
-    )
+    severity: IssueSeverity = Field(description="Issue severity level")
     type: str = Field(
         description="Issue type (e.g., 'redundant-assertion', 'missing-assertion')"
     )
@@ -52,6 +72,8 @@ class Issue(BaseModel):
         default=None, description="Fix suggestion for the issue"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class AnalysisMetrics(BaseModel):
     """Analysis statistics."""
@@ -166,6 +188,8 @@ class CoverageUncoveredRange(BaseModel):
     end_line: int = Field(description="End line number of uncovered range")
     type: Literal["line", "branch"] = Field(description="Type of coverage gap")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CoverageOptimizationRequest(BaseModel):
     """Request payload for Feature 2 workflow: coverage optimization."""
@@ -196,6 +220,8 @@ class CoverageOptimizationTest(BaseModel):
     scenario_description: str = Field(description="Description of the test scenario")
     expected_coverage_impact: str = Field(description="Expected impact on coverage")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CoverageOptimizationResult(BaseModel):
     """Result structure for completed coverage optimization tasks."""
@@ -205,6 +231,26 @@ class CoverageOptimizationResult(BaseModel):
     )
 
 
+def _task_result_kind(value: Any) -> str:
+    """Pick the TaskResult member from the shape of the result payload."""
+    if isinstance(value, CoverageOptimizationResult):
+        return "coverage_optimization"
+    if isinstance(value, dict) and "recommended_tests" in value:
+        return "coverage_optimization"
+    return "generate_tests"
+
+
+# Tagged by result shape rather than a "kind" field, so the wire format is
+# unchanged while validation dispatches to one member instead of trying each
+TaskResult = Annotated[
+    Union[
+        Annotated[GenerateTestsResult, Tag("generate_tests")],
+        Annotated[CoverageOptimizationResult, Tag("coverage_optimization")],
+    ],
+    Discriminator(_task_result_kind),
+]
+
+
 class TaskStatusResponse(BaseModel):
     """Task status response for polling endpoints.
 
@@ -219,7 +265,7 @@ class TaskStatusResponse(BaseModel):
         default=None,
         description="Task creation timestamp (ISO 8601 format)",
     )
-    result: Optional[Union[GenerateTestsResult, CoverageOptimizationResult]] = Field(
+    result: Optional[TaskResult] = Field(
         default=None,
         description="Task result (GenerateTestsResult for Feature 1, CoverageOptimizationResult for Feature 2). Only present when status=completed.",
     )
@@ -269,7 +315,9 @@ class TaskStatusResponse(BaseModel):
 class FileChangeEntry(BaseModel):
     """File change entry within project_context.files_changed."""
 
-    path: str = Field(description="Path to changed file relative to project root")
+    path: InternedPath = Field(
+        description="Path to changed file relative to project root"
+    )
     change_type: Literal["added", "modified", "removed"] = Field(
         default="modified",
         description="Type of change: added, modified, or removed",
@@ -290,17 +338,21 @@ class ProjectImpactContext(BaseModel):
 class ImpactItem(BaseModel):
     """Individual impact analysis item."""
 
-    test_path: str = Field(description="Path to potentially impacted test file")
+    test_path: InternedPath = Field(
+        description="Path to potentially impacted test file"
+    )
     impact_score: float = Field(
         default=0.0, ge=0.0, le=1.0, description="Impact score from 0.0 to 1.0"
     )
-    severity: Literal["high", "medium", "low", "informational", "none"] = Field(
+    severity: ImpactSeverity = Field(
         default="none", description="Impact severity level"
     )
     reasons: List[str] = Field(
         default=[], description="List of reasons for the impact assessment"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ImpactAnalysisRequest(BaseModel):
     """Request payload for /analysis/impact endpoint."""
@@ -324,7 +376,7 @@ class ImpactAnalysisResponse(BaseModel):
     impacted_tests: List[ImpactItem] = Field(
         description="List of test files that may be impacted by the changes"
     )
-    severity: Literal["high", "medium", "low", "informational", "none"] = Field(
+    severity: ImpactSeverity = Field(
         default="none", description="Overall impact severity level"
     )
     suggested_action: Literal["run-all-tests", "run-affected-tests", "no-action"] = (
@@ -344,7 +396,9 @@ class QualityAnalysisRequest(BaseModel):
     """Request payload for /quality/analyze endpoint."""
 
     files: List[FileInput] = Field(
-        description="List of files to analyze for quality issues"
+        min_length=1,
+        max_length=MAX_FILES_PER_REQUEST,
+        description="List of files to analyze for quality issues",
     )
     mode: Literal["fast", "deep", "hybrid"] = Field(
         default="hybrid",
@@ -367,12 +421,10 @@ class FixSuggestion(BaseModel):
 class QualityIssue(BaseModel):
     """Detected quality issue in test code."""
 
-    file_path: str = Field(description="File path where issue was detected")
+    file_path: InternedPath = Field(description="File path where issue was detected")
     line: int = Field(description="1-based line number of the issue")
     column: int = Field(default=0, description="Column number of the issue")
-    severity: Literal["error", "warning", "info"] = Field(
-        description="Issue severity level"
-    )
+    severity: IssueSeverity = Field(description="Issue severity level")
     code: str = Field(description="Issue code identifier (e.g., 'redundant-assertion')")
     message: str = Field(description="Human-readable issue description")
     detected_by: Literal["rule", "llm"] = Field(description="Detection method used")
@@ -380,6 +432,8 @@ class QualityIssue(BaseModel):
         default=None, description="Fix suggestion for the issue"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class QualitySummary(BaseModel):
     """Summary statistics for quality analysis."""
@@ -419,8 +473,8 @@ class SymbolNode(BaseModel):
         description="Function/method signature with parameters",
     )
     file_path: str = Field(description="File path where symbol is defined")
-    line_start: int = Field(description="Starting line number", ge=1)
-    line_end: int = Field(description="Ending line number", ge=1)
+    line_start: LineNumber = Field(description="Starting line number")
+    line_end: LineNumber = Field(description="Ending line number")
 
 
 class CallRelationship(BaseModel):
@@ -428,7 +482,7 @@ class CallRelationship(BaseModel):
 
     caller_qualified_name: str = Field(description="Qualified name of the caller")
     callee_qualified_name: str = Field(description="Qualified name of the callee")
-    line: int = Field(description="Line number where call occurs", ge=1)
+    line: LineNumber = Field(description="Line number where call occurs")
 
 
 class ImportRelationship(BaseModel):
@@ -1,6 +1,10 @@
 """Configuration management for LLT Assistant Backend."""
 
-from pydantic import Field
+import re
+from functools import cached_property, lru_cache
+from typing import FrozenSet, Optional
+
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings
 
 
@@ -43,6 +47,14 @@ class Settings(BaseSettings):
         validation_alias="LLM_MAX_CONCURRENT_CALLS",
         description="Maximum concurrent LLM API calls for parallelization",
     )
+    max_background_tasks: int = Field(
+        default=10,
+        ge=1,
+        description=(
+            "Maximum test generation / coverage optimization tasks running "
+            "at once; further submissions wait for a free slot"
+        ),
+    )
 
     # Analysis Configuration
     max_file_size: int = Field(
@@ -51,6 +63,13 @@ class Settings(BaseSettings):
     max_files_per_request: int = Field(
         default=50, description="Maximum files per analysis request"
     )
+    rule_feature_cache_dir: str | None = Field(
+        default=None,
+        description=(
+            "Directory for caching names extracted from test function bodies "
+            "across runs (disabled when unset)"
+        ),
+    )
 
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
@@ -100,12 +119,42 @@ class Settings(BaseSettings):
     )
     neo4j_max_connection_pool_size: int = Field(
         default=50,
-        description="Max connection pool size",
+        ge=1,
+        validation_alias=AliasChoices(
+            "NEO4J_MAX_POOL_SIZE", "NEO4J_MAX_CONNECTION_POOL_SIZE"
+        ),
+        description="Max connection pool size of the shared driver",
     )
-    neo4j_connection_acquisition_timeout: int = Field(
+    neo4j_connection_acquisition_timeout: float = Field(
         default=60,
-        description="Connection acquisition timeout in seconds",
-    )
+        gt=0,
+        validation_alias=AliasChoices(
+            "NEO4J_ACQUISITION_TIMEOUT_S", "NEO4J_CONNECTION_ACQUISITION_TIMEOUT"
+        ),
+        description="Seconds to wait for a free pooled connection",
+    )
+
+    @cached_property
+    def cors_origin_set(self) -> FrozenSet[str]:
+        """Exact CORS origins, including "*" when all origins are allowed."""
+        return frozenset(
+            origin for origin in self.cors_origins if origin == "*" or "*" not in origin
+        )
+
+    @cached_property
+    def cors_origin_regex(self) -> Optional[str]:
+        """Single regex for wildcard CORS origins such as https://*.example.com.
+
+        Each "*" matches one or more characters other than "/", so a wildcard
+        never spans into the path. Returns None when there are no wildcard
+        origins.
+        """
+        patterns = [
+            "[^/]+".join(re.escape(part) for part in origin.split("*"))
+            for origin in self.cors_origins
+            if origin != "*" and "*" in origin
+        ]
+        return "|".join(patterns) or None
 
     model_config = {
         "env_file": ".env",
@@ -116,19 +165,16 @@ class Settings(BaseSettings):
     }
 
 
-# Global settings instance
-# NOTE: This is a singleton for configuration only, which is acceptable
-# as configuration should be immutable after initialization.
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance.
+    """Get the application settings.
 
-    This factory function provides a testable way to access settings,
-    allowing for dependency injection and mocking in tests.
+    The settings are read from the environment and .env file on the first call
+    and cached afterwards, as configuration is immutable after initialization.
+    Tests that change the environment can call get_settings.cache_clear() to
+    have the next call read it again.
 
     Returns:
-        Settings: The global settings instance
+        Settings: The cached settings instance
     """
-    return settings
+    return Settings()
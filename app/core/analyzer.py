@@ -8,12 +8,13 @@ import asyncio
 import logging
 import time
 import uuid
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
 from app.analyzers.ast_parser import ParsedTestFile, parse_test_file
 from app.api.v1.schemas import (
     AnalysisMetrics,
     AnalyzeResponse,
+    FileChangeEntry,
     FileInput,
     ImpactAnalysisResponse,
     ImpactItem,
@@ -26,6 +27,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# A changed file, either as the request model or as a plain dict
+FileChange = Union[FileChangeEntry, Dict[str, str]]
+
+
+def _change_path(change: FileChange) -> str:
+    """Return the path of a changed file entry."""
+    if isinstance(change, FileChangeEntry):
+        return change.path
+    return change.get("path", "")
+
 
 class TestAnalyzer:
     """Main orchestrator for test analysis.
@@ -301,7 +312,7 @@ class ImpactAnalyzer:
 
     async def analyze_impact_async(
         self,
-        files_changed: List[Dict[str, str]],
+        files_changed: Sequence[FileChange],
         related_tests: List[str],
         git_diff: Optional[str] = None,
     ) -> ImpactAnalysisResponse:
@@ -312,7 +323,8 @@ class ImpactAnalyzer:
         (functions that call the modified functions) for accurate impact assessment.
 
         Args:
-            files_changed: List of dictionaries with 'path' and 'change_type'
+            files_changed: FileChangeEntry models (or dicts with 'path' and
+                'change_type') describing the changed files
             related_tests: List of test file paths that may be related
             git_diff: Optional git diff content for function-level analysis
 
@@ -332,7 +344,7 @@ class ImpactAnalyzer:
         if not files_changed:
             raise ValueError("files_changed cannot be empty")
 
-        changed_paths = [f.get("path", "") for f in files_changed]
+        changed_paths = [_change_path(f) for f in files_changed]
         if not any(changed_paths):
             raise ValueError("files_changed paths cannot be empty")
 
@@ -344,7 +356,7 @@ class ImpactAnalyzer:
 
         try:
             impacted_tests = await self._calculate_impact_graph_based(
-                files_changed, related_tests, git_diff
+                changed_paths, related_tests, git_diff
             )
 
             severity, suggested_action = self._determine_severity_and_action(
@@ -411,7 +423,7 @@ class ImpactAnalyzer:
 
     async def _calculate_impact_graph_based(
         self,
-        files_changed: List[Dict[str, str]],
+        changed_paths: List[str],
         related_tests: List[str],
         git_diff: Optional[str] = None,
     ) -> List[ImpactItem]:
@@ -424,7 +436,7 @@ class ImpactAnalyzer:
         Enhanced to classify changes as functional vs non-functional.
 
         Args:
-            files_changed: List of changed files with paths
+            changed_paths: List of changed file paths
             related_tests: List of potentially related test files
             git_diff: Optional git diff for function-level extraction
 
@@ -433,7 +445,6 @@ class ImpactAnalyzer:
         """
         impacted_tests: List[ImpactItem] = []
         processed_test_paths: set = set()
-        changed_paths = [f.get("path", "") for f in files_changed]
 
         # Extract AND classify changes from git diff if provided
         functional_changes = []
@@ -13,11 +13,12 @@ Phase 1 enhancements:
 
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.core.error_handlers import Neo4jQueryError
+from app.core.error_handlers import Neo4jQueryError, VersionConflictError
 from app.core.graph.neo4j_client import Neo4jClient, Neo4jClientError
-from app.models.context import SymbolChange
+from app.models.context import FileChange, SymbolChange
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,37 @@ logger = logging.getLogger(__name__)
 SYMBOL_BATCH_SIZE = 100
 RELATIONSHIP_BATCH_SIZE = 500
 
+# Parallel per-field lists accepted by GraphService.batch_create_symbol_columns
+SYMBOL_COLUMNS = (
+    "names",
+    "kinds",
+    "signatures",
+    "file_paths",
+    "line_starts",
+    "line_ends",
+    "qualified_names",
+)
+
+# Parallel per-caller lists accepted by
+# GraphService.create_call_relationship_columns
+CALL_COLUMNS = ("callers", "callees", "lines")
+
+
+def to_native_datetime(value: Any) -> Optional[datetime]:
+    """
+    Convert a Neo4j temporal value to a Python datetime.
+
+    Args:
+        value: neo4j.time.DateTime, datetime or None
+
+    Returns:
+        Python datetime, or None if value is None
+    """
+    if value is None:
+        return None
+    to_native = getattr(value, "to_native", None)
+    return to_native() if to_native is not None else value
+
 
 class GraphService:
     """
@@ -47,6 +79,12 @@ class GraphService:
 
         self.client = neo4j_client or create_neo4j_client()
         self._connected = False
+        self._indexes_created = False
+
+    @property
+    def connected(self) -> bool:
+        """Whether the Neo4j connection has been established."""
+        return self._connected
 
     async def connect(self) -> None:
         """Connect to Neo4j database."""
@@ -96,6 +134,17 @@ class GraphService:
 
         logger.info("Index creation completed")
 
+    async def ensure_indexes(self) -> None:
+        """
+        Create indexes and constraints once per service instance.
+
+        Write paths call this so that a service that connected after startup
+        still gets its indexes, without repeating the DDL on every request.
+        """
+        if not self._indexes_created:
+            await self.create_indexes()
+            self._indexes_created = True
+
     async def batch_create_symbols(
         self,
         project_id: str,
@@ -170,6 +219,67 @@ class GraphService:
 
         return total_created
 
+    async def batch_create_symbol_columns(
+        self,
+        project_id: str,
+        columns: Dict[str, List[Any]],
+    ) -> int:
+        """
+        Create Symbol nodes from parallel per-field lists using UNWIND.
+
+        Unlike batch_create_symbols_chunked, each batch is sent as one list per
+        field (see SYMBOL_COLUMNS) instead of one dictionary per symbol, which
+        avoids building and serializing a map for every symbol.
+
+        Args:
+            project_id: Project identifier
+            columns: Mapping of every SYMBOL_COLUMNS name to an equally long list
+
+        Returns:
+            Total number of nodes created/updated
+        """
+        total = len(columns["qualified_names"])
+        if not total:
+            return 0
+
+        query = """
+        UNWIND range(0, size($qualified_names) - 1) AS i
+        MERGE (s:Symbol {qualified_name: $qualified_names[i]})
+        SET s.name = $names[i],
+            s.kind = $kinds[i],
+            s.signature = $signatures[i],
+            s.file_path = $file_paths[i],
+            s.line_start = $line_starts[i],
+            s.line_end = $line_ends[i],
+            s.project_id = $project_id,
+            s.updated_at = datetime()
+        RETURN count(s) AS created
+        """
+
+        total_created = 0
+        try:
+            async with self.client.session() as session:
+                for i in range(0, total, SYMBOL_BATCH_SIZE):
+                    parameters = {
+                        name: columns[name][i : i + SYMBOL_BATCH_SIZE]
+                        for name in SYMBOL_COLUMNS
+                    }
+                    parameters["project_id"] = project_id
+                    result = await session.run(query, parameters)
+                    record = await result.single()
+                    total_created += record["created"] if record else 0
+        except Exception as e:
+            logger.error("Batch create symbol columns failed: %s", e)
+            raise
+
+        logger.info(
+            "Batch symbol creation completed: total=%d, chunks=%d",
+            total_created,
+            (total + SYMBOL_BATCH_SIZE - 1) // SYMBOL_BATCH_SIZE,
+        )
+
+        return total_created
+
     async def create_call_relationships(
         self,
         project_id: str,
@@ -223,6 +333,69 @@ class GraphService:
             logger.error("Create relationships failed: %s", e)
             raise
 
+    async def create_call_relationship_columns(
+        self,
+        project_id: str,
+        calls: Dict[str, List[Any]],
+    ) -> int:
+        """
+        Create CALLS relationships from parallel per-caller lists.
+
+        Each caller is sent once with the list of names it calls, and Cypher
+        unwinds the calls server-side, instead of one dictionary per call.
+
+        Args:
+            project_id: Project identifier
+            calls: Mapping of every CALL_COLUMNS name to an equally long list;
+                callees holds one list of callee names per caller
+
+        Returns:
+            Number of relationships created
+        """
+        callees = calls["callees"]
+        if not callees:
+            return 0
+
+        query = """
+        UNWIND range(0, size($callers) - 1) AS i
+        MATCH (caller:Symbol {project_id: $project_id, qualified_name: $callers[i]})
+        UNWIND $callees[i] AS callee_name
+        MATCH (callee:Symbol {project_id: $project_id, qualified_name: callee_name})
+        MERGE (caller)-[r:CALLS {line: $lines[i]}]->(callee)
+        RETURN count(r) AS created
+        """
+
+        expected = 0
+        created = 0
+        try:
+            async with self.client.session() as session:
+                start = 0
+                pending = 0
+                for end, names in enumerate(callees, 1):
+                    pending += len(names)
+                    if pending < RELATIONSHIP_BATCH_SIZE and end < len(callees):
+                        continue
+                    parameters = {name: calls[name][start:end] for name in CALL_COLUMNS}
+                    parameters["project_id"] = project_id
+                    result = await session.run(query, parameters)
+                    record = await result.single()
+                    created += record["created"] if record else 0
+                    expected += pending
+                    start = end
+                    pending = 0
+        except Exception as e:
+            logger.error("Create relationship columns failed: %s", e)
+            raise
+
+        if created < expected:
+            logger.warning(
+                "Some relationships not created: expected=%d, actual=%d (missing targets)",
+                expected,
+                created,
+            )
+
+        return created
+
     async def update_file_symbols(
         self,
         project_id: str,
@@ -398,6 +571,228 @@ class GraphService:
 
             return deleted
 
+    async def apply_file_changes_batch(
+        self,
+        project_id: str,
+        changes: List[FileChange],
+    ) -> int:
+        """
+        Apply a set of incremental file changes in one transaction.
+
+        Changes are partitioned once in Python and sent as one UNWIND query
+        per kind of operation (file deletions, symbol deletions, additions
+        and modifications) instead of one transaction per file.
+
+        Args:
+            project_id: Project identifier
+            changes: File changes from an incremental update request
+
+        Returns:
+            Number of changes applied: deleted symbols for deleted files plus
+            one per symbol change in modified files
+        """
+        changes_applied, _, _ = await self._apply_file_changes(project_id, changes)
+        return changes_applied
+
+    async def apply_incremental_update(
+        self,
+        project_id: str,
+        expected_version: int,
+        changes: List[FileChange],
+    ) -> Tuple[int, int, datetime]:
+        """
+        Apply file changes and bump the project version in one transaction.
+
+        The version is incremented first, which write-locks the project node
+        until commit. Concurrent updates for the same project therefore run
+        one after another, and any update whose version was overtaken is
+        rolled back instead of overwriting the other.
+
+        Args:
+            project_id: Project identifier
+            expected_version: Project version the client based its changes on
+            changes: File changes from an incremental update request
+
+        Returns:
+            Tuple of (changes applied, new project version, database
+            timestamp of the version bump)
+
+        Raises:
+            VersionConflictError: If the project version no longer matches
+        """
+        return await self._apply_file_changes(
+            project_id, changes, expected_version=expected_version
+        )
+
+    async def _apply_file_changes(
+        self,
+        project_id: str,
+        changes: List[FileChange],
+        expected_version: Optional[int] = None,
+    ) -> Tuple[int, Optional[int], Optional[datetime]]:
+        """Apply file changes, optionally guarded by a version check."""
+        deleted_files: List[str] = []
+        deleted_symbols: List[Dict[str, Any]] = []
+        added_symbols: List[Dict[str, Any]] = []
+        modified_symbols: List[Dict[str, Any]] = []
+
+        for file_change in changes:
+            file_path = file_change.file_path
+            if file_change.action == "deleted":
+                deleted_files.append(file_path)
+                continue
+
+            for change in file_change.symbols_changed or ():
+                symbol = change.symbol
+                if change.action == "deleted":
+                    deleted_symbols.append(
+                        {"file_path": file_path, "name": symbol.name}
+                    )
+                    continue
+
+                symbol_data = {
+                    "file_path": file_path,
+                    "name": symbol.name,
+                    "kind": symbol.kind,
+                    "signature": symbol.signature,
+                    "line_start": symbol.line_start,
+                    "line_end": symbol.line_end,
+                }
+                if change.action == "added":
+                    symbol_data["qualified_name"] = f"{file_path}::{symbol.name}"
+                    added_symbols.append(symbol_data)
+                else:
+                    modified_symbols.append(symbol_data)
+
+        files_deleted_count = 0
+        new_version = None
+        updated_at = None
+
+        async with self.client.session() as session:
+            tx = await session.begin_transaction()
+            try:
+                if expected_version is not None:
+                    # Setting updated_at first write-locks the Project node,
+                    # so the version read after it cannot be stale. Projects
+                    # written before version tracking get their node here.
+                    result = await tx.run(
+                        """
+                        MERGE (p:Project {project_id: $project_id})
+                        ON CREATE SET p.version = 0, p.created_at = datetime()
+                        SET p.updated_at = datetime()
+                        WITH p, coalesce(p.version, 0) AS previous_version
+                        SET p.version = previous_version + 1
+                        RETURN previous_version,
+                               p.version AS version,
+                               p.updated_at AS updated_at
+                        """,
+                        {"project_id": project_id},
+                    )
+                    record = await result.single()
+                    if record["previous_version"] != expected_version:
+                        raise VersionConflictError(
+                            expected=record["previous_version"],
+                            received=expected_version,
+                            project_id=project_id,
+                        )
+                    new_version = record["version"]
+                    updated_at = to_native_datetime(record["updated_at"])
+
+                if deleted_files:
+                    result = await tx.run(
+                        """
+                        UNWIND $file_paths AS file_path
+                        MATCH (s:Symbol {
+                            project_id: $project_id,
+                            file_path: file_path
+                        })
+                        WITH collect(s) AS symbols
+                        FOREACH (s IN symbols | DETACH DELETE s)
+                        RETURN size(symbols) AS deleted
+                        """,
+                        {"project_id": project_id, "file_paths": deleted_files},
+                    )
+                    record = await result.single()
+                    files_deleted_count = record["deleted"] if record else 0
+
+                if deleted_symbols:
+                    await tx.run(
+                        """
+                        UNWIND $symbols AS symbol
+                        MATCH (s:Symbol {
+                            project_id: $project_id,
+                            file_path: symbol.file_path,
+                            name: symbol.name
+                        })
+                        DETACH DELETE s
+                        """,
+                        {"project_id": project_id, "symbols": deleted_symbols},
+                    )
+
+                if added_symbols:
+                    await tx.run(
+                        """
+                        UNWIND $symbols AS symbol
+                        CREATE (s:Symbol {
+                            project_id: $project_id,
+                            file_path: symbol.file_path,
+                            name: symbol.name,
+                            kind: symbol.kind,
+                            signature: symbol.signature,
+                            line_start: symbol.line_start,
+                            line_end: symbol.line_end,
+                            qualified_name: symbol.qualified_name,
+                            created_at: datetime(),
+                            updated_at: datetime()
+                        })
+                        """,
+                        {"project_id": project_id, "symbols": added_symbols},
+                    )
+
+                if modified_symbols:
+                    await tx.run(
+                        """
+                        UNWIND $symbols AS symbol
+                        MATCH (s:Symbol {
+                            project_id: $project_id,
+                            file_path: symbol.file_path,
+                            name: symbol.name
+                        })
+                        SET s.signature = symbol.signature,
+                            s.line_start = symbol.line_start,
+                            s.line_end = symbol.line_end,
+                            s.kind = symbol.kind,
+                            s.updated_at = datetime()
+                        """,
+                        {"project_id": project_id, "symbols": modified_symbols},
+                    )
+
+                await tx.commit()
+            except VersionConflictError:
+                await tx.rollback()
+                raise
+            except Exception as e:
+                await tx.rollback()
+                logger.error("Batch file change update failed: %s", e)
+                raise
+
+        logger.info(
+            "File changes applied: files_deleted=%d, symbols_deleted=%d, "
+            "added=%d, modified=%d",
+            len(deleted_files),
+            len(deleted_symbols),
+            len(added_symbols),
+            len(modified_symbols),
+        )
+
+        changes_applied = (
+            files_deleted_count
+            + len(deleted_symbols)
+            + len(added_symbols)
+            + len(modified_symbols)
+        )
+        return changes_applied, new_version, updated_at
+
     async def get_project_statistics(self, project_id: str) -> Dict[str, int]:
         """
         Get project-level statistics.
@@ -521,6 +916,85 @@ class GraphService:
         result = await self.client.execute_query(query, {"project_id": project_id})
         return result[0]["version"] if result else 0
 
+    async def get_project_revision(
+        self, project_id: str
+    ) -> Tuple[bool, int, Optional[datetime]]:
+        """
+        Get existence, version and creation time of a project.
+
+        A light lookup for callers that do not need statistics. The creation
+        time tells apart successive incarnations of a project that was deleted
+        and initialized again, whose versions restart at 1.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Tuple of (exists, version, created_at) where version is 0 and
+            created_at is None for a project without version metadata
+        """
+        query = """
+        OPTIONAL MATCH (p:Project {project_id: $project_id})
+        RETURN
+            EXISTS { MATCH (:Symbol {project_id: $project_id}) } AS exists,
+            p.version AS version, p.created_at AS created_at
+        """
+
+        result = await self.client.execute_query(query, {"project_id": project_id})
+        record = result[0] if result else {}
+
+        return (
+            bool(record.get("exists")),
+            record.get("version") or 0,
+            to_native_datetime(record.get("created_at")),
+        )
+
+    async def get_project_version_and_stats(
+        self, project_id: str
+    ) -> Tuple[bool, int, Dict[str, Any]]:
+        """
+        Get existence, version and statistics of a project in one round-trip.
+
+        Combines check_project_exists, get_project_version and
+        get_project_statistics into a single query for the hot PATCH/GET
+        endpoints.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Tuple of (exists, version, stats) where version is 0 for a project
+            without version metadata and stats has total_files, total_symbols,
+            total_relationships, last_updated_at and created_at (both None
+            without metadata)
+        """
+        query = """
+        OPTIONAL MATCH (s:Symbol {project_id: $project_id})
+        WITH
+            count(DISTINCT s.file_path) AS total_files,
+            count(s) AS total_symbols,
+            sum(CASE WHEN s IS NULL THEN 0 ELSE count{(s)-[:CALLS]->()} END)
+                AS total_relationships
+        OPTIONAL MATCH (p:Project {project_id: $project_id})
+        RETURN total_files, total_symbols, total_relationships,
+            p.version AS version, p.updated_at AS last_updated_at,
+            p.created_at AS created_at
+        """
+
+        result = await self.client.execute_query(query, {"project_id": project_id})
+        record = result[0] if result else {}
+
+        stats = {
+            "total_files": record.get("total_files") or 0,
+            "total_symbols": record.get("total_symbols") or 0,
+            "total_relationships": record.get("total_relationships") or 0,
+            "last_updated_at": to_native_datetime(record.get("last_updated_at")),
+            "created_at": to_native_datetime(record.get("created_at")),
+        }
+        version = record.get("version") or 0
+
+        return stats["total_symbols"] > 0, version, stats
+
     async def get_project_data(self, project_id: str) -> dict:
         """
         Get complete project data including all files and symbols.
@@ -1,5 +1,6 @@
 """Neo4j database client with connection pooling and error handling."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
@@ -11,7 +12,7 @@ from neo4j.exceptions import (
     ServiceUnavailable,
 )
 
-from app.config import settings
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,8 @@ class Neo4jClient:
         user: Optional[str] = None,
         password: Optional[str] = None,
         database: Optional[str] = None,
+        max_connection_pool_size: Optional[int] = None,
+        connection_acquisition_timeout: Optional[float] = None,
     ):
         """
         Initialize Neo4j client.
@@ -67,58 +70,90 @@ class Neo4jClient:
             user: Username (defaults to settings)
             password: Password (defaults to settings)
             database: Database name (defaults to settings)
+            max_connection_pool_size: Driver pool size (defaults to settings)
+            connection_acquisition_timeout: Seconds to wait for a pooled
+                connection (defaults to settings)
         """
+        settings = get_settings()
         self.uri = uri or settings.neo4j_uri
         self.user = user or settings.neo4j_user
         self.password = password or settings.neo4j_password
         self.database = database or settings.neo4j_database
+        self.max_connection_pool_size = (
+            max_connection_pool_size or settings.neo4j_max_connection_pool_size
+        )
+        self.connection_acquisition_timeout = (
+            connection_acquisition_timeout
+            or settings.neo4j_connection_acquisition_timeout
+        )
 
         self._driver: Optional[AsyncDriver] = None
         self._connected = False
+        self._connect_lock = asyncio.Lock()
 
         logger.info(
-            "Neo4j client initialized: uri=%s, database=%s",
+            "Neo4j client initialized: uri=%s, database=%s, pool_size=%d",
             self.uri,
             self.database,
+            self.max_connection_pool_size,
         )
 
     async def connect(self) -> None:
         """
         Establish connection to Neo4j database.
 
+        Concurrent calls share one attempt. If connectivity cannot be
+        verified, the new driver is closed again so failed attempts do not
+        leak connection pools.
+
         Raises:
             Neo4jConnectionError: If connection fails
         """
-        if self._connected:
-            logger.debug("Neo4j client already connected")
+        async with self._connect_lock:
+            if self._connected:
+                logger.debug("Neo4j client already connected")
+                return
+
+            try:
+                logger.info("Connecting to Neo4j database...")
+
+                self._driver = AsyncGraphDatabase.driver(
+                    self.uri,
+                    auth=(self.user, self.password),
+                    max_connection_lifetime=get_settings().neo4j_max_connection_lifetime,
+                    max_connection_pool_size=self.max_connection_pool_size,
+                    connection_acquisition_timeout=self.connection_acquisition_timeout,
+                )
+
+                # Verify connectivity, closing the driver again if it fails
+                try:
+                    await self._driver.verify_connectivity()
+                except BaseException:
+                    await self._discard_driver()
+                    raise
+
+                self._connected = True
+                logger.info("Successfully connected to Neo4j database")
+
+            except AuthError as e:
+                logger.error("Neo4j authentication failed: %s", str(e))
+                raise Neo4jConnectionError(f"Authentication failed: {e}") from e
+            except ServiceUnavailable as e:
+                logger.error("Neo4j service unavailable: %s", str(e))
+                raise Neo4jConnectionError(f"Service unavailable: {e}") from e
+            except Exception as e:
+                logger.error("Unexpected Neo4j connection error: %s", str(e))
+                raise Neo4jConnectionError(f"Connection failed: {e}") from e
+
+    async def _discard_driver(self) -> None:
+        """Close a driver whose connectivity check failed."""
+        driver, self._driver = self._driver, None
+        if driver is None:
             return
-
         try:
-            logger.info("Connecting to Neo4j database...")
-
-            self._driver = AsyncGraphDatabase.driver(
-                self.uri,
-                auth=(self.user, self.password),
-                max_connection_lifetime=settings.neo4j_max_connection_lifetime,
-                max_connection_pool_size=settings.neo4j_max_connection_pool_size,
-                connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
-            )
-
-            # Verify connectivity
-            await self._driver.verify_connectivity()
-
-            self._connected = True
-            logger.info("Successfully connected to Neo4j database")
-
-        except AuthError as e:
-            logger.error("Neo4j authentication failed: %s", str(e))
-            raise Neo4jConnectionError(f"Authentication failed: {e}") from e
-        except ServiceUnavailable as e:
-            logger.error("Neo4j service unavailable: %s", str(e))
-            raise Neo4jConnectionError(f"Service unavailable: {e}") from e
+            await driver.close()
         except Exception as e:
-            logger.error("Unexpected Neo4j connection error: %s", str(e))
-            raise Neo4jConnectionError(f"Connection failed: {e}") from e
+            logger.warning("Error closing unverified Neo4j driver: %s", e)
 
     async def execute_query(
         self,
@@ -236,9 +271,12 @@ def create_neo4j_client() -> Neo4jClient:
     Returns:
         Configured Neo4jClient instance
     """
+    settings = get_settings()
     return Neo4jClient(
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
         password=settings.neo4j_password,
         database=settings.neo4j_database,
+        max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+        connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
     )
@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
-from app.config import settings
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +53,7 @@ class LLMClient:
         timeout: float = None,
         max_retries: int = None,
     ):
+        settings = get_settings()
         self.api_key = api_key or settings.llm_api_key
         self.base_url = base_url or settings.llm_base_url
         self.model = model or settings.llm_model
@@ -117,7 +118,7 @@ class LLMClient:
             max_tokens,
         )
 
-        if settings.log_sensitive_data:
+        if get_settings().log_sensitive_data:
             logger.debug("LLM request payload: %s", json.dumps(payload, indent=2))
 
         start_time = time.time()
@@ -210,7 +211,7 @@ class LLMClient:
                             duration_ms,
                         )
 
-                    if settings.log_sensitive_data:
+                    if get_settings().log_sensitive_data:
                         logger.debug(
                             "LLM response: %s", content[:500]
                         )  # First 500 chars
@@ -295,6 +296,7 @@ class LLMClient:
 # Convenience function for creating LLM client with settings
 def create_llm_client() -> LLMClient:
     """Create an LLM client using settings."""
+    settings = get_settings()
     return LLMClient(
         api_key=settings.llm_api_key,
         base_url=settings.llm_base_url,
@@ -6,7 +6,7 @@ import logging.config
 import sys
 from typing import Any, Dict
 
-from app.config import settings
+from app.config import get_settings
 
 
 class JSONFormatter(logging.Formatter):
@@ -83,6 +83,7 @@ class TextFormatter(logging.Formatter):
 
 def setup_logging() -> None:
     """Set up logging configuration."""
+    settings = get_settings()
 
     # Define formatters
     json_formatter = JSONFormatter()
@@ -17,6 +17,7 @@ from app.api.v1.schemas import (
     QualityIssue,
     QualitySummary,
 )
+from app.config import get_settings
 from app.core.analysis.llm_analyzer import LLMAnalyzer
 from app.core.analyzer import TestAnalyzer
 from app.core.llm.llm_client import create_llm_client
@@ -51,7 +52,9 @@ class QualityAnalysisService:
             project_id: Project identifier for graph queries
         """
         if test_analyzer is None:
-            rule_engine = RuleEngine()
+            rule_engine = RuleEngine(
+                feature_cache_dir=get_settings().rule_feature_cache_dir
+            )
             llm_client = create_llm_client()
             llm_analyzer = LLMAnalyzer(llm_client)
             self.test_analyzer = TestAnalyzer(rule_engine, llm_analyzer)
@@ -263,6 +266,9 @@ class QualityAnalysisService:
         """
         Convert TestAnalyzer issues to QualityIssue format.
 
+        The source Issue models are already validated and every mapped value
+        satisfies QualityIssue, so the models are built with model_construct.
+
         Args:
             issues: Issues from TestAnalyzer
 
@@ -280,7 +286,7 @@ class QualityAnalysisService:
             # Map detected_by field
             detected_by = "rule" if issue.detected_by == "rule_engine" else "llm"
 
-            quality_issue = QualityIssue(
+            quality_issue = QualityIssue.model_construct(
                 file_path=issue.file,
                 line=issue.line,
                 column=issue.column,
@@ -318,7 +324,7 @@ class QualityAnalysisService:
         # For delete, old_code contains what to delete
         new_text = suggestion.new_code
 
-        return FixSuggestion(
+        return FixSuggestion.model_construct(
             type=fix_type,
             new_text=new_text,
             description=suggestion.explanation,
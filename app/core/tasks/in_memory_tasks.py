@@ -7,7 +7,7 @@ eliminating external service dependencies.
 import asyncio
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,10 @@ class InMemoryTaskStore:
 
         return task_data["data"]
 
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get task data for several keys, mirroring Redis MGET."""
+        return [await self.get(key) for key in keys]
+
     async def setex(self, key: str, ttl_seconds: int, value: str):
         """Set task data with TTL."""
         expires_at = time.time() + ttl_seconds
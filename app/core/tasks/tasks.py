@@ -11,7 +11,7 @@ import logging
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # Constants for coverage optimization fallback logic
 DEFAULT_TARGET_LINE_START = 50
@@ -19,13 +19,18 @@ TARGET_LINE_SPACING = 10
 DEFAULT_FALLBACK_TARGET_LINE = 50
 
 import redis.asyncio as redis
+from pydantic import ValidationError
 
-from app.config import settings
-from app.core.llm.llm_client import create_llm_client
+from app.api.v1.schemas import CoverageOptimizationResult
+from app.config import get_settings
+from app.core.llm.llm_client import LLMClient, create_llm_client
 from app.core.tasks.in_memory_tasks import get_in_memory_task_store
 
 TASK_TTL_SECONDS = 60 * 60 * 24  # 24 hours
 TASK_KEY_PREFIX = "task:"
+# Payloads carrying more text than this are stored under their own key, so
+# status updates and polls do not re-encode or re-parse large source code
+SPILL_PAYLOAD_CHARS = 64 * 1024
 SYSTEM_PROMPT = (
     "You are an expert Python test engineer. Generate high-quality pytest tests, "
     "covering edge cases, error handling, and clear assertions. Ensure the output "
@@ -35,6 +40,7 @@ SYSTEM_PROMPT = (
 _redis_client: Optional[redis.Redis] = None
 _in_memory_store: Optional[Any] = None
 _use_in_memory = False
+_get_batcher: Optional[_GetBatcher] = None
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +57,15 @@ def _task_key(task_id: str) -> str:
     return f"{TASK_KEY_PREFIX}{task_id}"
 
 
+def _payload_key(task_id: str) -> str:
+    return f"{TASK_KEY_PREFIX}{task_id}:payload"
+
+
+def _payload_chars(payload: Dict[str, Any]) -> int:
+    """Return the total length of the payload's top-level string fields."""
+    return sum(len(value) for value in payload.values() if isinstance(value, str))
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -69,7 +84,7 @@ async def _get_redis_client() -> Optional[redis.Redis]:
             _redis_client = None
 
     if _redis_client is None:
-        redis_url = settings.redis_url
+        redis_url = get_settings().redis_url
         if not redis_url:
             return None
 
@@ -128,39 +143,124 @@ async def _get_storage():
     return _in_memory_store
 
 
-async def create_task(payload: Dict[str, Any]) -> str:
-    """Create a new asynchronous task and return its id."""
+async def create_task(
+    payload: Dict[str, Any],
+    status: TaskStatus = TaskStatus.PENDING,
+    error: Optional[str] = None,
+) -> str:
+    """Create a new asynchronous task and return its id.
+
+    ``status`` and ``error`` let callers store a task directly in its final
+    state (e.g. a simulated failure) without a follow-up status update.
+
+    Large payloads (e.g. whole source files) are serialized once into a
+    separate key; read them back with get_task_payload.
+    """
     task_id = str(uuid.uuid4())
+    spill_payload = _payload_chars(payload) > SPILL_PAYLOAD_CHARS
     task_data = {
         "id": task_id,
-        "status": TaskStatus.PENDING.value,
+        "status": status.value,
         "created_at": _now_iso(),
         "updated_at": _now_iso(),
         "result": None,
-        "error": None,
-        "payload": payload,
+        "error": (
+            {"message": str(error), "code": None, "details": None}
+            if error is not None
+            else None
+        ),
+        "payload": None if spill_payload else payload,
+        "payload_spilled": spill_payload,
     }
 
+    if spill_payload:
+        await _save_payload(task_id, payload)
     await _save_task(task_id, task_data)
     logger.info(f"Created task {task_id}")
     return task_id
 
 
+class _GetBatcher:
+    """Coalesces get_task lookups that arrive while a read is in flight.
+
+    A lookup on an idle store reads directly. Lookups that arrive while a read
+    is running are queued and read together with one MGET by a flush task that
+    runs independently of the callers, so cancelling one caller never cancels
+    the result another caller is waiting for.
+    """
+
+    __slots__ = ("loop", "reading", "queued", "flush_task")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.reading = False
+        self.queued: Dict[str, asyncio.Future] = {}
+        self.flush_task: Optional[asyncio.Task] = None
+
+    async def get(self, task_id: str) -> Optional[str]:
+        """Return the serialized task, sharing reads with concurrent lookups."""
+        if not self.reading and not self.queued:
+            self.reading = True
+            try:
+                return (await _get_raw_tasks([task_id]))[0]
+            finally:
+                self.reading = False
+                self._start_flush()
+
+        future = self.queued.get(task_id)
+        if future is None:
+            future = self.queued[task_id] = self.loop.create_future()
+        self._start_flush()
+        return await asyncio.shield(future)
+
+    def _start_flush(self) -> None:
+        if self.queued and not self.reading and self.flush_task is None:
+            self.flush_task = self.loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        self.reading = True
+        batch: Dict[str, asyncio.Future] = {}
+        try:
+            while self.queued:
+                batch, self.queued = self.queued, {}
+                raws = await _get_raw_tasks(list(batch))
+                for future, raw in zip(batch.values(), raws):
+                    if not future.done():
+                        future.set_result(raw)
+        finally:
+            self.reading = False
+            self.flush_task = None
+            for future in (*batch.values(), *self.queued.values()):
+                if not future.done():
+                    future.cancel()
+            self.queued = {}
+
+
 async def get_task(task_id: str) -> Optional[Dict[str, Any]]:
-    """Fetch task information from storage."""
-    storage = await _get_storage()
-    key = _task_key(task_id)
+    """Fetch task information from storage.
 
-    try:
-        if _use_in_memory:
-            raw = await storage.get(key)
-        else:
-            raw = await storage.get(key)
+    Lookups that arrive while another read is in flight (e.g. many clients
+    polling /tasks at once) are coalesced into a single multi-key read. A
+    lookup on an idle store is read directly, without waiting for others.
+    """
+    global _get_batcher
+
+    loop = asyncio.get_running_loop()
+    if _get_batcher is None or _get_batcher.loop is not loop:
+        _get_batcher = _GetBatcher(loop)
+
+    raw = await _get_batcher.get(task_id)
+    return json.loads(raw) if raw else None
 
-        return json.loads(raw) if raw else None
+
+async def _get_raw_tasks(task_ids: List[str]) -> List[Optional[str]]:
+    """Read serialized tasks with one MGET, returning None for failures."""
+    try:
+        storage = await _get_storage()
+        return await storage.mget([_task_key(task_id) for task_id in task_ids])
     except Exception as e:
-        logger.error(f"Error fetching task {task_id}: {e}")
-        return None
+        logger.error(f"Error fetching tasks {task_ids}: {e}")
+        return [None] * len(task_ids)
 
 
 async def update_task_status(
@@ -196,6 +296,40 @@ async def update_task_status(
     )
 
 
+async def get_task_payload(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the payload of a task fetched with get_task.
+
+    Args:
+        task: Task data as returned by get_task
+
+    Returns:
+        The payload the task was created with, or an empty dict if missing
+    """
+    if not task.get("payload_spilled"):
+        return task.get("payload") or {}
+
+    storage = await _get_storage()
+    try:
+        raw = await storage.get(_payload_key(task["id"]))
+    except Exception as e:
+        logger.error(f"Error fetching payload for task {task['id']}: {e}")
+        return {}
+    return json.loads(raw) if raw else {}
+
+
+async def _save_payload(task_id: str, payload: Dict[str, Any]) -> None:
+    """Save a large task payload under its own key."""
+    storage = await _get_storage()
+
+    try:
+        await storage.setex(
+            _payload_key(task_id), TASK_TTL_SECONDS, json.dumps(payload)
+        )
+    except Exception as e:
+        logger.error(f"Error saving payload for task {task_id}: {e}")
+        raise
+
+
 async def _save_task(task_id: str, task_data: Dict[str, Any]) -> None:
     """Save task data to storage."""
     storage = await _get_storage()
@@ -212,15 +346,21 @@ async def _save_task(task_id: str, task_data: Dict[str, Any]) -> None:
         raise
 
 
-async def execute_generate_tests_task(task_id: str, payload: Dict[str, Any]) -> None:
-    """Execute test generation task asynchronously."""
+async def execute_generate_tests_task(
+    task_id: str, payload: Dict[str, Any], llm_client: Optional[LLMClient] = None
+) -> None:
+    """Execute test generation task asynchronously.
+
+    ``llm_client`` is an optional shared client whose connection pool is
+    reused; it is left open. Without it a client is created per task.
+    """
     try:
         logger.debug("Starting test generation task: task_id=%s", task_id)
         await update_task_status(task_id, TaskStatus.PROCESSING)
 
         # Generate tests using new request format
         logger.info("Generating tests from LLM: task_id=%s", task_id)
-        generation_result = await _generate_tests_from_llm(payload)
+        generation_result = await _generate_tests_from_llm(payload, llm_client)
 
         # Format result as GenerateTestsResult per OpenAPI spec
         result = {
@@ -241,7 +381,9 @@ async def execute_generate_tests_task(task_id: str, payload: Dict[str, Any]) ->
         await update_task_status(task_id, TaskStatus.FAILED, error=str(exc))
 
 
-async def _generate_tests_from_llm(payload: Dict[str, Any]) -> Dict[str, str]:
+async def _generate_tests_from_llm(
+    payload: Dict[str, Any], llm_client: Optional[LLMClient] = None
+) -> Dict[str, str]:
     """Generate tests from LLM using new OpenAPI-compliant request format."""
 
     # Extract fields from new flattened schema
@@ -258,7 +400,7 @@ async def _generate_tests_from_llm(payload: Dict[str, Any]) -> Dict[str, str]:
         context=context,
     )
 
-    client = create_llm_client()
+    client = llm_client or create_llm_client()
     try:
         logger.info("Sending test generation request to LLM")
         raw_response = await client.chat_completion(
@@ -271,7 +413,8 @@ async def _generate_tests_from_llm(payload: Dict[str, Any]) -> Dict[str, str]:
         # Parse response to extract code and explanation
         return _parse_generation_response(raw_response)
     finally:
-        await client.close()
+        if llm_client is None:
+            await client.close()
 
 
 def _parse_generation_response(raw_response: str) -> Dict[str, str]:
@@ -353,16 +496,22 @@ Requirements:
 
 
 async def execute_coverage_optimization_task(
-    task_id: str, payload: Dict[str, Any]
+    task_id: str, payload: Dict[str, Any], llm_client: Optional[LLMClient] = None
 ) -> None:
-    """Execute coverage optimization task asynchronously."""
+    """Execute coverage optimization task asynchronously.
+
+    ``llm_client`` is an optional shared client, as for
+    execute_generate_tests_task.
+    """
     try:
         logger.debug("Starting coverage optimization task: task_id=%s", task_id)
         await update_task_status(task_id, TaskStatus.PROCESSING)
 
         # Generate coverage optimization using LLM
         logger.info("Generating coverage optimization from LLM: task_id=%s", task_id)
-        optimization_result = await _generate_coverage_optimization_from_llm(payload)
+        optimization_result = await _generate_coverage_optimization_from_llm(
+            payload, llm_client
+        )
 
         # Format result as CoverageOptimizationResult per OpenAPI spec
         result = {
@@ -384,6 +533,7 @@ async def execute_coverage_optimization_task(
 
 async def _generate_coverage_optimization_from_llm(
     payload: Dict[str, Any],
+    llm_client: Optional[LLMClient] = None,
 ) -> Dict[str, Any]:
     """Generate coverage optimization recommendations using LLM."""
 
@@ -405,7 +555,7 @@ async def _generate_coverage_optimization_from_llm(
         framework=framework,
     )
 
-    client = create_llm_client()
+    client = llm_client or create_llm_client()
     try:
         logger.info("Sending coverage optimization request to LLM")
         raw_response = await client.chat_completion(
@@ -418,7 +568,8 @@ async def _generate_coverage_optimization_from_llm(
         # Parse response to extract coverage optimization recommendations
         return _parse_coverage_optimization_response(raw_response)
     finally:
-        await client.close()
+        if llm_client is None:
+            await client.close()
 
 
 def _parse_coverage_optimization_response(raw_response: str) -> Dict[str, Any]:
@@ -431,21 +582,21 @@ def _parse_coverage_optimization_response(raw_response: str) -> Dict[str, Any]:
 
     if json_blocks:
         try:
-            # Parse JSON from code block
-            data = json.loads(json_blocks[0].strip())
-            if "recommended_tests" in data:
-                return data
-        except json.JSONDecodeError:
+            # Parse and validate the JSON code block in one pass
+            return CoverageOptimizationResult.model_validate_json(
+                json_blocks[0].strip()
+            ).model_dump()
+        except ValidationError:
             # If JSON block parsing fails, try parsing the entire response as JSON below
             pass
 
     # Direct JSON parsing (fallback if no code blocks or JSON block parsing failed)
     try:
-        data = json.loads(raw_response.strip())
-        if "recommended_tests" in data:
-            return data
-    except json.JSONDecodeError:
-        # Response is not valid JSON, will fall back to extracting code blocks below
+        return CoverageOptimizationResult.model_validate_json(
+            raw_response.strip()
+        ).model_dump()
+    except ValidationError:
+        # Response is not a valid result, will fall back to extracting code blocks below
         pass
 
     # Fallback: Try to extract Python code blocks and build recommendations
@@ -1,22 +1,32 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from datetime import UTC, datetime
+from typing import Any, AsyncGenerator, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.context import router as context_router
 from app.api.v1.routes import router as api_router
-from app.config import settings
+from app.config import get_settings
+from app.core.graph.graph_service import GraphService
 from app.core.middleware import RequestIDMiddleware, register_exception_handlers
 from app.core.services.logging_config import setup_logging
 
+# The app is built from the settings at import time
+settings = get_settings()
+
 # Set up structured logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Upper bound on the Neo4j probe so a hung database cannot stall health checks
+HEALTH_CHECK_NEO4J_TIMEOUT_S = 1.0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -24,26 +34,44 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
 
-    # Initialize Neo4j connection and indexes
-    from app.core.graph.graph_service import GraphService
-
+    # Initialize the shared Neo4j connection and indexes. The service is kept
+    # on app.state even if Neo4j is down so graph endpoints can reconnect later.
     graph_service = None
     try:
         logger.info("Initializing Neo4j connection...")
         graph_service = GraphService()
+        app.state.graph_service = graph_service
         await graph_service.connect()
-        await graph_service.create_indexes()
+        await graph_service.ensure_indexes()
         logger.info("Neo4j initialization completed")
     except Exception as e:
         logger.warning(
             "Neo4j initialization failed (continuing without graph features): %s", e
         )
 
+    # Bound how many background tasks execute concurrently
+    app.state.background_semaphore = asyncio.Semaphore(settings.max_background_tasks)
+
+    # Share one rule engine and one pooled LLM HTTP client across requests
+    from app.analyzers.rule_engine import RuleEngine
+    from app.core.llm.llm_client import create_llm_client
+
+    app.state.rule_engine = RuleEngine(
+        feature_cache_dir=settings.rule_feature_cache_dir
+    )
+    app.state.llm_client = create_llm_client()
+
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
 
+    # Close the shared LLM client
+    try:
+        await app.state.llm_client.close()
+    except Exception as e:
+        logger.warning("Error closing LLM client: %s", e)
+
     # Cleanup Neo4j
     if graph_service:
         try:
@@ -82,7 +110,9 @@ app.add_middleware(RequestIDMiddleware)
 # Current configuration allows all origins for development.
 # For production, replace with specific origins:
 # allow_origins=["https://yourdomain.com", "https://app.yourdomain.com"]
-allowed_origins = settings.cors_origins if hasattr(settings, "cors_origins") else ["*"]
+# Exact origins are matched against a set and wildcard origins such as
+# https://*.example.com against one regex, both built once from the settings.
+allowed_origins = settings.cors_origin_set
 
 if "*" in allowed_origins:
     logger.warning(
@@ -93,25 +123,32 @@ if "*" in allowed_origins:
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
+    allow_origin_regex=settings.cors_origin_regex,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization"],
 )
 
 
+async def _probe_neo4j(graph_service: Optional[GraphService]) -> None:
+    """Run a trivial query on the shared GraphService, connecting it if needed."""
+    if graph_service is None:
+        raise RuntimeError("Graph service is not initialized")
+    if not graph_service.connected:
+        await graph_service.connect()
+    await graph_service.client.execute_query("RETURN 1 AS test")
+
+
 @app.get("/health")
-async def health_check() -> dict[str, Any]:
+async def health_check(request: Request) -> dict[str, Any]:
     """
     Health check endpoint with Neo4j connectivity verification.
 
-    Returns 200 with "healthy" or "degraded" status depending on
-    whether Neo4j is accessible.
+    Probes the shared GraphService with a trivial query instead of opening a
+    new driver per check. Reconnecting and the query both run inside the
+    probe timeout, so a hung Neo4j is reported as "degraded" within
+    HEALTH_CHECK_NEO4J_TIMEOUT_S instead of stalling the check.
     """
-    import time
-    from datetime import UTC, datetime
-
-    from app.core.graph.graph_service import GraphService
-
     # Initialize response structure
     health_status = {
         "status": "healthy",
@@ -124,15 +161,14 @@ async def health_check() -> dict[str, Any]:
     }
 
     # Test Neo4j connectivity
-    graph_service = None
     try:
-        graph_service = GraphService()
-        await graph_service.connect()
-
         # Measure query response time
-        start_time = time.time()
-        await graph_service.client.execute_query("RETURN 1 AS test")
-        response_time_ms = int((time.time() - start_time) * 1000)
+        start_ns = time.perf_counter_ns()
+        await asyncio.wait_for(
+            _probe_neo4j(getattr(request.app.state, "graph_service", None)),
+            timeout=HEALTH_CHECK_NEO4J_TIMEOUT_S,
+        )
+        response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         # Neo4j is healthy
         health_status["services"]["neo4j"] = {
@@ -144,32 +180,28 @@ async def health_check() -> dict[str, Any]:
 
     except Exception as e:
         # Neo4j is down, but API is still functional (degraded)
-        logger.warning("Health check: Neo4j down - %s", str(e))
+        logger.warning("Health check: Neo4j down - %s", str(e) or type(e).__name__)
         health_status["status"] = "degraded"
         health_status["services"]["neo4j"] = {
             "status": "down",
             "response_time_ms": None,
         }
 
-    finally:
-        # Clean up connection
-        if graph_service:
-            try:
-                await graph_service.close()
-            except Exception as e:
-                logger.warning("Error closing health check connection: %s", str(e))
-
     return health_status
 
 
+# The root response only depends on settings, so it is built once
+_ROOT_RESPONSE = {
+    "name": settings.app_name,
+    "version": settings.app_version,
+    "description": "FastAPI backend for pytest test analysis",
+}
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "description": "FastAPI backend for pytest test analysis",
-    }
+    return _ROOT_RESPONSE
 
 
 # Include API routes
@@ -5,6 +5,9 @@ from app.models.context import (
     FileSymbols,
     IncrementalUpdateRequest,
     IncrementalUpdateResponse,
+    InitializationJobResponse,
+    InitializationStatusResponse,
+    InitializeProjectHeader,
     InitializeProjectRequest,
     InitializeProjectResponse,
     ProjectStatusResponse,
@@ -15,8 +18,11 @@ from app.models.context import (
 __all__ = [
     "SymbolInfo",
     "FileSymbols",
+    "InitializeProjectHeader",
     "InitializeProjectRequest",
     "InitializeProjectResponse",
+    "InitializationJobResponse",
+    "InitializationStatusResponse",
     "SymbolChange",
     "FileChange",
     "IncrementalUpdateRequest",
@@ -10,6 +10,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Maximum number of files in a single project initialization
+MAX_INITIALIZE_FILES = 5000
+
 
 class SymbolInfo(BaseModel):
     """Represents a single code symbol (function, class, method)."""
@@ -80,8 +83,8 @@ class FileSymbols(BaseModel):
     )
 
 
-class InitializeProjectRequest(BaseModel):
-    """Request to initialize a project's code graph."""
+class InitializeProjectHeader(BaseModel):
+    """Project fields of an initialize request, sent first when streaming."""
 
     project_id: str = Field(
         ...,
@@ -101,9 +104,13 @@ class InitializeProjectRequest(BaseModel):
         description="Programming language (only Python supported)",
     )
 
+
+class InitializeProjectRequest(InitializeProjectHeader):
+    """Request to initialize a project's code graph."""
+
     files: List[FileSymbols] = Field(
         ...,
-        max_length=5000,
+        max_length=MAX_INITIALIZE_FILES,
         description="Files to index",
     )
 
@@ -155,6 +162,26 @@ class InitializeProjectResponse(BaseModel):
     )
 
 
+class InitializationJobResponse(BaseModel):
+    """Response when a large project initialization runs in the background."""
+
+    project_id: str
+    job_id: str = Field(..., description="Identifier to poll for the result")
+    status: str = Field(..., pattern="^(pending|processing)$")
+
+
+class InitializationStatusResponse(BaseModel):
+    """Status of a background project initialization."""
+
+    project_id: str
+    job_id: str
+    status: str = Field(..., pattern="^(pending|processing|completed|failed)$")
+    result: Optional[InitializeProjectResponse] = Field(
+        None, description="Initialization statistics (when status=completed)"
+    )
+    error: Optional[str] = Field(None, description="Failure reason (when failed)")
+
+
 class SymbolChange(BaseModel):
     """Describes a change to a symbol."""
 
@@ -2,7 +2,11 @@
 
 import pytest
 
-from app.analyzers.ast_parser import TestFunctionInfo, parse_test_file
+from app.analyzers.ast_parser import (
+    ASSERTION_TYPES,
+    TestFunctionInfo,
+    parse_test_file,
+)
 
 
 class TestASTParser:
@@ -126,3 +130,135 @@ def test_imports():
         assert ("pytest", None) in import_aliases
         assert ("datetime", None) in import_aliases
         assert ("os.path", "path") in import_aliases
+
+    def test_parse_decorator_names(self):
+        """Test that decorators are recorded as dotted names without arguments."""
+        source_code = """
+import pytest
+from unittest.mock import patch
+
+@pytest.mark.parametrize("value", [1, 2])
+@patch("app.service.send_email")
+def test_decorated(mock_send, value):
+    assert value
+"""
+
+        result = parse_test_file("test_file.py", source_code)
+
+        test_func = result.test_functions[0]
+        assert test_func.decorators == ["pytest.mark.parametrize", "patch"]
+
+    def test_helper_function_assertions_not_attributed_to_tests(self):
+        """Test that assertions in helper functions are not counted for tests."""
+        source_code = """
+def test_uses_helper():
+    check_value(1)
+
+def check_value(value):
+    assert value == 1
+"""
+
+        result = parse_test_file("test_file.py", source_code)
+
+        assert len(result.test_functions) == 1
+        assert result.test_functions[0].assertions == []
+
+    def test_file_without_tests_is_not_parsed(self):
+        """Test that files with no test markers short-circuit to an empty result."""
+        source_code = """
+import os
+
+def helper(:
+"""
+
+        result = parse_test_file("helpers.py", source_code)
+
+        assert not result.has_syntax_errors
+        assert result.test_functions == []
+        assert result.imports == []
+
+    def test_fixture_assertions_not_attributed_to_previous_test(self):
+        """Test that assertions are collected only from their owning test."""
+        source_code = """
+import pytest
+
+def test_first():
+    assert compute() == 1
+
+@pytest.fixture
+def prepared():
+    value = compute()
+    assert value is not None
+    return value
+"""
+
+        result = parse_test_file("test_file.py", source_code)
+
+        assert len(result.test_functions) == 1
+        assert len(result.test_functions[0].assertions) == 1
+        assert result.test_functions[0].assertions[0].line_number == 5
+
+    def test_collect_call_names(self):
+        """Test that call names are collected from test bodies in source order."""
+        source_code = """
+from unittest.mock import patch
+
+@patch("app.service.send_email")
+def test_send(mock_send):
+    response = client.post(build_url(), json=payload())
+    assert response.json() == expected(), describe(response)
+
+def helper():
+    return ignored_call()
+"""
+
+        result = parse_test_file("test_file.py", source_code)
+
+        assert result.test_functions[0].call_names == [
+            "post",
+            "build_url",
+            "payload",
+            "json",
+            "expected",
+            "describe",
+        ]
+
+    def test_call_names_skip_decorators_defaults_and_annotations(self):
+        """Test that only the test body contributes call names."""
+        source_code = """
+import pytest
+
+@pytest.mark.parametrize("v", [open_session()])
+def test_p(v, timeout=default_timeout()) -> make_type():
+    def inner(x=nested_default()):
+        return x
+    assert v == run()
+"""
+
+        result = parse_test_file("test_file.py", source_code)
+
+        assert result.test_functions[0].call_names == ["nested_default", "run"]
+
+    def test_assertion_table_columns(self):
+        """Test that assertions are exported as parallel numeric columns."""
+        source_code = """
+def test_one():
+    assert result == 1
+    assert True
+
+class TestGroup:
+    def test_two(self):
+        assert item in items
+"""
+
+        result = parse_test_file("test_file.py", source_code)
+        table = result.assertion_table()
+
+        assert list(table["line"]) == [3, 4, 8]
+        assert [ASSERTION_TYPES[i] for i in table["type_id"]] == [
+            "equality",
+            "trivial-true",
+            "membership",
+        ]
+        assert list(table["is_trivial"]) == [0, 1, 0]
+        assert list(table["function_index"]) == [0, 0, 1]
@@ -2,10 +2,12 @@
 
 import pytest
 
+from app.analyzers import rule_engine as rule_engine_module
 from app.analyzers.ast_parser import parse_test_file
 from app.analyzers.rule_engine import (
     MissingAssertionRule,
     RedundantAssertionRule,
+    Rule,
     RuleEngine,
 )
 
@@ -181,3 +183,167 @@ def test_missing_assertion():
         assert issue.suggestion.action == "add"
         assert issue.suggestion.explanation is not None
         assert "assert" in issue.suggestion.new_code
+
+    def test_function_source_parsed_once(self, monkeypatch):
+        """Test that rules share a single parse of each test function."""
+        source_code = """
+def test_fetch():
+    response = requests.get(url)
+    assert response.ok
+"""
+
+        parsed_file = parse_test_file("test_file.py", source_code)
+        calls = []
+
+        def counting_compile(source, *args, **kwargs):
+            calls.append(source)
+            return compile(source, *args, **kwargs)
+
+        monkeypatch.setattr(
+            rule_engine_module, "compile", counting_compile, raising=False
+        )
+        self.rule_engine.analyze(parsed_file)
+
+        assert len(calls) == 1
+
+    def test_rule_check_matches_engine_output(self):
+        """Test that running a rule alone matches the fused engine pass."""
+        source_code = """
+def test_first():
+    assert value == 1
+    assert value == 1
+
+class TestGroup:
+    def test_second(self):
+        assert item
+        assert item
+"""
+
+        parsed_file = parse_test_file("test_file.py", source_code)
+        engine_issues = [
+            issue
+            for issue in self.rule_engine.analyze(parsed_file)
+            if issue.type == "redundant-assertion"
+        ]
+
+        assert RedundantAssertionRule().check(parsed_file) == engine_issues
+        assert [issue.line for issue in engine_issues] == [4, 9]
+
+    def test_issues_share_interned_rule_strings(self):
+        """Test that issues reuse the rule's interned id and severity."""
+
+        class DynamicRule(Rule):
+            __slots__ = ()
+
+        # Runtime copies of strings that are already interned as constants
+        rule_id = "".join(["redundant", "-assertion"])
+        severity = "".join(["warn", "ing"])
+        rule = DynamicRule(rule_id, severity, "")
+
+        issue = rule.create_issue("test_file.py", 1)
+
+        assert issue.type is rule.rule_id
+        assert issue.severity is rule.severity
+
+    def test_feature_cache_skips_parsing_unchanged_functions(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that cached body scans are reused by a fresh engine."""
+        source_code = """
+def test_user():
+    name = "test"
+    user = User()
+    assert user.id > 0
+"""
+
+        first = RuleEngine(feature_cache_dir=str(tmp_path)).analyze(
+            parse_test_file("test_file.py", source_code)
+        )
+
+        def failing_compile(*args, **kwargs):
+            raise AssertionError("function source should not be parsed again")
+
+        monkeypatch.setattr(
+            rule_engine_module, "compile", failing_compile, raising=False
+        )
+        second = RuleEngine(feature_cache_dir=str(tmp_path)).analyze(
+            parse_test_file("test_file.py", source_code)
+        )
+
+        assert second == first
+        assert [issue.type for issue in second] == ["unused-variable"]
+
+    @pytest.mark.parametrize(
+        "entry", [b"[1, 2]", b'{"is_function": true}', b"\x80not json", b""]
+    )
+    def test_feature_cache_treats_bad_entries_as_misses(self, tmp_path, entry):
+        """Test that corrupt or foreign cache entries do not fail analysis."""
+        source_code = """
+def test_user():
+    name = "test"
+    assert True
+"""
+
+        first = RuleEngine(feature_cache_dir=str(tmp_path)).analyze(
+            parse_test_file("test_file.py", source_code)
+        )
+        entries = list(tmp_path.rglob("*.json"))
+        assert entries
+        for path in entries:
+            path.write_bytes(entry)
+
+        second = RuleEngine(feature_cache_dir=str(tmp_path)).analyze(
+            parse_test_file("test_file.py", source_code)
+        )
+
+        assert second == first
+
+    def test_missing_mock_ignores_calls_in_decorators(self):
+        """Test that calls in a test's decorators are not reported as unmocked."""
+        source_code = """
+import pytest
+
+@pytest.mark.parametrize("v", [open_session()])
+def test_p(v):
+    assert v == 1
+"""
+
+        parsed_file = parse_test_file("test_file.py", source_code)
+        issues = self.rule_engine.analyze(parsed_file)
+
+        assert [issue for issue in issues if issue.type == "missing-mock"] == []
+
+    def test_missing_mock_honors_mock_fixtures_in_decorators(self):
+        """Test that mock fixtures requested via usefixtures count as mocking."""
+        source_code = """
+import pytest
+
+@pytest.mark.usefixtures("fake_db")
+def test_save():
+    save_user(build_user())
+    assert True
+"""
+
+        parsed_file = parse_test_file("test_file.py", source_code)
+        issues = self.rule_engine.analyze(parsed_file)
+
+        assert parsed_file.test_functions[0].decorator_args == ["fake_db"]
+        assert [issue for issue in issues if issue.type == "missing-mock"] == []
+
+    def test_missing_mock_detection_in_test_class(self):
+        """Test that calls made by test methods are checked for mocking."""
+        source_code = """
+class TestUserStore:
+    def test_save(self):
+        save_user(build_user())
+        assert True
+"""
+
+        parsed_file = parse_test_file("test_file.py", source_code)
+        issues = self.rule_engine.analyze(parsed_file)
+
+        missing_mock_issues = [
+            issue for issue in issues if issue.type == "missing-mock"
+        ]
+        assert len(missing_mock_issues) == 1
+        assert "save_user" in missing_mock_issues[0].message
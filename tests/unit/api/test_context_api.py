@@ -4,6 +4,7 @@ Unit tests for Context Management API endpoints.
 Tests all three production endpoints using mocked GraphService.
 """
 
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,8 +12,10 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.api.v1.context import router
+from app.api.v1.context import iter_ndjson_lines, router, run_initialize_job
+from app.core.error_handlers import VersionConflictError
 from app.core.middleware import register_exception_handlers
+from app.core.tasks.tasks import TaskStatus
 from app.models.context import (
     FileSymbols,
     IncrementalUpdateRequest,
@@ -34,14 +37,21 @@ def mock_graph_service():
     service.connect = AsyncMock()
     service.close = AsyncMock()
     service.create_indexes = AsyncMock()
+    service.ensure_indexes = AsyncMock()
     service.check_project_exists = AsyncMock()
     service.batch_create_symbols_chunked = AsyncMock()
+    service.batch_create_symbol_columns = AsyncMock()
     service.create_call_relationships = AsyncMock()
+    service.create_call_relationship_columns = AsyncMock()
     service.increment_project_version = AsyncMock()
     service.get_project_statistics = AsyncMock()
     service.get_project_version = AsyncMock()
+    service.get_project_revision = AsyncMock()
+    service.get_project_version_and_stats = AsyncMock()
     service.delete_file_symbols = AsyncMock()
     service.update_file_symbols = AsyncMock()
+    service.apply_file_changes_batch = AsyncMock()
+    service.apply_incremental_update = AsyncMock()
     service.delete_project = AsyncMock()
     service.get_project_data = AsyncMock()
     return service
@@ -54,11 +64,11 @@ class TestInitializeProjectEndpoint:
         """Test successful project initialization."""
         # Setup mocks
         mock_graph_service.check_project_exists.return_value = False
-        mock_graph_service.batch_create_symbols_chunked.return_value = 10
-        mock_graph_service.create_call_relationships.return_value = 5
+        mock_graph_service.batch_create_symbol_columns.return_value = 10
+        mock_graph_service.create_call_relationship_columns.return_value = 5
         mock_graph_service.increment_project_version.return_value = 1
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             # Make request
             response = client.post(
                 "/context/projects/initialize",
@@ -89,12 +99,13 @@ class TestInitializeProjectEndpoint:
         assert data["indexed_files"] == 1
         assert data["indexed_symbols"] == 10
         assert "processing_time_ms" in data
+        mock_graph_service.ensure_indexes.assert_awaited_once()
 
     def test_initialize_project_already_exists(self, mock_graph_service):
         """Test initialization when project already exists."""
         mock_graph_service.check_project_exists.return_value = True
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.post(
                 "/context/projects/initialize",
                 json={
@@ -107,27 +118,57 @@ class TestInitializeProjectEndpoint:
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"]
 
-    def test_initialize_project_validation_error(self):
+    def test_initialize_existing_project_skips_index_creation(self, mock_graph_service):
+        """Test that the 409 path returns before any index DDL."""
+        mock_graph_service.check_project_exists.return_value = True
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "existing-project",
+                    "workspace_path": "/test/path",
+                    "files": [
+                        {
+                            "path": "test.py",
+                            "symbols": [
+                                {
+                                    "name": "test_func",
+                                    "kind": "function",
+                                    "line_start": 1,
+                                    "line_end": 5,
+                                }
+                            ],
+                        }
+                    ],
+                },
+            )
+
+        assert response.status_code == 409
+        mock_graph_service.ensure_indexes.assert_not_awaited()
+
+    def test_initialize_project_validation_error(self, mock_graph_service):
         """Test initialization with invalid request data."""
-        response = client.post(
-            "/context/projects/initialize",
-            json={
-                "project_id": "",  # Empty project_id (invalid)
-                "workspace_path": "/test/path",
-                "files": [],  # Empty files (invalid)
-            },
-        )
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "",  # Empty project_id (invalid)
+                    "workspace_path": "/test/path",
+                    "files": [],  # Empty files (invalid)
+                },
+            )
 
         assert response.status_code == 422
 
     def test_initialize_project_with_multiple_files(self, mock_graph_service):
         """Test initialization with multiple files."""
         mock_graph_service.check_project_exists.return_value = False
-        mock_graph_service.batch_create_symbols_chunked.return_value = 50
-        mock_graph_service.create_call_relationships.return_value = 30
+        mock_graph_service.batch_create_symbol_columns.return_value = 50
+        mock_graph_service.create_call_relationship_columns.return_value = 30
         mock_graph_service.increment_project_version.return_value = 1
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.post(
                 "/context/projects/initialize",
                 json={
@@ -164,38 +205,155 @@ class TestInitializeProjectEndpoint:
         data = response.json()
         assert data["indexed_files"] == 2
 
-    def test_initialize_empty_files_returns_422(self):
-        """Test that empty files array returns 422 with EMPTY_FILES code."""
-        response = client.post(
-            "/context/projects/initialize",
-            json={
-                "project_id": "test-project",
-                "workspace_path": "/test/path",
-                "language": "python",
-                "files": [],  # Empty array
-            },
+    def test_initialize_project_writes_files_in_chunks(self, mock_graph_service):
+        """Test that symbols are written per file chunk before any relationship."""
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.batch_create_symbol_columns.side_effect = (
+            lambda project_id, columns: len(columns["qualified_names"])
+        )
+        mock_graph_service.create_call_relationship_columns.side_effect = (
+            lambda project_id, calls: sum(len(c) for c in calls["callees"])
         )
+        mock_graph_service.increment_project_version.return_value = 1
+
+        files = [
+            {
+                "path": f"file{i}.py",
+                "symbols": [
+                    {
+                        "name": f"func{i}",
+                        "kind": "function",
+                        "line_start": 1,
+                        "line_end": 2,
+                        "calls": [f"func{(i + 1) % 3}"],
+                    }
+                ],
+            }
+            for i in range(3)
+        ]
+
+        with (
+            patch("app.api.v1.context.INITIALIZE_FILE_CHUNK_SIZE", 2),
+            patch.object(app.state, "graph_service", mock_graph_service, create=True),
+        ):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "chunked-project",
+                    "workspace_path": "/test/path",
+                    "files": files,
+                },
+            )
+
+        assert response.status_code == 201
+        assert response.json()["indexed_symbols"] == 3
+        writes = [
+            name
+            for name, _, _ in mock_graph_service.mock_calls
+            if name
+            in ("batch_create_symbol_columns", "create_call_relationship_columns")
+        ]
+        assert writes == [
+            "batch_create_symbol_columns",
+            "batch_create_symbol_columns",
+            "create_call_relationship_columns",
+        ]
+        calls = mock_graph_service.create_call_relationship_columns.call_args.args[1]
+        assert calls["callers"] == [
+            "file0.py::func0",
+            "file1.py::func1",
+            "file2.py::func2",
+        ]
+        assert calls["callees"] == [["func1"], ["func2"], ["func0"]]
+
+    def test_initialize_project_overlaps_writes_with_preparation(
+        self, mock_graph_service
+    ):
+        """Test that a chunk's symbol write starts before the next is prepared."""
+        from app.api.v1 import context
+
+        events = []
+        prepare_file = context.prepare_file
+
+        def recording_prepare_file(file_path, symbols, columns, calls):
+            events.append(f"prepare {file_path}")
+            return prepare_file(file_path, symbols, columns, calls)
+
+        async def recording_write(project_id, columns):
+            events.append(f"write {columns['file_paths'][0]}")
+            return len(columns["names"])
+
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.batch_create_symbol_columns.side_effect = recording_write
+        mock_graph_service.increment_project_version.return_value = 1
+
+        files = [
+            {
+                "path": f"file{i}.py",
+                "symbols": [
+                    {"name": "func", "kind": "function", "line_start": 1, "line_end": 2}
+                ],
+            }
+            for i in range(2)
+        ]
+
+        with (
+            patch("app.api.v1.context.INITIALIZE_FILE_CHUNK_SIZE", 1),
+            patch("app.api.v1.context.prepare_file", recording_prepare_file),
+            patch.object(app.state, "graph_service", mock_graph_service, create=True),
+        ):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "pipelined-project",
+                    "workspace_path": "/test/path",
+                    "files": files,
+                },
+            )
+
+        assert response.status_code == 201
+        assert response.json()["indexed_symbols"] == 2
+        assert events == [
+            "prepare file0.py",
+            "write file0.py",
+            "prepare file1.py",
+            "write file1.py",
+        ]
+
+    def test_initialize_empty_files_returns_422(self, mock_graph_service):
+        """Test that empty files array returns 422 with EMPTY_FILES code."""
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "test-project",
+                    "workspace_path": "/test/path",
+                    "language": "python",
+                    "files": [],  # Empty array
+                },
+            )
 
         assert response.status_code == 422
         data = response.json()
         assert data["error_code"] == "EMPTY_FILES"
         assert data["details"]["files_count"] == 0
 
-    def test_initialize_no_symbols_returns_422(self):
+    def test_initialize_no_symbols_returns_422(self, mock_graph_service):
         """Test that files with no symbols returns 422 with NO_SYMBOLS code."""
-        response = client.post(
-            "/context/projects/initialize",
-            json={
-                "project_id": "test-project",
-                "workspace_path": "/test/path",
-                "language": "python",
-                "files": [
-                    {"path": "a.py", "symbols": []},
-                    {"path": "b.py", "symbols": []},
-                    {"path": "c.py", "symbols": []},
-                ],
-            },
-        )
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "test-project",
+                    "workspace_path": "/test/path",
+                    "language": "python",
+                    "files": [
+                        {"path": "a.py", "symbols": []},
+                        {"path": "b.py", "symbols": []},
+                        {"path": "c.py", "symbols": []},
+                    ],
+                },
+            )
 
         assert response.status_code == 422
         data = response.json()
@@ -204,21 +362,372 @@ class TestInitializeProjectEndpoint:
         assert data["details"]["files_with_symbols"] == 0
 
 
+class TestBackgroundInitialization:
+    """Test 202 initialization of large projects and its status endpoint."""
+
+    def test_large_project_returns_202_with_job(self, mock_graph_service):
+        """Test that projects above the threshold are written in the background."""
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.batch_create_symbol_columns.return_value = 2
+
+        files = [
+            {
+                "path": f"file{i}.py",
+                "symbols": [
+                    {"name": "f", "kind": "function", "line_start": 1, "line_end": 2}
+                ],
+            }
+            for i in range(2)
+        ]
+
+        with (
+            patch.object(app.state, "graph_service", mock_graph_service, create=True),
+            patch("app.api.v1.context.BACKGROUND_INITIALIZE_FILE_THRESHOLD", 1),
+            patch(
+                "app.api.v1.context.create_task", AsyncMock(return_value="job-1")
+            ) as mock_create_task,
+            patch("app.api.v1.context.update_task_status", AsyncMock()),
+        ):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "big-project",
+                    "workspace_path": "/test/path",
+                    "files": files,
+                },
+            )
+
+        assert response.status_code == 202
+        assert response.json() == {
+            "project_id": "big-project",
+            "job_id": "job-1",
+            "status": "pending",
+        }
+        assert mock_create_task.await_args.args[0]["files"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_initialize_job_records_result(self, mock_graph_service):
+        """Test that the background job stores the initialization response."""
+        mock_graph_service.batch_create_symbol_columns.return_value = 1
+        request = InitializeProjectRequest(
+            project_id="big-project",
+            workspace_path="/test/path",
+            files=[
+                FileSymbols(
+                    path="a.py",
+                    symbols=[
+                        SymbolInfo(name="f", kind="function", line_start=1, line_end=2)
+                    ],
+                )
+            ],
+        )
+
+        with patch("app.api.v1.context.update_task_status", AsyncMock()) as mock_update:
+            await run_initialize_job("job-1", mock_graph_service, request, 0.0)
+
+        job_id, final_status = mock_update.await_args.args
+        assert (job_id, final_status) == ("job-1", TaskStatus.COMPLETED)
+        assert mock_update.await_args.kwargs["result"]["indexed_symbols"] == 1
+
+    @pytest.mark.asyncio
+    async def test_run_initialize_job_failure_deletes_project(self, mock_graph_service):
+        """Test that a failed background job removes the partial project."""
+        mock_graph_service.batch_create_symbol_columns.side_effect = RuntimeError(
+            "write failed"
+        )
+        request = InitializeProjectRequest(
+            project_id="big-project",
+            workspace_path="/test/path",
+            files=[
+                FileSymbols(
+                    path="a.py",
+                    symbols=[
+                        SymbolInfo(name="f", kind="function", line_start=1, line_end=2)
+                    ],
+                )
+            ],
+        )
+
+        with patch("app.api.v1.context.update_task_status", AsyncMock()) as mock_update:
+            await run_initialize_job("job-1", mock_graph_service, request, 0.0)
+
+        mock_graph_service.delete_project.assert_awaited_once_with("big-project")
+        assert mock_update.await_args.args == ("job-1", TaskStatus.FAILED)
+        assert mock_update.await_args.kwargs["error"] == "write failed"
+
+    @pytest.mark.asyncio
+    async def test_run_initialize_job_status_update_failure_is_logged(
+        self, mock_graph_service
+    ):
+        """Test that a failing status update does not escape the job."""
+        mock_graph_service.batch_create_symbol_columns.return_value = 1
+        request = InitializeProjectRequest(
+            project_id="big-project",
+            workspace_path="/test/path",
+            files=[
+                FileSymbols(
+                    path="a.py",
+                    symbols=[
+                        SymbolInfo(name="f", kind="function", line_start=1, line_end=2)
+                    ],
+                )
+            ],
+        )
+        mock_update = AsyncMock(side_effect=[None, ConnectionError("redis down")])
+
+        with patch("app.api.v1.context.update_task_status", mock_update):
+            await run_initialize_job("job-1", mock_graph_service, request, 0.0)
+
+        assert mock_update.await_count == 2
+        mock_graph_service.delete_project.assert_not_awaited()
+
+    def test_ensure_indexes_failure_returns_503(self, mock_graph_service):
+        """Test that failing index creation is reported as 503."""
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.ensure_indexes.side_effect = RuntimeError("db down")
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "test-project",
+                    "workspace_path": "/test/path",
+                    "files": [
+                        {
+                            "path": "a.py",
+                            "symbols": [
+                                {
+                                    "name": "f",
+                                    "kind": "function",
+                                    "line_start": 1,
+                                    "line_end": 2,
+                                }
+                            ],
+                        }
+                    ],
+                },
+            )
+
+        assert response.status_code == 503
+
+    def test_initialization_status_completed(self):
+        """Test polling a completed background initialization."""
+        task = {
+            "id": "job-1",
+            "status": "completed",
+            "payload": {"type": "initialize_project", "project_id": "big-project"},
+            "result": {
+                "project_id": "big-project",
+                "status": "initialized",
+                "indexed_files": 2,
+                "indexed_symbols": 2,
+                "processing_time_ms": 10,
+            },
+            "error": None,
+        }
+
+        with patch("app.api.v1.context.get_task", AsyncMock(return_value=task)):
+            response = client.get(
+                "/context/projects/big-project/initialization-status/job-1"
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["result"]["indexed_symbols"] == 2
+
+    def test_initialization_status_wrong_project_returns_404(self):
+        """Test that a job id cannot be polled through another project."""
+        task = {
+            "id": "job-1",
+            "status": "pending",
+            "payload": {"type": "initialize_project", "project_id": "big-project"},
+            "result": None,
+            "error": None,
+        }
+
+        with patch("app.api.v1.context.get_task", AsyncMock(return_value=task)):
+            response = client.get(
+                "/context/projects/other-project/initialization-status/job-1"
+            )
+
+        assert response.status_code == 404
+
+
+class TestInitializeProjectStreamEndpoint:
+    """Test POST /context/projects/initialize/stream."""
+
+    header = {"project_id": "test-project", "workspace_path": "/test/path"}
+
+    @staticmethod
+    def ndjson(*documents):
+        """Encode documents as an NDJSON body."""
+        return "\n".join(json.dumps(d) for d in documents) + "\n"
+
+    def test_initialize_stream_success(self, mock_graph_service):
+        """Test that files streamed after the header are written."""
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.batch_create_symbol_columns.side_effect = (
+            lambda project_id, columns: len(columns["names"])
+        )
+        mock_graph_service.create_call_relationship_columns.return_value = 1
+
+        body = self.ndjson(
+            self.header,
+            {
+                "path": "a.py",
+                "symbols": [
+                    {
+                        "name": "f",
+                        "kind": "function",
+                        "line_start": 1,
+                        "line_end": 2,
+                        "calls": ["g"],
+                    }
+                ],
+            },
+            {
+                "path": "b.py",
+                "symbols": [
+                    {"name": "g", "kind": "function", "line_start": 1, "line_end": 2}
+                ],
+            },
+        )
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize/stream",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["indexed_files"] == 2
+        assert data["indexed_symbols"] == 2
+        columns = mock_graph_service.batch_create_symbol_columns.call_args.args[1]
+        assert columns["qualified_names"] == ["a.py::f", "b.py::g"]
+        mock_graph_service.increment_project_version.assert_awaited_once_with(
+            "test-project"
+        )
+
+    def test_initialize_stream_invalid_line_cleans_up(self, mock_graph_service):
+        """Test that an invalid file line returns 422 and removes written data."""
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.batch_create_symbol_columns.return_value = 0
+
+        body = self.ndjson(self.header, {"path": "not-python.txt", "symbols": []})
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize/stream",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+        assert response.status_code == 422
+        assert response.json()["details"]["field"] == "line 2"
+        mock_graph_service.delete_project.assert_awaited_once_with("test-project")
+        mock_graph_service.increment_project_version.assert_not_called()
+
+    def test_initialize_stream_database_failure_cleans_up(self, mock_graph_service):
+        """Test that a failed write returns 503 and removes written data."""
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.batch_create_symbol_columns.return_value = 1
+        mock_graph_service.create_call_relationship_columns.side_effect = RuntimeError(
+            "db down"
+        )
+
+        body = self.ndjson(
+            self.header,
+            {
+                "path": "a.py",
+                "symbols": [
+                    {"name": "f", "kind": "function", "line_start": 1, "line_end": 2}
+                ],
+            },
+        )
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize/stream",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+        assert response.status_code == 503
+        mock_graph_service.delete_project.assert_awaited_once_with("test-project")
+
+    def test_initialize_stream_too_many_files_returns_422(self, mock_graph_service):
+        """Test that the stream enforces the same file limit as the JSON body."""
+        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.batch_create_symbol_columns.return_value = 1
+
+        file = {
+            "path": "a.py",
+            "symbols": [
+                {"name": "f", "kind": "function", "line_start": 1, "line_end": 2}
+            ],
+        }
+        body = self.ndjson(self.header, file, file, file)
+
+        with (
+            patch.object(app.state, "graph_service", mock_graph_service, create=True),
+            patch("app.api.v1.context.MAX_INITIALIZE_FILES", 2),
+        ):
+            response = client.post(
+                "/context/projects/initialize/stream",
+                content=body,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+        assert response.status_code == 422
+        assert response.json()["details"]["field"] == "line 4"
+        mock_graph_service.delete_project.assert_awaited_once_with("test-project")
+
+    @pytest.mark.asyncio
+    async def test_iter_ndjson_lines_joins_split_lines(self):
+        """Test that lines split across body chunks are reassembled."""
+
+        async def stream():
+            for data in (b'{"a"', b": 1}\n\n{", b'"b": 2}\n{"c', b'": 3}'):
+                yield data
+
+        request = MagicMock()
+        request.stream = stream
+
+        lines = [line async for line in iter_ndjson_lines(request)]
+
+        assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+    def test_initialize_stream_existing_project_returns_409(self, mock_graph_service):
+        """Test that the 409 check runs before any file line is read."""
+        mock_graph_service.check_project_exists.return_value = True
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.post(
+                "/context/projects/initialize/stream",
+                content=self.ndjson(self.header),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+
+        assert response.status_code == 409
+        mock_graph_service.batch_create_symbol_columns.assert_not_called()
+
+
 class TestIncrementalUpdateEndpoint:
     """Test PATCH /context/projects/{project_id}/incremental."""
 
     def test_incremental_update_success(self, mock_graph_service):
         """Test successful incremental update."""
-        mock_graph_service.check_project_exists.return_value = True
-        mock_graph_service.get_project_version.return_value = 2
-        mock_graph_service.update_file_symbols.return_value = {
-            "added": 1,
-            "modified": 2,
-            "deleted": 0,
-        }
-        mock_graph_service.increment_project_version.return_value = 3
+        mock_graph_service.get_project_revision.return_value = (True, 2, None)
+        mock_graph_service.apply_incremental_update.return_value = (
+            3,
+            3,
+            datetime(2025, 1, 2, tzinfo=UTC),
+        )
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.patch(
                 "/context/projects/test-project/incremental",
                 json={
@@ -245,16 +754,18 @@ class TestIncrementalUpdateEndpoint:
             )
 
         assert response.status_code == 200
+        mock_graph_service.get_project_version_and_stats.assert_not_called()
         data = response.json()
         assert data["project_id"] == "test-project"
         assert data["version"] == 3
         assert data["changes_applied"] == 3
+        assert data["updated_at"].startswith("2025-01-02T00:00:00")
 
     def test_incremental_update_project_not_found(self, mock_graph_service):
         """Test update when project doesn't exist."""
-        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.get_project_revision.return_value = (False, 0, None)
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.patch(
                 "/context/projects/nonexistent/incremental",
                 json={
@@ -273,10 +784,13 @@ class TestIncrementalUpdateEndpoint:
 
     def test_incremental_update_version_conflict(self, mock_graph_service):
         """Test update with version conflict."""
-        mock_graph_service.check_project_exists.return_value = True
-        mock_graph_service.get_project_version.return_value = 5  # Current is 5
+        mock_graph_service.get_project_revision.return_value = (
+            True,
+            5,
+            None,
+        )  # Current is 5
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.patch(
                 "/context/projects/test-project/incremental",
                 json={
@@ -293,14 +807,35 @@ class TestIncrementalUpdateEndpoint:
         assert response.status_code == 409
         assert "Version conflict" in response.json()["detail"]
 
+    def test_incremental_update_concurrent_conflict(self, mock_graph_service):
+        """Test that losing a race inside the write transaction returns 409."""
+        mock_graph_service.get_project_revision.return_value = (True, 2, None)
+        mock_graph_service.apply_incremental_update.side_effect = VersionConflictError(
+            expected=3, received=2, project_id="test-project"
+        )
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.patch(
+                "/context/projects/test-project/incremental",
+                json={
+                    "version": 2,
+                    "changes": [{"file_path": "old_file.py", "action": "deleted"}],
+                },
+            )
+
+        assert response.status_code == 409
+        mock_graph_service.apply_incremental_update.assert_awaited_once()
+
     def test_incremental_update_file_deletion(self, mock_graph_service):
         """Test deleting a file."""
-        mock_graph_service.check_project_exists.return_value = True
-        mock_graph_service.get_project_version.return_value = 1
-        mock_graph_service.delete_file_symbols.return_value = 5
-        mock_graph_service.increment_project_version.return_value = 2
+        mock_graph_service.get_project_revision.return_value = (True, 1, None)
+        mock_graph_service.apply_incremental_update.return_value = (
+            5,
+            2,
+            datetime(2025, 1, 2, tzinfo=UTC),
+        )
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.patch(
                 "/context/projects/test-project/incremental",
                 json={
@@ -322,17 +857,24 @@ class TestIncrementalUpdateEndpoint:
 class TestProjectStatusEndpoint:
     """Test GET /context/projects/{project_id}/status."""
 
+    CREATED_AT = datetime(2025, 1, 1, tzinfo=UTC)
+    ETAG_V3 = f'W/"test-project:{int(CREATED_AT.timestamp() * 1_000_000)}:3"'
+
     def test_get_project_status_success(self, mock_graph_service):
         """Test successful status retrieval."""
-        mock_graph_service.check_project_exists.return_value = True
-        mock_graph_service.get_project_statistics.return_value = {
-            "total_files": 10,
-            "total_symbols": 50,
-            "total_relationships": 75,
-        }
-        mock_graph_service.get_project_version.return_value = 3
+        mock_graph_service.get_project_version_and_stats.return_value = (
+            True,
+            3,
+            {
+                "total_files": 10,
+                "total_symbols": 50,
+                "total_relationships": 75,
+                "last_updated_at": datetime(2025, 1, 2, tzinfo=UTC),
+                "created_at": self.CREATED_AT,
+            },
+        )
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.get("/context/projects/test-project/status")
 
         assert response.status_code == 200
@@ -342,13 +884,100 @@ class TestProjectStatusEndpoint:
         assert data["indexed_files"] == 10
         assert data["indexed_symbols"] == 50
         assert data["backend_version"] == 3
-        assert "last_updated_at" in data
+        assert data["last_updated_at"].startswith("2025-01-02T00:00:00")
+        assert response.headers["etag"] == self.ETAG_V3
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_get_project_status_not_modified(self, mock_graph_service):
+        """Test that a matching If-None-Match skips the statistics query."""
+        mock_graph_service.get_project_revision.return_value = (
+            True,
+            3,
+            self.CREATED_AT,
+        )
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.get(
+                "/context/projects/test-project/status",
+                headers={"If-None-Match": self.ETAG_V3},
+            )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == self.ETAG_V3
+        mock_graph_service.get_project_version_and_stats.assert_not_called()
+
+    def test_get_project_status_stale_etag_returns_full_status(
+        self, mock_graph_service
+    ):
+        """Test that an outdated If-None-Match gets the new status and ETag."""
+        mock_graph_service.get_project_revision.return_value = (
+            True,
+            4,
+            self.CREATED_AT,
+        )
+        mock_graph_service.get_project_version_and_stats.return_value = (
+            True,
+            4,
+            {
+                "total_files": 10,
+                "total_symbols": 51,
+                "total_relationships": 75,
+                "last_updated_at": datetime(2025, 1, 3, tzinfo=UTC),
+                "created_at": self.CREATED_AT,
+            },
+        )
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.get(
+                "/context/projects/test-project/status",
+                headers={"If-None-Match": self.ETAG_V3},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["backend_version"] == 4
+        assert response.headers["etag"] == self.ETAG_V3.replace(":3", ":4")
+
+    def test_get_project_status_reinitialized_project_is_not_cached(
+        self, mock_graph_service
+    ):
+        """Test that a re-created project at the same version gets a new ETag."""
+        recreated_at = datetime(2025, 2, 1, tzinfo=UTC)
+        mock_graph_service.get_project_revision.return_value = (
+            True,
+            3,
+            recreated_at,
+        )
+        mock_graph_service.get_project_version_and_stats.return_value = (
+            True,
+            3,
+            {
+                "total_files": 1,
+                "total_symbols": 2,
+                "total_relationships": 0,
+                "last_updated_at": recreated_at,
+                "created_at": recreated_at,
+            },
+        )
+
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
+            response = client.get(
+                "/context/projects/test-project/status",
+                headers={"If-None-Match": self.ETAG_V3},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != self.ETAG_V3
 
     def test_get_project_status_not_found(self, mock_graph_service):
         """Test status when project doesn't exist."""
-        mock_graph_service.check_project_exists.return_value = False
+        mock_graph_service.get_project_version_and_stats.return_value = (
+            False,
+            0,
+            {"total_files": 0, "total_symbols": 0, "total_relationships": 0},
+        )
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.get("/context/projects/nonexistent/status")
 
         assert response.status_code == 404
@@ -394,7 +1023,7 @@ class TestGetProjectDataEndpoint:
             ],
         }
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.get("/context/projects/test-project")
 
         assert response.status_code == 200
@@ -415,7 +1044,7 @@ class TestGetProjectDataEndpoint:
             "nonexistent-project"
         )
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.get("/context/projects/nonexistent-project")
 
         assert response.status_code == 404
@@ -429,7 +1058,7 @@ class TestGetProjectDataEndpoint:
             "Database connection lost"
         )
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.get("/context/projects/test-project")
 
         assert response.status_code == 503
@@ -439,29 +1068,13 @@ class TestGetProjectDataEndpoint:
 class TestHelperFunctions:
     """Test helper functions for data preparation."""
 
-    def test_prepare_symbols_for_db(self):
-        """Test symbol preparation adds qualified_name."""
-        from app.api.v1.context import prepare_symbols_for_db
-
-        symbols = [
-            SymbolInfo(
-                name="test_func",
-                kind="function",
-                line_start=1,
-                line_end=5,
-            )
-        ]
-
-        result = prepare_symbols_for_db("test.py", symbols)
-
-        assert len(result) == 1
-        assert result[0]["name"] == "test_func"
-        assert result[0]["qualified_name"] == "test.py::test_func"
-        assert result[0]["file_path"] == "test.py"
-
-    def test_prepare_relationships(self):
-        """Test relationship extraction from symbols."""
-        from app.api.v1.context import prepare_relationships
+    def test_prepare_file(self):
+        """Test symbol preparation fills the columns and extracts calls."""
+        from app.api.v1.context import (
+            new_call_columns,
+            new_symbol_columns,
+            prepare_file,
+        )
 
         symbols = [
             SymbolInfo(
@@ -473,12 +1086,20 @@ class TestHelperFunctions:
             )
         ]
 
-        result = prepare_relationships("test.py", symbols)
+        columns = new_symbol_columns()
+        calls = new_call_columns()
+        prepare_file("test.py", symbols, columns, calls)
 
-        assert len(result) == 2
-        assert result[0]["caller_qualified_name"] == "test.py::caller"
-        assert result[0]["callee_qualified_name"] == "callee1"
-        assert result[0]["line"] == 10
+        assert columns["names"] == ["caller"]
+        assert columns["qualified_names"] == ["test.py::caller"]
+        assert columns["file_paths"] == ["test.py"]
+        assert columns["signatures"] == [""]
+
+        assert calls == {
+            "callers": ["test.py::caller"],
+            "callees": [["callee1", "callee2"]],
+            "lines": [10],
+        }
 
 
 class TestDeleteProjectEndpoint:
@@ -488,7 +1109,7 @@ class TestDeleteProjectEndpoint:
         """Test successful project deletion with symbols."""
         mock_graph_service.delete_project.return_value = 42  # 42 symbols deleted
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.delete("/context/projects/test-project")
 
         assert response.status_code == 204
@@ -499,7 +1120,7 @@ class TestDeleteProjectEndpoint:
         """Test deletion is idempotent when project doesn't exist."""
         mock_graph_service.delete_project.return_value = 0  # No symbols deleted
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.delete("/context/projects/nonexistent-project")
 
         assert response.status_code == 204
@@ -512,9 +1133,89 @@ class TestDeleteProjectEndpoint:
             "Database connection lost"
         )
 
-        with patch("app.api.v1.context.GraphService", return_value=mock_graph_service):
+        with patch.object(app.state, "graph_service", mock_graph_service, create=True):
             response = client.delete("/context/projects/test-project")
 
         assert response.status_code == 503
         data = response.json()
         assert "Database operation failed" in data["detail"]
+
+
+class TestGraphServiceDependency:
+    """Test get_graph_service when Neo4j is unreachable."""
+
+    def test_unavailable_database_returns_503_and_backs_off(self):
+        """Test a failed connect returns 503 and is not retried immediately."""
+        service = MagicMock()
+        service.connected = False
+        service.connect = AsyncMock(side_effect=Exception("connection refused"))
+
+        with (
+            patch.object(app.state, "graph_service", service, create=True),
+            patch.object(app.state, "graph_reconnect_at", 0.0, create=True),
+        ):
+            first = client.get("/context/projects/test-project/status")
+            second = client.get("/context/projects/test-project/status")
+
+        assert first.status_code == 503
+        assert "Graph database service unavailable" in first.json()["detail"]
+        assert second.status_code == 503
+        service.connect.assert_awaited_once()
+
+    def test_initialize_validation_runs_while_database_is_down(self):
+        """Test that malformed initialize bodies get 422, not 503, during backoff."""
+        service = MagicMock()
+        service.connected = False
+        service.connect = AsyncMock()
+
+        with (
+            patch.object(app.state, "graph_service", service, create=True),
+            patch.object(app.state, "graph_reconnect_at", float("inf"), create=True),
+        ):
+            empty = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "test-project",
+                    "workspace_path": "/test/path",
+                    "files": [],
+                },
+            )
+            no_symbols = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "test-project",
+                    "workspace_path": "/test/path",
+                    "files": [{"path": "a.py", "symbols": []}],
+                },
+            )
+            stream = client.post(
+                "/context/projects/initialize/stream",
+                content=b"",
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            valid = client.post(
+                "/context/projects/initialize",
+                json={
+                    "project_id": "test-project",
+                    "workspace_path": "/test/path",
+                    "files": [
+                        {
+                            "path": "a.py",
+                            "symbols": [
+                                {
+                                    "name": "f",
+                                    "kind": "function",
+                                    "line_start": 1,
+                                    "line_end": 2,
+                                }
+                            ],
+                        }
+                    ],
+                },
+            )
+
+        assert empty.status_code == 422
+        assert no_symbols.status_code == 422
+        assert stream.status_code == 422
+        assert valid.status_code == 503
+        service.connect.assert_not_awaited()
@@ -43,6 +43,67 @@ async def test_neo4j_client_connect_success(mock_driver):
         mock_driver.verify_connectivity.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_neo4j_client_connect_failure_closes_driver(mock_driver):
+    """Verify that a driver failing its connectivity check is closed again."""
+    mock_driver.verify_connectivity.side_effect = Exception("connection refused")
+
+    with patch("app.core.graph.neo4j_client.AsyncGraphDatabase.driver") as mock_create:
+        mock_create.return_value = mock_driver
+
+        client = Neo4jClient()
+
+        with pytest.raises(Neo4jConnectionError):
+            await client.connect()
+
+    mock_driver.close.assert_awaited_once()
+    assert client._driver is None
+    assert client._connected is False
+
+
+@pytest.mark.asyncio
+async def test_neo4j_client_passes_pool_settings_to_driver(mock_driver):
+    """Verify that pool size and acquisition timeout reach the driver."""
+    with patch("app.core.graph.neo4j_client.AsyncGraphDatabase.driver") as mock_create:
+        mock_create.return_value = mock_driver
+
+        client = Neo4jClient(
+            max_connection_pool_size=200,
+            connection_acquisition_timeout=5.0,
+        )
+
+        await client.connect()
+
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 200
+        assert kwargs["connection_acquisition_timeout"] == 5.0
+
+
+def test_settings_read_pool_env_vars(monkeypatch):
+    """Verify that the short pool environment variable names are accepted."""
+    from app.config import Settings
+
+    monkeypatch.setenv("NEO4J_MAX_POOL_SIZE", "150")
+    monkeypatch.setenv("NEO4J_ACQUISITION_TIMEOUT_S", "2.5")
+
+    loaded = Settings()
+
+    assert loaded.neo4j_max_connection_pool_size == 150
+    assert loaded.neo4j_connection_acquisition_timeout == 2.5
+
+
+def test_get_settings_is_cached_until_cleared():
+    """Verify that settings are read once and re-read after cache_clear."""
+    from app.config import get_settings
+
+    first = get_settings()
+    assert get_settings() is first
+
+    get_settings.cache_clear()
+
+    assert get_settings() is not first
+
+
 @pytest.mark.asyncio
 async def test_neo4j_client_execute_query_success(mock_driver):
     """Verify that client executes queries successfully."""
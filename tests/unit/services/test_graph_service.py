@@ -5,13 +5,18 @@ Tests batch symbol creation, relationship management, incremental updates,
 and project versioning using mocked Neo4j client.
 """
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.core.error_handlers import Neo4jQueryError
-from app.core.graph.graph_service import SYMBOL_BATCH_SIZE, GraphService
-from app.models.context import SymbolChange, SymbolInfo
+from app.core.error_handlers import Neo4jQueryError, VersionConflictError
+from app.core.graph.graph_service import (
+    SYMBOL_BATCH_SIZE,
+    SYMBOL_COLUMNS,
+    GraphService,
+)
+from app.models.context import FileChange, SymbolChange, SymbolInfo
 
 
 @pytest.fixture
@@ -33,6 +38,21 @@ async def graph_service(mock_neo4j_client):
     return service
 
 
+class TestEnsureIndexes:
+    """Test one-time index creation."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_runs_ddl_once(self, graph_service, mock_neo4j_client):
+        """Test repeated calls only create indexes the first time."""
+        await graph_service.ensure_indexes()
+        ddl_calls = mock_neo4j_client.execute_query.await_count
+
+        await graph_service.ensure_indexes()
+
+        assert ddl_calls > 0
+        assert mock_neo4j_client.execute_query.await_count == ddl_calls
+
+
 class TestBatchCreateSymbols:
     """Test batch symbol creation with UNWIND."""
 
@@ -128,6 +148,54 @@ class TestBatchCreateSymbols:
         # Should create all symbols across multiple batches
         assert created == SYMBOL_BATCH_SIZE * 3  # 3 calls made
 
+    @pytest.mark.asyncio
+    async def test_batch_create_symbol_columns(self, graph_service, mock_neo4j_client):
+        """Test column batches are sliced per field in one session."""
+        num_symbols = SYMBOL_BATCH_SIZE + 20
+        columns = {
+            "names": [f"func{i}" for i in range(num_symbols)],
+            "kinds": ["function"] * num_symbols,
+            "signatures": [""] * num_symbols,
+            "file_paths": ["test.py"] * num_symbols,
+            "line_starts": list(range(num_symbols)),
+            "line_ends": list(range(1, num_symbols + 1)),
+            "qualified_names": [f"test.py::func{i}" for i in range(num_symbols)],
+        }
+
+        first = MagicMock()
+        first.single = AsyncMock(return_value={"created": SYMBOL_BATCH_SIZE})
+        second = MagicMock()
+        second.single = AsyncMock(return_value={"created": 20})
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.run = AsyncMock(side_effect=[first, second])
+
+        mock_neo4j_client.session.return_value = mock_session
+
+        created = await graph_service.batch_create_symbol_columns(
+            "test-project", columns
+        )
+
+        assert created == num_symbols
+        mock_neo4j_client.session.assert_called_once()
+        params = [call.args[1] for call in mock_session.run.await_args_list]
+        assert set(params[0]) == set(SYMBOL_COLUMNS) | {"project_id"}
+        assert len(params[0]["names"]) == SYMBOL_BATCH_SIZE
+        assert params[1]["qualified_names"] == columns["qualified_names"][-20:]
+
+    @pytest.mark.asyncio
+    async def test_batch_create_symbol_columns_empty(self, graph_service):
+        """Test empty columns skip the database."""
+        columns = {name: [] for name in SYMBOL_COLUMNS}
+
+        created = await graph_service.batch_create_symbol_columns(
+            "test-project", columns
+        )
+
+        assert created == 0
+
 
 class TestCreateCallRelationships:
     """Test batch relationship creation."""
@@ -199,6 +267,53 @@ class TestCreateCallRelationships:
         assert created == 1
         assert "Some relationships not created" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_create_call_relationship_columns_batches_by_calls(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test that callers are sliced so each query carries ~a batch of calls."""
+        mock_result = MagicMock()
+        mock_result.single = AsyncMock(return_value={"created": 2})
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.run = AsyncMock(return_value=mock_result)
+
+        mock_neo4j_client.session.return_value = mock_session
+
+        calls = {
+            "callers": ["a.py::f", "a.py::g", "b.py::h"],
+            "callees": [["g", "h"], ["h"], ["f"]],
+            "lines": [1, 5, 9],
+        }
+
+        with patch("app.core.graph.graph_service.RELATIONSHIP_BATCH_SIZE", 2):
+            created = await graph_service.create_call_relationship_columns(
+                "test-project", calls
+            )
+
+        assert created == 4
+        params = [call.args[1] for call in mock_session.run.await_args_list]
+        assert [p["callers"] for p in params] == [
+            ["a.py::f"],
+            ["a.py::g", "b.py::h"],
+        ]
+        assert params[1]["callees"] == [["h"], ["f"]]
+        assert params[1]["lines"] == [5, 9]
+
+    @pytest.mark.asyncio
+    async def test_create_call_relationship_columns_empty(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test that no query is sent when no symbol makes calls."""
+        created = await graph_service.create_call_relationship_columns(
+            "test-project", {"callers": [], "callees": [], "lines": []}
+        )
+
+        assert created == 0
+        mock_neo4j_client.session.assert_not_called()
+
 
 class TestUpdateFileSymbols:
     """Test incremental file symbol updates."""
@@ -393,6 +508,227 @@ class TestDeleteProject:
         assert "Connection lost" in str(exc_info.value.details["error"])
 
 
+class TestApplyFileChangesBatch:
+    """Test batched incremental updates across files."""
+
+    @pytest.mark.asyncio
+    async def test_apply_file_changes_batch(self, graph_service, mock_neo4j_client):
+        """Test that changes are grouped into one query per kind of change."""
+        changes = [
+            FileChange(file_path="old.py", action="deleted"),
+            FileChange(file_path="gone.py", action="deleted"),
+            FileChange(
+                file_path="a.py",
+                action="modified",
+                symbols_changed=[
+                    SymbolChange(
+                        action="added",
+                        symbol=SymbolInfo(
+                            name="new_func", kind="function", line_start=1, line_end=2
+                        ),
+                    ),
+                    SymbolChange(
+                        action="deleted",
+                        symbol=SymbolInfo(
+                            name="old_func", kind="function", line_start=3, line_end=4
+                        ),
+                    ),
+                ],
+            ),
+            FileChange(
+                file_path="b.py",
+                action="modified",
+                symbols_changed=[
+                    SymbolChange(
+                        action="modified",
+                        symbol=SymbolInfo(
+                            name="func", kind="function", line_start=5, line_end=9
+                        ),
+                    ),
+                ],
+            ),
+        ]
+
+        delete_result = MagicMock()
+        delete_result.single = AsyncMock(return_value={"deleted": 4})
+
+        mock_tx = MagicMock()
+        mock_tx.run = AsyncMock(return_value=delete_result)
+        mock_tx.commit = AsyncMock()
+        mock_tx.rollback = AsyncMock()
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
+
+        mock_neo4j_client.session.return_value = mock_session
+
+        total = await graph_service.apply_file_changes_batch("test-project", changes)
+
+        assert total == 4 + 3
+        assert mock_tx.run.await_count == 4
+        params = [call.args[1] for call in mock_tx.run.await_args_list]
+        assert params[0]["file_paths"] == ["old.py", "gone.py"]
+        assert params[1]["symbols"] == [{"file_path": "a.py", "name": "old_func"}]
+        assert params[2]["symbols"][0]["qualified_name"] == "a.py::new_func"
+        assert params[3]["symbols"][0]["line_end"] == 9
+        mock_tx.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_apply_file_changes_batch_rolls_back_on_error(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test that a failed query rolls back the whole batch."""
+        mock_tx = MagicMock()
+        mock_tx.run = AsyncMock(side_effect=Exception("write failed"))
+        mock_tx.commit = AsyncMock()
+        mock_tx.rollback = AsyncMock()
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
+
+        mock_neo4j_client.session.return_value = mock_session
+
+        with pytest.raises(Exception, match="write failed"):
+            await graph_service.apply_file_changes_batch(
+                "test-project", [FileChange(file_path="old.py", action="deleted")]
+            )
+
+        mock_tx.rollback.assert_called_once()
+        mock_tx.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_apply_incremental_update_bumps_version_in_transaction(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test that the version bump and changes share one transaction."""
+        version_result = MagicMock()
+        updated_at = datetime(2025, 1, 2, tzinfo=UTC)
+        version_result.single = AsyncMock(
+            return_value={
+                "previous_version": 2,
+                "version": 3,
+                "updated_at": updated_at,
+                "deleted": 2,
+            }
+        )
+
+        mock_tx = MagicMock()
+        mock_tx.run = AsyncMock(return_value=version_result)
+        mock_tx.commit = AsyncMock()
+        mock_tx.rollback = AsyncMock()
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
+
+        mock_neo4j_client.session.return_value = mock_session
+
+        total, version, timestamp = await graph_service.apply_incremental_update(
+            "test-project", 2, [FileChange(file_path="old.py", action="deleted")]
+        )
+
+        assert (total, version, timestamp) == (2, 3, updated_at)
+        assert "MERGE (p:Project" in mock_tx.run.await_args_list[0].args[0]
+        mock_tx.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_apply_incremental_update_conflict_rolls_back(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test that an overtaken version rolls back before applying changes."""
+        version_result = MagicMock()
+        version_result.single = AsyncMock(
+            return_value={"previous_version": 3, "version": 4}
+        )
+
+        mock_tx = MagicMock()
+        mock_tx.run = AsyncMock(return_value=version_result)
+        mock_tx.commit = AsyncMock()
+        mock_tx.rollback = AsyncMock()
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
+
+        mock_neo4j_client.session.return_value = mock_session
+
+        with pytest.raises(VersionConflictError):
+            await graph_service.apply_incremental_update(
+                "test-project", 2, [FileChange(file_path="old.py", action="deleted")]
+            )
+
+        assert mock_tx.run.await_count == 1
+        mock_tx.rollback.assert_called_once()
+        mock_tx.commit.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "previous_version, expected_version, conflict",
+        [
+            # No Project node (created by MERGE) or a null version both read
+            # as version 0
+            (0, 0, False),
+            (0, 1, True),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_apply_incremental_update_without_stored_version(
+        self,
+        graph_service,
+        mock_neo4j_client,
+        previous_version,
+        expected_version,
+        conflict,
+    ):
+        """Test projects without a stored version are treated as version 0."""
+        updated_at = datetime(2025, 1, 2, tzinfo=UTC)
+        version_result = MagicMock()
+        version_result.single = AsyncMock(
+            return_value={
+                "previous_version": previous_version,
+                "version": previous_version + 1,
+                "updated_at": updated_at,
+                "deleted": 0,
+            }
+        )
+
+        mock_tx = MagicMock()
+        mock_tx.run = AsyncMock(return_value=version_result)
+        mock_tx.commit = AsyncMock()
+        mock_tx.rollback = AsyncMock()
+
+        mock_session = MagicMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
+
+        mock_neo4j_client.session.return_value = mock_session
+        changes = [FileChange(file_path="old.py", action="deleted")]
+
+        if conflict:
+            with pytest.raises(VersionConflictError) as exc_info:
+                await graph_service.apply_incremental_update(
+                    "test-project", expected_version, changes
+                )
+            assert exc_info.value.details["expected"] == 0
+            mock_tx.rollback.assert_called_once()
+        else:
+            _, version, _ = await graph_service.apply_incremental_update(
+                "test-project", expected_version, changes
+            )
+            assert version == 1
+            mock_tx.commit.assert_called_once()
+
+        query = mock_tx.run.await_args_list[0].args[0]
+        assert "ON CREATE SET p.version = 0" in query
+        assert "coalesce(p.version, 0)" in query
+
+
 class TestProjectStatistics:
     """Test project statistics queries."""
 
@@ -472,6 +808,89 @@ class TestProjectVersioning:
 
         assert version == 0
 
+    @pytest.mark.asyncio
+    async def test_get_project_version_and_stats(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test existence, version and statistics come from one query."""
+        mock_neo4j_client.execute_query.return_value = [
+            {
+                "total_files": 10,
+                "total_symbols": 50,
+                "total_relationships": 75,
+                "version": 4,
+                "last_updated_at": datetime(2025, 1, 2, tzinfo=UTC),
+                "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+            }
+        ]
+
+        exists, version, stats = await graph_service.get_project_version_and_stats(
+            "test-project"
+        )
+
+        assert exists is True
+        assert version == 4
+        assert stats == {
+            "total_files": 10,
+            "total_symbols": 50,
+            "total_relationships": 75,
+            "last_updated_at": datetime(2025, 1, 2, tzinfo=UTC),
+            "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+        }
+        mock_neo4j_client.execute_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_project_revision(self, graph_service, mock_neo4j_client):
+        """Test existence, version and creation time come from one light query."""
+        mock_neo4j_client.execute_query.return_value = [
+            {
+                "exists": True,
+                "version": 4,
+                "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+            }
+        ]
+
+        revision = await graph_service.get_project_revision("test-project")
+
+        assert revision == (True, 4, datetime(2025, 1, 1, tzinfo=UTC))
+        query = mock_neo4j_client.execute_query.await_args.args[0]
+        assert "CALLS" not in query
+
+    @pytest.mark.asyncio
+    async def test_get_project_revision_not_found(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test a missing project has version 0 and no creation time."""
+        mock_neo4j_client.execute_query.return_value = [
+            {"exists": False, "version": None, "created_at": None}
+        ]
+
+        revision = await graph_service.get_project_revision("nonexistent")
+
+        assert revision == (False, 0, None)
+
+    @pytest.mark.asyncio
+    async def test_get_project_version_and_stats_not_found(
+        self, graph_service, mock_neo4j_client
+    ):
+        """Test a project without symbols is reported as missing with version 0."""
+        mock_neo4j_client.execute_query.return_value = [
+            {
+                "total_files": 0,
+                "total_symbols": 0,
+                "total_relationships": 0,
+                "version": None,
+            }
+        ]
+
+        exists, version, stats = await graph_service.get_project_version_and_stats(
+            "nonexistent"
+        )
+
+        assert exists is False
+        assert version == 0
+        assert stats["total_symbols"] == 0
+
     @pytest.mark.asyncio
     async def test_increment_project_version_new(
         self, graph_service, mock_neo4j_client
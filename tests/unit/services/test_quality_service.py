@@ -1,8 +1,8 @@
-"""Unit tests for QualityAnalysisService severity breakdown calculation."""
+"""Unit tests for QualityAnalysisService issue conversion and severity breakdown."""
 
 import pytest
 
-from app.api.v1.schemas import QualityIssue
+from app.api.v1.schemas import Issue, IssueSuggestion, QualityIssue
 from app.core.services.quality_service import QualityAnalysisService
 
 
@@ -254,3 +254,43 @@ class TestSeverityBreakdownCalculation:
         assert breakdown["warning"] == 5
         assert breakdown["info"] == 2
         assert sum(breakdown.values()) == len(issues)  # Total matches issue count
+
+
+class TestConvertIssues:
+    """Test suite for _convert_issues method."""
+
+    def test_convert_issues_maps_fields_and_suggestion(self):
+        """Test that analyzer issues map onto valid QualityIssue models."""
+        service = QualityAnalysisService()
+        issue = Issue(
+            file="test_math.py",
+            line=4,
+            column=2,
+            severity="warning",
+            type="redundant-assertion",
+            message="Duplicate assertion",
+            detected_by="rule_engine",
+            suggestion=IssueSuggestion(
+                action="remove", old_code="assert x", explanation="Remove it"
+            ),
+        )
+
+        [converted] = service._convert_issues([issue])
+
+        expected = QualityIssue.model_validate(
+            {
+                "file_path": "test_math.py",
+                "line": 4,
+                "column": 2,
+                "severity": "warning",
+                "code": "redundant-assertion",
+                "message": "Duplicate assertion",
+                "detected_by": "rule",
+                "suggestion": {
+                    "type": "delete",
+                    "new_text": None,
+                    "description": "Remove it",
+                },
+            }
+        )
+        assert converted.model_dump() == expected.model_dump()
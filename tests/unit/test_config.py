@@ -0,0 +1,28 @@
+"""Unit tests for application settings."""
+
+import re
+
+from app.config import Settings
+
+
+class TestCorsOrigins:
+    """Test the precomputed CORS origin structures."""
+
+    def test_default_allows_all_origins(self):
+        """Test that the default configuration keeps the "*" origin."""
+        settings = Settings(cors_origins=["*"])
+
+        assert settings.cors_origin_set == frozenset({"*"})
+        assert settings.cors_origin_regex is None
+
+    def test_exact_and_wildcard_origins_are_split(self):
+        """Test that wildcard origins go to the regex and the rest to the set."""
+        settings = Settings(
+            cors_origins=["https://app.example.com", "https://*.preview.dev"]
+        )
+
+        assert settings.cors_origin_set == frozenset({"https://app.example.com"})
+        pattern = re.compile(settings.cors_origin_regex)
+        assert pattern.fullmatch("https://pr-12.preview.dev")
+        assert not pattern.fullmatch("https://preview.dev")
+        assert not pattern.fullmatch("https://evil.io/.preview.dev")
@@ -7,10 +7,12 @@ These tests focus on the request/response shapes for:
 The goal is to keep them aligned with docs/api/openapi.yaml.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 import app.api.v1.routes as routes_module
@@ -40,10 +42,12 @@ class TestGenerateTestsWorkflow:
             assert isinstance(payload["source_code"], str)
             # Optional fields should not be required
             assert "existing_test_code" in payload
+            # Handler-only debug switches are not persisted with the task
+            assert "debug_options" not in payload
             return "123e4567-e89b-12d3-a456-426614174000"
 
         async def fake_execute_generate_tests_task(  # type: ignore[override]
-            task_id: str, payload: Dict[str, Any]
+            task_id: str, payload: Dict[str, Any], llm_client: Any = None
         ) -> None:
             # No-op in unit test – background execution is tested elsewhere
             return None
@@ -108,16 +112,13 @@ class TestGenerateTestsWorkflow:
 
         task_id_created = "test-task-123"
 
-        async def fake_create_task(payload: Dict[str, Any]) -> str:  # type: ignore[override]
-            return task_id_created
-
-        async def fake_update_task_status(  # type: ignore[override]
-            task_id: str, status: Any, error: str | None = None
-        ) -> None:
-            # Verify the task is being marked as failed with the correct error
-            assert task_id == task_id_created
+        async def fake_create_task(  # type: ignore[override]
+            payload: Dict[str, Any], status: Any = None, error: str | None = None
+        ) -> str:
+            # The task is stored as failed up front, with no follow-up update
             assert str(status) == "TaskStatus.FAILED"
             assert error == "Test error simulation"
+            return task_id_created
 
         async def fake_get_task(task_id: str) -> dict:  # type: ignore[override]
             return {
@@ -132,9 +133,6 @@ class TestGenerateTestsWorkflow:
             }
 
         monkeypatch.setattr(routes_module, "create_task", fake_create_task)
-        monkeypatch.setattr(
-            routes_module, "update_task_status", fake_update_task_status
-        )
         monkeypatch.setattr(routes_module, "get_task", fake_get_task)
 
         # Submit task with simulate_error=True
@@ -167,6 +165,61 @@ class TestGenerateTestsWorkflow:
         assert "result" not in status_data
 
 
+class TestBackgroundTaskPool:
+    """Tests for the bounded pool running submitted tasks."""
+
+    @pytest.mark.asyncio
+    async def test_launch_background_task_bounds_concurrency(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """No more than the configured number of tasks run at once."""
+        monkeypatch.setattr(
+            app.state, "background_semaphore", asyncio.Semaphore(2), raising=False
+        )
+        running = 0
+        peak = 0
+
+        async def fake_task() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for i in range(5):
+            routes_module.launch_background_task(app, f"task-{i}", fake_task())
+        assert len(routes_module._background_tasks) == 5
+
+        await asyncio.gather(*routes_module._background_tasks)
+
+        assert peak == 2
+        assert not routes_module._background_tasks
+
+    def test_background_semaphore_is_kept_on_app_state(self) -> None:
+        """Apps started without the lifespan get one semaphore on first use."""
+        bare_app = FastAPI()
+
+        semaphore = routes_module.get_background_semaphore(bare_app)
+
+        assert bare_app.state.background_semaphore is semaphore
+        assert routes_module.get_background_semaphore(bare_app) is semaphore
+
+    @pytest.mark.asyncio
+    async def test_launch_background_task_logs_crashes(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Exceptions escaping a task are logged instead of lost."""
+
+        async def crashing_task() -> None:
+            raise RuntimeError("task store unavailable")
+
+        routes_module.launch_background_task(app, "task-crash", crashing_task())
+        await asyncio.gather(*routes_module._background_tasks)
+
+        assert "Background task crashed: task_id=task-crash" in caplog.text
+        assert "task store unavailable" in caplog.text
+
+
 class TestTaskStatusEndpoint:
     """Tests for /tasks/{task_id} endpoint."""
 
@@ -13,6 +13,11 @@ import pytest
 from fastapi.testclient import TestClient
 
 import app.api.v1.routes as routes_module
+from app.api.v1.schemas import (
+    CoverageOptimizationResult,
+    GenerateTestsResult,
+    TaskStatusResponse,
+)
 from app.main import app
 
 
@@ -43,7 +48,7 @@ class TestCoverageOptimizationWorkflow:
             return "123e4567-e89b-12d3-a456-426614174000"
 
         async def fake_execute_coverage_optimization_task(  # type: ignore[override]
-            task_id: str, payload: Dict[str, Any]
+            task_id: str, payload: Dict[str, Any], llm_client: Any = None
         ) -> None:
             # No-op in unit test – background execution is tested elsewhere
             return None
@@ -126,16 +131,13 @@ class TestCoverageOptimizationWorkflow:
 
         task_id_created = "test-task-456"
 
-        async def fake_create_task(payload: Dict[str, Any]) -> str:  # type: ignore[override]
-            return task_id_created
-
-        async def fake_update_task_status(  # type: ignore[override]
-            task_id: str, status: Any, error: str | None = None
-        ) -> None:
-            # Verify the task is being marked as failed with the correct error
-            assert task_id == task_id_created
+        async def fake_create_task(  # type: ignore[override]
+            payload: Dict[str, Any], status: Any = None, error: str | None = None
+        ) -> str:
+            # The task is stored as failed up front, with no follow-up update
             assert str(status) == "TaskStatus.FAILED"
             assert error == "Coverage optimization test failure"
+            return task_id_created
 
         async def fake_get_task(task_id: str) -> dict:  # type: ignore[override]
             return {
@@ -150,9 +152,6 @@ class TestCoverageOptimizationWorkflow:
             }
 
         monkeypatch.setattr(routes_module, "create_task", fake_create_task)
-        monkeypatch.setattr(
-            routes_module, "update_task_status", fake_update_task_status
-        )
         monkeypatch.setattr(routes_module, "get_task", fake_get_task)
 
         # Submit task with simulate_error=True
@@ -334,3 +333,21 @@ class TestCoverageOptimizationTaskStatus:
         assert (
             "error" not in data
         ), "error field should be excluded for processing status"
+
+    def test_task_result_union_dispatches_on_result_shape(self) -> None:
+        """The result union picks its member from the payload keys."""
+        coverage = TaskStatusResponse(
+            task_id="t-1",
+            status="completed",
+            result={"recommended_tests": []},
+        )
+        generated = TaskStatusResponse(
+            task_id="t-2",
+            status="completed",
+            result={"generated_code": "def test_x(): pass", "explanation": "x"},
+        )
+
+        assert isinstance(coverage.result, CoverageOptimizationResult)
+        assert isinstance(generated.result, GenerateTestsResult)
+        # The tag is not part of the wire format
+        assert coverage.model_dump()["result"] == {"recommended_tests": []}
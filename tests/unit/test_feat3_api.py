@@ -500,3 +500,44 @@ def test_analyze_impact_informational_only_no_action():
 
     # Verify low impact score
     assert response_data["impacted_tests"][0]["impact_score"] == 0.1
+
+
+@pytest.mark.asyncio
+async def test_impact_analyzer_context_reuses_shared_graph_service():
+    """Test that a shared GraphService is connected if needed but never closed."""
+    from app.api.v1.routes import get_impact_analyzer_context
+
+    graph_service = MagicMock()
+    graph_service.connect = AsyncMock()
+    graph_service.close = AsyncMock()
+
+    async with get_impact_analyzer_context(
+        project_id="test-project",
+        rule_engine=MagicMock(),
+        llm_client=AsyncMock(),
+        graph_service=graph_service,
+    ) as analyzer:
+        assert analyzer.graph_service is graph_service
+
+    graph_service.connect.assert_awaited_once()
+    graph_service.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_analyze_impact_async_accepts_file_change_entries():
+    """Test that request FileChangeEntry models are used without conversion."""
+    from app.api.v1.schemas import FileChangeEntry
+    from app.core.analyzer import ImpactAnalyzer
+
+    analyzer = ImpactAnalyzer(MagicMock(), MagicMock(), graph_service=MagicMock())
+    analyzer._calculate_impact_graph_based = AsyncMock(return_value=[])
+
+    result = await analyzer.analyze_impact_async(
+        [FileChangeEntry(path="src/module.py", change_type="modified")],
+        ["tests/test_module.py"],
+    )
+
+    analyzer._calculate_impact_graph_based.assert_awaited_once_with(
+        ["src/module.py"], ["tests/test_module.py"], None
+    )
+    assert result.impacted_tests == []
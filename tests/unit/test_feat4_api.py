@@ -128,14 +128,12 @@ class TestQualityAnalysisAPI:
 
         response = client.post("/quality/analyze", json=request_payload)
 
-        # Should return 400 for validation error
-        assert response.status_code == 400
+        # Rejected by schema validation before reaching the handler
+        assert response.status_code == 422
         response_data = response.json()
         assert "detail" in response_data
-        assert (
-            "files" in response_data["detail"].lower()
-            or "empty" in response_data["detail"].lower()
-        )
+        assert response_data["detail"][0]["loc"] == ["body", "files"]
+        assert response_data["detail"][0]["type"] == "too_short"
 
     def test_quality_analyze_missing_files(self):
         """Test quality analysis fails when files field is missing."""
@@ -151,6 +149,32 @@ class TestQualityAnalysisAPI:
         # Should return 422 for validation error (missing required field)
         assert response.status_code == 422
 
+    def test_quality_analyze_malformed_json(self):
+        """Test quality analysis rejects a body that is not valid JSON."""
+        client = TestClient(app)
+
+        response = client.post(
+            "/quality/analyze",
+            content=b'{"files": [',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+        assert response.json()["detail"][0]["loc"] == ["body"]
+
+    def test_quality_analyze_request_body_in_openapi(self):
+        """Test the raw-body endpoint still documents its request schema."""
+        client = TestClient(app)
+
+        operation = client.get("/openapi.json").json()["paths"]["/quality/analyze"]
+        schema = operation["post"]["requestBody"]["content"]["application/json"][
+            "schema"
+        ]
+
+        assert schema["required"] == ["files"]
+        assert schema["properties"]["files"]["items"]["title"] == "FileInput"
+
     def test_quality_analyze_invalid_mode(self):
         """Test quality analysis fails with invalid mode."""
         client = TestClient(app)
@@ -439,11 +463,12 @@ class TestQualityAnalysisAPI:
 
         response = client.post("/quality/analyze", json=request_payload)
 
-        # Should return 400 for too many files
-        assert response.status_code == 400
+        # Rejected by schema validation before reaching the handler
+        assert response.status_code == 422
         response_data = response.json()
         assert "detail" in response_data
-        assert "too many" in response_data["detail"].lower()
+        assert response_data["detail"][0]["loc"] == ["body", "files"]
+        assert response_data["detail"][0]["type"] == "too_long"
 
     def test_quality_analyze_empty_content(self):
         """Test quality analysis fails when file content is empty string."""
@@ -529,3 +554,42 @@ class TestQualityAnalysisAPI:
             f"Summary should only contain {expected_summary_fields}, "
             f"but got {actual_summary_fields}"
         )
+
+
+class TestQualityServiceContext:
+    """Test resource handling of get_quality_service_context."""
+
+    @pytest.mark.asyncio
+    async def test_shared_resources_are_reused_and_left_open(self):
+        """Test that shared RuleEngine and LLM client are used and not closed."""
+        from app.api.v1.routes import get_quality_service_context
+
+        rule_engine = object()
+        llm_client = AsyncMock()
+
+        async with get_quality_service_context(
+            rule_engine=rule_engine, llm_client=llm_client
+        ) as service:
+            assert service.test_analyzer.rule_engine is rule_engine
+            assert service.test_analyzer.llm_analyzer.client is llm_client
+
+        llm_client.close.assert_not_called()
+
+
+def test_quality_issue_file_paths_are_interned():
+    """Test that equal file paths built separately share one string object."""
+    issues = [
+        QualityIssue.model_validate(
+            {
+                "file_path": "/".join(["tests", "test_a.py"]),
+                "line": line,
+                "severity": "info",
+                "code": "c",
+                "message": "m",
+                "detected_by": "rule",
+            }
+        )
+        for line in (1, 2)
+    ]
+
+    assert issues[0].file_path is issues[1].file_path
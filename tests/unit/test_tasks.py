@@ -3,12 +3,17 @@
 Tests verify task creation, status updates, and error handling.
 """
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
+from app.core.tasks import tasks as tasks_module
 from app.core.tasks.tasks import (
     TaskStatus,
     create_task,
     get_task,
+    get_task_payload,
     update_task_status,
 )
 
@@ -78,3 +83,171 @@ async def test_update_task_status_with_exception_object():
     assert task["error"]["message"] == "Simulating a backend error"
     assert task["error"]["code"] is None
     assert task["error"]["details"] is None
+
+
+@pytest.mark.asyncio
+async def test_create_task_with_initial_failed_status():
+    """Verify a task can be stored as failed without a separate update."""
+    task_id = await create_task(
+        {"test": "data"}, status=TaskStatus.FAILED, error="Simulated failure"
+    )
+
+    task = await get_task(task_id)
+
+    assert task["status"] == TaskStatus.FAILED.value
+    assert task["error"] == {
+        "message": "Simulated failure",
+        "code": None,
+        "details": None,
+    }
+    assert task["result"] is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_task_calls_share_one_read():
+    """Verify lookups arriving during a read are served by a single MGET."""
+    first = await create_task({"n": 1})
+    second = await create_task({"n": 2})
+
+    real_read = tasks_module._get_raw_tasks
+
+    async def network_read(task_ids):
+        # Yield like a Redis round-trip so later lookups overlap the read
+        await asyncio.sleep(0)
+        return await real_read(task_ids)
+
+    with patch.object(
+        tasks_module, "_get_raw_tasks", side_effect=network_read
+    ) as mock_read:
+        results = await asyncio.gather(
+            get_task(first), get_task(second), get_task(first), get_task("missing")
+        )
+
+    # The first lookup reads at once; the others wait for one shared read
+    assert mock_read.await_count == 2
+    assert mock_read.await_args_list[0].args[0] == [first]
+    assert sorted(mock_read.await_args_list[1].args[0]) == sorted(
+        [second, first, "missing"]
+    )
+    assert results[0]["payload"] == {"n": 1}
+    assert results[1]["payload"] == {"n": 2}
+    assert results[2] == results[0]
+    # Callers sharing a lookup get independent copies they may mutate
+    assert results[2] is not results[0]
+    assert results[3] is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_get_task_does_not_cancel_other_lookups():
+    """Verify cancelling one caller leaves concurrent lookups unaffected."""
+    task_id = await create_task({"n": 1})
+    read_started = asyncio.Event()
+    release_read = asyncio.Event()
+    real_read = tasks_module._get_raw_tasks
+
+    async def slow_read(task_ids):
+        read_started.set()
+        await release_read.wait()
+        return await real_read(task_ids)
+
+    with patch.object(tasks_module, "_get_raw_tasks", side_effect=slow_read):
+        leader = asyncio.create_task(get_task(task_id))
+        await read_started.wait()
+        read_started.clear()
+        follower = asyncio.create_task(get_task(task_id))
+        other_follower = asyncio.create_task(get_task(task_id))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        follower.cancel()
+        release_read.set()
+        task = await other_follower
+
+    assert task["payload"] == {"n": 1}
+    assert leader.cancelled()
+    assert follower.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_generate_tests_reuses_shared_llm_client():
+    """Verify a shared LLM client is used and left open after the task."""
+    llm_client = MagicMock()
+    llm_client.chat_completion = AsyncMock(
+        return_value="```python\ndef test_add():\n    assert True\n```"
+    )
+    llm_client.close = AsyncMock()
+
+    with patch.object(tasks_module, "create_llm_client") as mock_create:
+        result = await tasks_module._generate_tests_from_llm(
+            {"source_code": "def add(a, b): return a + b"}, llm_client
+        )
+
+    mock_create.assert_not_called()
+    llm_client.chat_completion.assert_awaited_once()
+    llm_client.close.assert_not_called()
+    assert "def test_add" in result["generated_code"]
+
+
+@pytest.mark.asyncio
+async def test_large_payload_is_stored_outside_the_task_record():
+    """Verify status reads and updates do not carry a large payload."""
+    source_code = "x = 1\n" * (tasks_module.SPILL_PAYLOAD_CHARS // 6 + 1)
+    task_id = await create_task({"source_code": source_code, "mode": "new"})
+
+    await update_task_status(task_id, TaskStatus.PROCESSING)
+    task = await get_task(task_id)
+
+    assert task["status"] == TaskStatus.PROCESSING.value
+    assert task["payload"] is None
+    assert await get_task_payload(task) == {
+        "source_code": source_code,
+        "mode": "new",
+    }
+
+
+@pytest.mark.asyncio
+async def test_small_payload_stays_inline():
+    """Verify small payloads remain part of the task record."""
+    task_id = await create_task({"type": "initialize_project", "files": 2})
+
+    task = await get_task(task_id)
+
+    assert task["payload"] == {"type": "initialize_project", "files": 2}
+    assert await get_task_payload(task) == task["payload"]
+
+
+def test_parse_coverage_response_validates_json_block():
+    """Verify a well-formed JSON block is returned as a validated result."""
+    raw = (
+        "Here you go:\n```json\n"
+        '{"recommended_tests": [{"test_code": "def test_zero(): pass", '
+        '"target_line": 3, "scenario_description": "zero", '
+        '"expected_coverage_impact": "line 3"}]}'
+        "\n```"
+    )
+
+    result = tasks_module._parse_coverage_optimization_response(raw)
+
+    assert result == {
+        "recommended_tests": [
+            {
+                "test_code": "def test_zero(): pass",
+                "target_line": 3,
+                "scenario_description": "zero",
+                "expected_coverage_impact": "line 3",
+            }
+        ]
+    }
+
+
+def test_parse_coverage_response_rejects_malformed_recommendations():
+    """Verify JSON with invalid recommendations falls back to code extraction."""
+    raw = (
+        '{"recommended_tests": [{"test_code": "x"}]}\n'
+        "```python\ndef test_fallback():\n    assert True\n```"
+    )
+
+    result = tasks_module._parse_coverage_optimization_response(raw)
+
+    assert len(result["recommended_tests"]) == 1
+    assert "def test_fallback" in result["recommended_tests"][0]["test_code"]